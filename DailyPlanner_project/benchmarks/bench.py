@@ -0,0 +1,232 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.itemCard import itemCard  # noqa: E402
+from src.taskTable import TaskTable  # noqa: E402
+from src.tracker import Tracker  # noqa: E402
+from src.supportBox import save_tasks_to_file, load_tasks_from_file  # noqa: E402
+
+# Data odniesienia (dzisiejsza północ) – terminy są losowane wokół niej, więc niezależnie
+# od dnia uruchomienia mniej więcej połowa zadań z terminem jest przeterminowana.
+BASE_DATE = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+WORDS = ["Zakupy", "Raport", "Spotkanie", "Trening", "Mail", "Projekt", "Nauka", "Sprzątanie",
+         "Zadzwonić", "Prezentacja", "Łączność", "Ćwiczenia", "Żagle", "Notatki", "Faktura"]
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000, "10M": 10_000_000}
+
+
+# Generuje powtarzalne rekordy zadań (tytuł, opis, termin, czy wykonane).
+# Ok. 70% zadań ma termin w przedziale ±30 dni od BASE_DATE, ok. 30% jest wykonanych.
+def generate_records(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        title = f"{rng.choice(WORDS)} {i}"
+        description = " ".join(rng.choice(WORDS).lower() for _ in range(rng.randint(0, 6)))
+        due = BASE_DATE + timedelta(minutes=rng.randint(-43_200, 43_200)) if rng.random() < 0.7 else None
+        records.append((title, description, due, rng.random() < 0.3))
+    return records
+
+
+# Tworzy zadania z rekordów pojedynczo (jak zwykły kod aplikacji).
+def build_tasks(records):
+    tasks = []
+    for title, description, due, completed in records:
+        task = itemCard(title, description, due)
+        if completed:
+            task.mark_completed()
+        tasks.append(task)
+    return tasks
+
+
+# Te same rekordy w kolumnowym TaskTable (bez obiektów itemCard).
+def build_table(records):
+    table = TaskTable()
+    for title, description, due, completed in records:
+        table.append(title, description, due, completed)
+    return table
+
+
+def build_tracker(tasks):
+    tracker = Tracker()
+    tracker.add_tasks(tasks)
+    return tracker
+
+
+# Zwraca listę przypadków: (nazwa, przygotowanie, mierzona funkcja, liczba operacji).
+# Przygotowanie nie jest mierzone; jego wynik trafia jako argument do funkcji.
+def cases(records, workdir):
+    n = len(records)
+    removal_order = list(range(n))
+    random.Random(1).shuffle(removal_order)
+
+    def tasks_only():
+        return build_tasks(records)
+
+    def tracker_only():
+        return build_tracker(build_tasks(records))
+
+    def add_one_by_one(tasks):
+        tracker = Tracker()
+        for task in tasks:
+            tracker.add_task(task)
+
+    def remove_all(tracker):
+        tasks = tracker.tasks
+        for i in removal_order:
+            tracker.remove_task(tasks[i])
+
+    def render(tasks):
+        for task in tasks:
+            str(task)
+
+    result = [
+        ("itemCard.__init__", lambda: None, lambda _: build_tasks(records), n),
+        ("TaskTable.append", lambda: None, lambda _: build_table(records), n),
+        ("itemCard.from_records", lambda: None,
+         lambda _: itemCard.from_records([r[:3] for r in records]), n),
+        ("Tracker.add_task", tasks_only, add_one_by_one, n),
+        ("Tracker.add_tasks", tasks_only, build_tracker, n),
+        ("Tracker.remove_task", tracker_only, remove_all, n),
+        ("Tracker.get_completed_tasks", tracker_only, lambda t: t.get_completed_tasks(), 1),
+        ("Tracker.get_uncompleted_tasks", tracker_only, lambda t: t.get_uncompleted_tasks(), 1),
+        ("Tracker.get_overdue_tasks", tracker_only, lambda t: t.get_overdue_tasks(), 1),
+        ("itemCard.__str__", tasks_only, render, n),
+    ]
+    for ext in (".json", ".jsonl", ".dps", ".dpz"):
+        path = os.path.join(workdir, "bench" + ext)
+        result.append((f"save {ext}", tasks_only, lambda tasks, p=path: save_tasks_to_file(tasks, p), n))
+        result.append((f"load {ext}", lambda p=path: save_tasks_to_file(build_tasks(records), p),
+                       lambda _, p=path: load_tasks_from_file(p), n))
+        if ext != ".dps":
+            result.append((f"load {ext} lazy", lambda p=path: save_tasks_to_file(build_tasks(records), p),
+                           lambda _, p=path: load_tasks_from_file(p, lazy=True), n))
+    return result
+
+
+# Mierzy jeden przypadek: najlepszy czas z `repeat` powtórzeń, szczytowe zużycie pamięci oraz
+# pamięć zajmowaną przez wynik funkcji, gdy ten jest nadal trzymany (dla przypadków budujących
+# zadania, np. itemCard.__init__ albo TaskTable.append, to koszt przechowywania zadań).
+def measure(setup, func, repeat: int, memory: bool):
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        func(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del state
+    peak = retained = None
+    if memory:
+        state = setup()
+        gc.collect()
+        tracemalloc.start()
+        kept = func(state)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+    return best, peak, retained
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales, repeat=3, memory=True, only=None, seed=0):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in scales:
+            records = generate_records(SCALES[scale], seed)
+            for name, setup, func, ops in cases(records, workdir):
+                if only and not any(part in name for part in only):
+                    continue
+                seconds, peak, retained = measure(setup, func, repeat, memory)
+                results.append({
+                    "case": name,
+                    "scale": scale,
+                    "n": len(records),
+                    "seconds": seconds,
+                    "ops_per_second": ops / seconds if seconds else None,
+                    "peak_bytes": peak,
+                    "retained_bytes": retained,
+                    "retained_bytes_per_op": retained / ops if retained is not None else None,
+                })
+                print(f"{scale:>5} {name:<30} {seconds * 1000:10.2f} ms"
+                      + (f" {peak / 2 ** 20:9.1f} MiB {retained / ops:10.0f} B/op"
+                         if peak is not None else ""), file=sys.stderr)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+# Porównuje dwa wyniki: stosunek czasu (nowy / bazowy) dla wspólnych przypadków.
+def compare(baseline: dict, current: dict):
+    old = {(r["case"], r["scale"]): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        base = old.get((r["case"], r["scale"]))
+        if base and base["seconds"]:
+            rows.append((r["scale"], r["case"], r["seconds"] / base["seconds"]))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for itemCard, Tracker and supportBox.")
+    parser.add_argument("--scales", default="1k,100k",
+                        help=f"comma-separated scales from {', '.join(SCALES)} (default: 1k,100k)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions, best is reported")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--only", help="comma-separated substrings of case names to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    scales = [s.strip() for s in args.scales.split(",") if s.strip()]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+    only = [s.strip() for s in args.only.split(",")] if args.only else None
+
+    report = run(scales, args.repeat, not args.no_memory, only, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            for scale, case, ratio in compare(json.load(f), report):
+                print(f"{scale:>5} {case:<30} x{ratio:.2f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import asyncio
+import os
+from typing import Optional
+from src.journal import _temp_name
+from src.supportBox import save_tasks_to_file
+from src.tracker import Tracker
+
+
+# Zapisuje zadania do pliku tymczasowego i podmienia plik docelowy – przerwany zapis
+# nie niszczy poprzedniej wersji.
+def _save_atomic(tasks, filename: str):
+    temp = _temp_name(filename)
+    save_tasks_to_file(tasks, temp)
+    os.replace(temp, filename)
+
+
+class AutoSaver:
+    # Automatyczny zapis trackera (słuchacz zmian) dla aplikacji asyncio.
+    # Pierwsza zmiana uruchamia odliczanie `interval` sekund; wszystkie zmiany z tego czasu
+    # trafiają do jednego zapisu. Zapis działa w wątku i zawsze jest co najwyżej jeden w toku –
+    # zmiany w trakcie zapisu powodują kolejny zapis po następnym odliczeniu.
+    def __init__(self, tracker: Tracker, filename: str, interval: float = 1.0):
+        self.tracker = tracker
+        self.filename = filename
+        self.interval = interval
+        self.saves = 0
+        self._loop = asyncio.get_running_loop()
+        self._dirty = False
+        self._urgent = False
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        tracker.add_listener(self)
+
+    # --- zdarzenia trackera ---
+
+    def task_added(self, key, task):
+        self._schedule()
+
+    def task_removed(self, key, task):
+        self._schedule()
+
+    def task_changed(self, key, task, field, old, new):
+        self._schedule()
+
+    def tasks_cleared(self):
+        self._schedule()
+
+    # --- zapis ---
+
+    def _schedule(self):
+        self._dirty = True
+        if self._task is None:
+            self._wake.clear()
+            self._task = self._loop.create_task(self._run())
+
+    async def _run(self):
+        try:
+            while self._dirty:
+                if not self._urgent:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), self.interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wake.clear()
+                self._dirty = False
+                try:
+                    await asyncio.to_thread(_save_atomic, self.tracker.tasks, self.filename)
+                except BaseException:
+                    self._dirty = True  # stan nie został zapisany
+                    raise
+                self.saves += 1
+        finally:
+            self._task = None
+            self._urgent = False
+
+    # Zapisuje zaległe zmiany od razu (bez czekania na koniec odliczania) i czeka, aż wszystkie
+    # trafią na dysk – także te wprowadzone w trakcie trwającego zapisu.
+    # Błąd zapisu jest tu zgłaszany; kolejna zmiana albo flush() ponawia zapis.
+    async def flush(self):
+        if self._task is None and self._dirty:
+            self._schedule()
+        if self._task is not None:
+            self._urgent = True
+            self._wake.set()
+            await asyncio.shield(self._task)
+
+    # Zapisuje zaległe zmiany i przestaje śledzić tracker.
+    async def close(self):
+        self.tracker.remove_listener(self)
+        await self.flush()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterator, Optional
+
+_frozen: ContextVar[Optional[datetime]] = ContextVar("frozen_now", default=None)
+
+
+# Zwraca bieżący czas – albo czas "zamrożony" przez frozen_now().
+def now() -> datetime:
+    frozen = _frozen.get()
+    return datetime.now() if frozen is None else frozen
+
+
+# Zamraża zegar na czas bloku: wszystkie wywołania now() zwracają ten sam moment.
+# Operacje na wielu zadaniach (wczytywanie, filtrowanie) odczytują wtedy zegar raz, a nie
+# dla każdego zadania. Zagnieżdżony blok bez podanego momentu zachowuje zewnętrzny.
+@contextmanager
+def frozen_now(moment: Optional[datetime] = None) -> Iterator[datetime]:
+    moment = moment or _frozen.get() or datetime.now()
+    token = _frozen.set(moment)
+    try:
+        yield moment
+    finally:
+        _frozen.reset(token)
+
+
+# Parsuje datę ISO z pamięcią podręczną – terminy w plikach często się powtarzają
+# (np. "2025-06-01"), a datetime jest niezmienny, więc wynik można współdzielić.
+# Znaczniki czasu utworzenia są praktycznie zawsze różne – dla nich służy parse_timestamp.
+@lru_cache(maxsize=4096)
+def parse_iso(text: str) -> datetime:
+    return datetime.fromisoformat(text)
+
+
+parse_timestamp = datetime.fromisoformat
+
+
+# Zwraca datę w formacie YYYY-MM-DD; napis jest liczony raz dla każdego dnia.
+def format_date(moment: datetime) -> str:
+    return _date_string(moment.toordinal())
+
+
+@lru_cache(maxsize=4096)
+def _date_string(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime("%Y-%m-%d")
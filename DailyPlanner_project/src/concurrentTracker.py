@@ -0,0 +1,241 @@
+import heapq
+import threading
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from math import inf
+from typing import Iterable, List, Optional
+from src import clock
+from src.itemCard import itemCard
+from src.recurrence import next_in_window
+from src.tracker import Tracker
+
+# Liczba prób zebrania widoków bez blokad, zanim snapshot założy blokady wszystkich części.
+_SNAPSHOT_ATTEMPTS = 8
+
+# Zakłada blokady wszystkich części (zawsze w tej samej kolejności – bez ryzyka zakleszczenia).
+@contextmanager
+def _locked_all(shards: List["_Shard"]):
+    for shard in shards:
+        shard.lock.acquire()
+    try:
+        yield
+    finally:
+        for shard in reversed(shards):
+            shard.lock.release()
+
+
+class _Shard(Tracker):
+    # Część zadań ConcurrentTracker z własną blokadą i zapamiętanym widokiem tylko do odczytu.
+    # Klucze wpisów nadaje ConcurrentTracker (wspólna numeracja dla wszystkich części).
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.RLock()
+        self.view: Optional[_ShardView] = None
+
+    # Sprawdza identyfikatory zadań przed dodaniem (z założoną blokadą) – ten sam błąd co
+    # Tracker.add_tasks, zgłaszany zanim którakolwiek część cokolwiek doda.
+    def check_new(self, tasks: List[itemCard]):
+        by_id, new_ids = self._by_id, {}
+        for task in tasks:
+            other = new_ids.setdefault(task.id, by_id.get(task.id, task))
+            if other is not task and other != task:
+                raise ValueError("Another task with the same id is already in the tracker.")
+
+    # Dodaje zadanie pod podanym kluczem (wywoływane z założoną blokadą).
+    def add_with_key(self, key: int, task: itemCard):
+        self._next_key = key
+        self.add_task(task)
+        self.view = None
+
+    # Zmiana pola zadania (np. mark_completed w innym wątku) też musi przejść przez blokadę.
+    def _task_changed(self, task: itemCard, field, old, new):
+        with self.lock:
+            super()._task_changed(task, field, old, new)
+            self.view = None
+
+    # Zwraca aktualny widok; przebudowuje go tylko po zmianach (z blokadą tylko tej części).
+    # Każda zmiana części zastępuje widok (view = None), a przebudowa tworzy nowy obiekt –
+    # ten sam obiekt widoku oznacza więc brak zmian od jego zbudowania.
+    def current_view(self) -> "_ShardView":
+        view = self.view
+        if view is None:
+            with self.lock:
+                view = self.view
+                if view is None:
+                    view = self.view = _ShardView(self)
+        return view
+
+
+class _ShardView:
+    # Niezmienna kopia stanu jednej części: wpisy (klucz, zadanie) wg kolejności dodania,
+    # podział na wykonane i niewykonane, indeks terminów (termin, klucz, zadanie) oraz wpisy
+    # zadań powtarzanych ((klucz, zadanie), termin, reguła) z chwili zbudowania widoku.
+    __slots__ = ("entries", "completed", "uncompleted", "due", "recurring")
+
+    def __init__(self, shard: _Shard):
+        entries = shard._entries
+        self.entries = sorted(entries.items())
+        self.completed = sorted(shard._completed.items())
+        self.uncompleted = sorted(shard._uncompleted.items())
+        self.due = [(due, key, entries[key]) for due, key in shard._due_index]
+        self.recurring = [((key, task), task.due_date, task._recurrence)
+                          for key, task in shard._recurring.items()]
+
+
+class TrackerSnapshot:
+    # Spójny stan ConcurrentTracker z jednej chwili. Zmiany wprowadzone później nie są widoczne,
+    # więc po snapshot można bezpiecznie iterować, nie blokując piszących wątków.
+    def __init__(self, views: List[_ShardView]):
+        self._views = views
+
+    @property
+    def tasks(self) -> List[itemCard]:
+        return [task for _, task in heapq.merge(*(view.entries for view in self._views))]
+
+    def __len__(self):
+        return sum(len(view.entries) for view in self._views)
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def get_completed_tasks(self) -> List[itemCard]:
+        return [task for _, task in heapq.merge(*(view.completed for view in self._views))]
+
+    def get_uncompleted_tasks(self) -> List[itemCard]:
+        return [task for _, task in heapq.merge(*(view.uncompleted for view in self._views))]
+
+    # Zadania po terminie względem clock.now(), posortowane wg terminu.
+    def get_overdue_tasks(self) -> List[itemCard]:
+        now = clock.now()
+        parts = [view.due[:bisect_left(view.due, (now,))] for view in self._views]
+        return [task for _, _, task in heapq.merge(*parts)]
+
+    def get_tasks_due_within(self, hours: float) -> List[itemCard]:
+        now = clock.now()
+        return self.get_tasks_due_between(now, now + timedelta(hours=hours))
+
+    # Zadanie powtarzane trafia do wyniku także wtedy, gdy w przedziale jest kolejne wystąpienie.
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[itemCard]:
+        parts = []
+        for view in self._views:
+            part = view.due[bisect_left(view.due, (start,)):bisect_right(view.due, (end, inf))]
+            later = next_in_window(view.recurring, start, end) if view.recurring else None
+            if later:
+                part = sorted(part + [(when, key, task) for when, (key, task) in later])
+            parts.append(part)
+        return [task for _, _, task in heapq.merge(*parts)]
+
+
+class ConcurrentTracker:
+    # Tracker bezpieczny dla wielu wątków.
+    # Zadania są rozdzielone (wg identyfikatora zadania) na `shards` części, każda z własną blokadą, więc
+    # wątki zmieniające różne zadania zwykle sobie nie przeszkadzają. Odczyty korzystają z
+    # zapamiętanych, niezmiennych widoków części (kopia przy zapisie): widok jest przebudowywany
+    # dopiero przy pierwszym odczycie po zmianie. Kolejność dodania wyznacza wspólny licznik kluczy.
+    def __init__(self, shards: int = 16):
+        if shards < 1:
+            raise ValueError("Number of shards must be positive.")
+        self._shards = [_Shard() for _ in range(shards)]
+        self._key_lock = threading.Lock()
+        self._next_key = 0
+
+    def _shard(self, task) -> _Shard:
+        return self._shards[task.id % len(self._shards)]
+
+    # Rezerwuje `count` kolejnych kluczy.
+    def _reserve(self, count: int) -> int:
+        with self._key_lock:
+            first = self._next_key
+            self._next_key += count
+        return first
+
+    def add_task(self, task: itemCard):
+        if not isinstance(task, itemCard):
+            raise TypeError("Can only add Task instances.")
+        shard = self._shard(task)
+        with shard.lock:
+            shard.check_new([task])
+            shard.add_with_key(self._reserve(1), task)
+
+    # Dodaje wiele zadań – wszystkie albo żadne, jak Tracker.add_tasks. Blokady części partii
+    # są zakładane naraz (w stałej kolejności), identyfikatory sprawdzane we wszystkich tych
+    # częściach, a dopiero potem rezerwowane są klucze i zadania dodawane.
+    def add_tasks(self, tasks: Iterable[itemCard]):
+        tasks = list(tasks)
+        for task in tasks:
+            if not isinstance(task, itemCard):
+                raise TypeError("Can only add Task instances.")
+        groups: dict = {}
+        for task in tasks:
+            groups.setdefault(self._shard(task), []).append(task)
+        with _locked_all([shard for shard in self._shards if shard in groups]):
+            for shard, group in groups.items():
+                shard.check_new(group)
+            for key, task in enumerate(tasks, self._reserve(len(tasks))):
+                self._shard(task).add_with_key(key, task)
+
+    def remove_task(self, task: itemCard):
+        shard = self._shard(task)
+        with shard.lock:
+            shard.remove_task(task)
+            shard.view = None
+
+    def get(self, task_id: int, default=None):
+        return self._shards[task_id % len(self._shards)].get(task_id, default)
+
+    def remove_by_id(self, task_id: int):
+        shard = self._shards[task_id % len(self._shards)]
+        with shard.lock:
+            shard.remove_by_id(task_id)
+            shard.view = None
+
+    # Czyści wszystkie części naraz.
+    def clear_all(self):
+        with _locked_all(self._shards):
+            for shard in self._shards:
+                shard.clear_all()
+                shard.view = None
+
+    # Zwraca spójny stan wszystkich części z jednej chwili (podwójny odczyt): widoki są zbierane
+    # bez blokad – przebudowa zmienionego widoku blokuje tylko jego część – a potem sprawdzane,
+    # czy żadna część nie dostała w międzyczasie nowego widoku. Jeśli tak, zbieranie jest
+    # powtarzane; dopiero przy ciągłych zmianach snapshot zakłada blokady wszystkich części.
+    def snapshot(self) -> TrackerSnapshot:
+        for _ in range(_SNAPSHOT_ATTEMPTS):
+            views = [shard.current_view() for shard in self._shards]
+            if all(shard.view is view for shard, view in zip(self._shards, views)):
+                return TrackerSnapshot(views)
+        with _locked_all(self._shards):
+            return TrackerSnapshot([shard.current_view() for shard in self._shards])
+
+    # --- odczyty (każdy na osobnym, spójnym snapshot) ---
+
+    @property
+    def tasks(self) -> List[itemCard]:
+        return self.snapshot().tasks
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __contains__(self, task):
+        return task in self._shard(task)
+
+    def get_completed_tasks(self) -> List[itemCard]:
+        return self.snapshot().get_completed_tasks()
+
+    def get_uncompleted_tasks(self) -> List[itemCard]:
+        return self.snapshot().get_uncompleted_tasks()
+
+    def get_overdue_tasks(self) -> List[itemCard]:
+        return self.snapshot().get_overdue_tasks()
+
+    def get_tasks_due_within(self, hours: float) -> List[itemCard]:
+        return self.snapshot().get_tasks_due_within(hours)
+
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[itemCard]:
+        return self.snapshot().get_tasks_due_between(start, end)
+
@@ -0,0 +1,155 @@
+import base64
+import binascii
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from itertools import islice
+from math import inf
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from src import clock
+from src.itemCard import itemCard
+
+# Pola, wg których można porządkować wyniki zapytania.
+ORDERS = {"created": "created_at", "due": "due_date"}
+
+
+class Page(NamedTuple):
+    # Strona wyników: zadania i kursor następnej strony (None, jeśli to ostatnia strona).
+    tasks: List[itemCard]
+    cursor: Optional[str]
+
+
+# Kursor zapamiętuje pozycję ostatniego zwróconego wpisu (wartość pola sortowania i klucz),
+# a nie numer strony, więc kolejna strona zaczyna się od wyszukiwania binarnego.
+def encode_cursor(order_by: str, descending: bool, value: datetime, key: int) -> str:
+    raw = f"{order_by}|{int(descending)}|{value.isoformat()}|{key}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, order_by: str, descending: bool) -> Tuple[datetime, int]:
+    try:
+        order, desc, value, key = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        position = (clock.parse_timestamp(value), int(key))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if order != order_by or desc != str(int(descending)):
+        raise ValueError("Cursor does not match the query.")
+    return position
+
+
+class CursorIndex:
+    # Posortowane indeksy par (wartość, klucz) dla zapytań stronicowanych (słuchacz zmian trackera).
+    # Dla każdego pola sortowania są trzy listy: wszystkie wpisy, wykonane i niewykonane, więc
+    # filtr statusu i przedział na polu sortowania to tylko wybór listy i wyszukiwanie binarne.
+    # Zadania bez terminu nie występują w indeksach terminów.
+    def __init__(self, tracker):
+        self._entries = tracker._entries
+        self._lists: Dict[Tuple[str, Optional[bool]], list] = {
+            (field, status): [] for field in ORDERS.values() for status in (None, True, False)
+        }
+        self._loading = True
+        tracker.add_listener(self)
+        for values in self._lists.values():
+            values.sort()
+        self._loading = False
+
+    def _insert(self, field, completed, value, key):
+        if value is None:
+            return
+        for values in (self._lists[field, None], self._lists[field, bool(completed)]):
+            if self._loading or not values or values[-1] < (value, key):
+                values.append((value, key))  # zwykle wpisy przychodzą już w kolejności
+            else:
+                insort(values, (value, key))
+
+    def _delete(self, field, completed, value, key):
+        if value is None:
+            return
+        for values in (self._lists[field, None], self._lists[field, bool(completed)]):
+            del values[bisect_left(values, (value, key))]
+
+    # --- aktualizacje wywoływane przez Tracker ---
+
+    def task_added(self, key, task: itemCard):
+        for field in ORDERS.values():
+            self._insert(field, task.completed, getattr(task, field), key)
+
+    def task_removed(self, key, task: itemCard):
+        for field in ORDERS.values():
+            self._delete(field, task.completed, getattr(task, field), key)
+
+    def task_changed(self, key, task: itemCard, field, old, new):
+        if field == "completed":
+            if bool(old) != bool(new):
+                for name in ORDERS.values():
+                    value = getattr(task, name)
+                    if value is not None:
+                        source = self._lists[name, bool(old)]
+                        del source[bisect_left(source, (value, key))]
+                        insort(self._lists[name, bool(new)], (value, key))
+        elif field in ("created_at", "due_date"):
+            self._delete(field, task.completed, old, key)
+            self._insert(field, task.completed, new, key)
+
+    def tasks_cleared(self):
+        for values in self._lists.values():
+            values.clear()
+
+    # --- zapytania ---
+
+    # Przechodzi po wpisach pasujących do zapytania, zaczynając za pozycją z kursora.
+    # Zwraca pary ((wartość, klucz), zadanie).
+    def _scan(self, order_by, descending, completed, after, before, position, filters) -> Iterator:
+        values = self._lists[ORDERS[order_by], completed]
+        lo = 0 if after is None else bisect_left(values, (after,))
+        hi = len(values) if before is None else bisect_right(values, (before, inf))
+        if position is not None:
+            if descending:
+                hi = min(hi, bisect_left(values, position))
+            else:
+                lo = max(lo, bisect_right(values, position))
+        indices = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        entries = self._entries
+        for i in indices:
+            entry = values[i]
+            task = entries[entry[1]]
+            if all(check(task) for check in filters):
+                yield entry, task
+
+    def page(self, order_by: str = "created", descending: bool = False, limit: int = 50,
+             cursor: Optional[str] = None, completed: Optional[bool] = None,
+             due_after: Optional[datetime] = None, due_before: Optional[datetime] = None,
+             created_after: Optional[datetime] = None, created_before: Optional[datetime] = None) -> Page:
+        if order_by not in ORDERS:
+            raise ValueError(f"Unknown order: {order_by}")
+        if limit < 1:
+            raise ValueError("Limit must be positive.")
+        position = None if cursor is None else decode_cursor(cursor, order_by, descending)
+        if completed is not None:
+            completed = bool(completed)
+        # Przedział na polu sortowania zawęża listę; przedział na drugim polu jest sprawdzany
+        # przy przeglądaniu (koszt rośnie, gdy pasuje mało wpisów).
+        if order_by == "created":
+            after, before = created_after, created_before
+            filters = _range_filters("due_date", due_after, due_before)
+        else:
+            after, before = due_after, due_before
+            filters = _range_filters("created_at", created_after, created_before)
+        found = list(islice(self._scan(order_by, descending, completed, after, before, position, filters),
+                            limit + 1))
+        next_cursor = None
+        if len(found) > limit:
+            (value, key), _ = found[limit - 1]
+            next_cursor = encode_cursor(order_by, descending, value, key)
+            del found[limit:]
+        return Page([task for _, task in found], next_cursor)
+
+
+def _range_filters(field, after, before) -> list:
+    filters = []
+    if after is not None or before is not None:
+        filters.append(lambda task: getattr(task, field) is not None)
+    if after is not None:
+        filters.append(lambda task: getattr(task, field) >= after)
+    if before is not None:
+        filters.append(lambda task: getattr(task, field) <= before)
+    return filters
@@ -0,0 +1,205 @@
+import hashlib
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple
+from src.itemCard import itemCard
+from src.supportBox import iter_task_records, task_from_dict, task_to_dict
+
+# Skrót treści rekordu (jak supportBox.task_to_dict). Najmłodszy bit to status wykonania,
+# pozostałe – skrót tytułu, opisu, dat i reguły powtarzania, więc po samym skrócie widać zmianę tylko statusu.
+def content_hash(record: dict) -> int:
+    text = "\x1f".join((record["title"], record.get("description", ""),
+                        record["due_date"] or "", record.get("created_at") or "",
+                        record.get("recurrence") or ""))
+    digest = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+    return (digest & ~1) | (1 if record["completed"] else 0)
+
+# Składnik sumy kontrolnej kubełka: skrót identyfikatora razem ze skrótem treści. Funkcja musi
+# być nieliniowa – przy samym XOR dwie zmiany statusu (bit 0) w jednym kubełku by się znosiły.
+def _mix(task_id: int, value: int) -> int:
+    data = task_id.to_bytes(8, "little", signed=True) + value.to_bytes(8, "little")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class Diff(NamedTuple):
+    # Identyfikatory zadań różniących się między stanem bazowym a docelowym.
+    added: List[int]
+    removed: List[int]
+    changed: List[int]        # zmieniona treść (tytuł, opis, daty)
+    completed: List[int]      # zmieniony tylko status: wykonane
+    uncompleted: List[int]    # zmieniony tylko status: niewykonane
+
+
+class Manifest:
+    # Skróty treści zadań podzielone na kubełki wg identyfikatora. Każdy kubełek ma sumę
+    # kontrolną (XOR skrótów par identyfikator–treść) aktualizowaną w O(1) przy każdej
+    # zmianie. Porównanie dwóch manifestów zaczyna od sum kontrolnych i przegląda tylko kubełki,
+    # które się różnią – koszt zależy od liczby zmian, a nie od liczby zadań.
+    def __init__(self, buckets: int = 4096):
+        if buckets < 1:
+            raise ValueError("Number of buckets must be positive.")
+        self._buckets: List[Dict[int, int]] = [{} for _ in range(buckets)]
+        self.digests: List[int] = [0] * buckets
+
+    # Rekordy bez identyfikatora (pliki sprzed wprowadzenia itemCard.id) nie dają się dopasować
+    # między dwiema kopiami – trzeba je najpierw wczytać i zapisać ponownie.
+    @classmethod
+    def from_records(cls, records: Iterable[dict], buckets: int = 4096) -> "Manifest":
+        manifest = cls(buckets)
+        for record in records:
+            task_id = record.get("id")
+            if task_id is None:
+                raise ValueError("Task record has no id; re-save the file to assign ids before syncing.")
+            manifest.set(task_id, content_hash(record))
+        return manifest
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[itemCard], buckets: int = 4096) -> "Manifest":
+        return cls.from_records((task_to_dict(task) for task in tasks), buckets)
+
+    # Manifest pliku zadań (rekordy są czytane strumieniowo, bez tworzenia itemCard).
+    @classmethod
+    def from_file(cls, filename: str, buckets: int = 4096) -> "Manifest":
+        return cls.from_records(iter_task_records(filename), buckets)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets)
+
+    def __contains__(self, task_id):
+        return task_id in self._buckets[task_id % len(self._buckets)]
+
+    def set(self, task_id: int, value: int):
+        index = task_id % len(self._buckets)
+        bucket = self._buckets[index]
+        old = bucket.get(task_id)
+        if old is not None:
+            self.digests[index] ^= _mix(task_id, old)
+        bucket[task_id] = value
+        self.digests[index] ^= _mix(task_id, value)
+
+    def discard(self, task_id: int):
+        index = task_id % len(self._buckets)
+        old = self._buckets[index].pop(task_id, None)
+        if old is not None:
+            self.digests[index] ^= _mix(task_id, old)
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self.digests = [0] * len(self._buckets)
+
+    # Skróty z jednego kubełka (identyfikator -> skrót) – do przesłania drugiej stronie.
+    def bucket(self, index: int) -> Dict[int, int]:
+        return dict(self._buckets[index])
+
+    # Numery kubełków, w których ten manifest różni się od sum kontrolnych drugiej strony.
+    def differing_buckets(self, digests: List[int]) -> List[int]:
+        if len(digests) != len(self.digests):
+            raise ValueError("Manifests have different numbers of buckets.")
+        return [i for i, (mine, theirs) in enumerate(zip(self.digests, digests)) if mine != theirs]
+
+
+class TrackerManifest(Manifest):
+    # Manifest utrzymywany na bieżąco dla trackera (słuchacz zmian). Zadanie dodane kilka razy
+    # ma jeden wpis, usuwany razem z ostatnim wpisem trackera.
+    def __init__(self, tracker, buckets: int = 4096):
+        super().__init__(buckets)
+        self._refs: Counter = Counter()
+        tracker.add_listener(self)
+
+    def task_added(self, key, task: itemCard):
+        self._refs[task.id] += 1
+        if self._refs[task.id] == 1:
+            self.set(task.id, content_hash(task_to_dict(task)))
+
+    def task_removed(self, key, task: itemCard):
+        self._refs[task.id] -= 1
+        if not self._refs[task.id]:
+            del self._refs[task.id]
+            self.discard(task.id)
+
+    def task_changed(self, key, task: itemCard, field, old, new):
+        self.set(task.id, content_hash(task_to_dict(task)))
+
+    def tasks_cleared(self):
+        self._refs.clear()
+        self.clear()
+
+
+# Porównuje manifest bazowy z docelowym (tylko w kubełkach o różnych sumach kontrolnych).
+def diff(base: Manifest, target: Manifest) -> Diff:
+    result = Diff([], [], [], [], [])
+    for index in target.differing_buckets(base.digests):
+        old, new = base._buckets[index], target._buckets[index]
+        for task_id, value in new.items():
+            before = old.get(task_id)
+            if before is None:
+                result.added.append(task_id)
+            elif before != value:
+                if before >> 1 != value >> 1:
+                    result.changed.append(task_id)
+                else:
+                    (result.completed if value & 1 else result.uncompleted).append(task_id)
+        result.removed.extend(task_id for task_id in old if task_id not in new)
+    return result
+
+# Tworzy łatkę zamieniającą stan opisany manifestem `base` w stan trackera `tracker`.
+# Łatka to słownik gotowy do zapisu w JSON: pełne rekordy tylko dla nowych i zmienionych zadań,
+# same identyfikatory dla usuniętych i zmian statusu.
+def make_patch(base: Manifest, tracker) -> dict:
+    changes = diff(base, tracker.manifest(len(base.digests)))
+    return {
+        "add": [task_to_dict(tracker.get(task_id)) for task_id in changes.added],
+        "update": [task_to_dict(tracker.get(task_id)) for task_id in changes.changed],
+        "remove": changes.removed,
+        "complete": changes.completed,
+        "uncomplete": changes.uncompleted,
+    }
+
+# Łatka między dwoma plikami zadań (np. kopiami z dwóch komputerów). Pliki są czytane
+# strumieniowo: raz do manifestów i drugi raz plik docelowy – po rekordy nowych i zmienionych zadań.
+def diff_files(base_file: str, target_file: str, buckets: int = 4096) -> dict:
+    changes = diff(Manifest.from_file(base_file, buckets), Manifest.from_file(target_file, buckets))
+    wanted = set(changes.added) | set(changes.changed)
+    records = {}
+    if wanted:
+        for record in iter_task_records(target_file):
+            if record["id"] in wanted:
+                records[record["id"]] = record
+    return {
+        "add": [records[task_id] for task_id in changes.added],
+        "update": [records[task_id] for task_id in changes.changed],
+        "remove": changes.removed,
+        "complete": changes.completed,
+        "uncomplete": changes.uncompleted,
+    }
+
+# Nakłada łatkę na tracker (zadania są odnajdywane po identyfikatorze). Zwraca liczbę zmian.
+def apply_patch(tracker, patch: dict) -> int:
+    for task_id in patch.get("remove", ()):
+        while tracker.get(task_id) is not None:
+            tracker.remove_by_id(task_id)
+    for data in patch.get("update", ()):
+        incoming = task_from_dict(data)
+        current = tracker.get(incoming.id)
+        if current is None:
+            tracker.add_task(incoming)
+            continue
+        current.title = incoming.title
+        current.description = incoming.description
+        current.due_date = incoming.due_date
+        current.completed = incoming.completed
+        current.created_at = incoming.created_at
+        current.recurrence = incoming.recurrence
+    # Status wprost (mark_completed przesunąłby termin zadania powtarzanego).
+    for task_id in patch.get("complete", ()):
+        _existing(tracker, task_id).completed = True
+    for task_id in patch.get("uncomplete", ()):
+        _existing(tracker, task_id).completed = False
+    tracker.add_tasks(task_from_dict(data) for data in patch.get("add", ()))
+    return sum(len(patch.get(name, ())) for name in ("add", "update", "remove", "complete", "uncomplete"))
+
+def _existing(tracker, task_id: int) -> itemCard:
+    task = tracker.get(task_id)
+    if task is None:
+        raise ValueError("Task not found.")
+    return task
@@ -0,0 +1,215 @@
+import heapq
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional
+from src import clock
+from src.itemCard import itemCard
+from src.taskTable import to_micros
+
+
+class TaskEvent(NamedTuple):
+    # Zdarzenie trackera. kind: "added", "removed", "cleared", "completed", "uncompleted",
+    # "changed" (tytuł, opis lub termin – nazwa w `field`) albo "overdue" (minął termin).
+    kind: str
+    key: Optional[int] = None
+    task: Optional[itemCard] = None
+    field: Optional[str] = None
+    old: object = None
+    new: object = None
+
+
+class TimerWheel:
+    # Koło czasowe: terminy trafiają do kubełków o szerokości `resolution` sekund, a kopiec
+    # trzyma tylko numery niepustych kubełków. Dodanie i anulowanie kosztuje O(1) (anulowane
+    # wpisy są pomijane przy przejściu przez kubełek), a advance() przegląda tylko kubełki,
+    # których czas już minął – niezależnie od liczby zaplanowanych terminów.
+    def __init__(self, resolution: float = 1.0):
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive.")
+        self._step = max(1, int(resolution * 1_000_000))
+        self._buckets: Dict[int, list] = {}
+        self._ticks: List[int] = []
+        self._deadlines: Dict[Hashable, datetime] = {}
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def _tick(self, when: datetime) -> int:
+        return to_micros(when) // self._step
+
+    # Planuje (albo przesuwa) termin dla elementu.
+    def schedule(self, item: Hashable, when: datetime):
+        self._deadlines[item] = when
+        tick = self._tick(when)
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = []
+            heapq.heappush(self._ticks, tick)
+        bucket.append((when, item))
+
+    def cancel(self, item: Hashable):
+        self._deadlines.pop(item, None)
+
+    def clear(self):
+        self._buckets.clear()
+        self._ticks.clear()
+        self._deadlines.clear()
+
+    # Zwraca elementy, których termin jest wcześniejszy niż `now` (jak w itemCard.is_overdue),
+    # posortowane wg terminu; każdy element tylko raz.
+    def advance(self, now: datetime) -> List[Hashable]:
+        limit = self._tick(now)
+        fired = []
+        while self._ticks and self._ticks[0] <= limit:
+            tick = heapq.heappop(self._ticks)
+            later = []
+            for when, item in self._buckets.pop(tick):
+                if self._deadlines.get(item) != when:
+                    continue  # anulowany albo przesunięty
+                if when < now:
+                    fired.append((when, item))
+                    del self._deadlines[item]
+                else:
+                    later.append((when, item))
+            if later:  # ostatni kubełek może mieć terminy późniejsze niż `now`
+                self._buckets[tick] = later
+                heapq.heappush(self._ticks, tick)
+                break
+        fired.sort(key=lambda entry: entry[0])
+        return [item for _, item in fired]
+
+    # Najbliższy zaplanowany termin (kiedy warto wywołać advance) albo None.
+    def next_deadline(self) -> Optional[datetime]:
+        while self._ticks:
+            tick = self._ticks[0]
+            valid = [when for when, item in self._buckets[tick] if self._deadlines.get(item) == when]
+            if valid:
+                return min(valid)
+            del self._buckets[tick]
+            heapq.heappop(self._ticks)
+        return None
+
+
+class EventStream:
+    # Strumień zdarzeń trackera (słuchacz zmian) z dostarczaniem partiami.
+    # Zdarzenia są zbierane w buforze; z `callback` są przekazywane listą co `batch_size`
+    # zdarzeń i przy flush(), bez niego odbiera się je przez drain(). Zadania z terminem są
+    # w kole czasowym: advance() emituje "overdue" dla zadań, których termin właśnie minął,
+    # a next_deadline() mówi, kiedy wywołać advance() następnym razem.
+    # Z `max_delay` (sekundy) strumień sam wywołuje advance() i flush() w wątku threading.Timer:
+    # najpóźniej co `max_delay`, a wcześniej, gdy wypada najbliższy termin. Zdarzenie czeka
+    # wtedy na dostarczenie co najwyżej `max_delay`, a "overdue" nie wymaga ręcznego advance().
+    # Callback jest wtedy wywoływany także z wątku timera (pod blokadą strumienia).
+    # Przy podłączeniu do trackera strumień dostaje zdarzenia "added" dla obecnych zadań.
+    def __init__(self, tracker, callback: Optional[Callable[[List[TaskEvent]], None]] = None,
+                 batch_size: int = 100, resolution: float = 1.0, max_delay: Optional[float] = None):
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError("Maximum delay must be positive.")
+        self.tracker = tracker
+        self.callback = callback
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.wheel = TimerWheel(resolution)
+        self._pending: List[TaskEvent] = []
+        self._tasks: Dict[int, itemCard] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        tracker.add_listener(self)
+        if max_delay is not None:
+            self._arm()
+
+    # --- zdarzenia trackera ---
+
+    def task_added(self, key, task):
+        with self._lock:
+            self._tasks[key] = task
+            if task.due_date is not None:
+                self.wheel.schedule(key, task.due_date)
+            self._emit(TaskEvent("added", key, task))
+
+    def task_removed(self, key, task):
+        with self._lock:
+            del self._tasks[key]
+            self.wheel.cancel(key)
+            self._emit(TaskEvent("removed", key, task))
+
+    def task_changed(self, key, task, field, old, new):
+        with self._lock:
+            if field == "completed":
+                self._emit(TaskEvent("completed" if new else "uncompleted", key, task, field, old, new))
+                return
+            if field == "due_date":
+                if new is None:
+                    self.wheel.cancel(key)
+                else:
+                    self.wheel.schedule(key, new)
+            self._emit(TaskEvent("changed", key, task, field, old, new))
+
+    def tasks_cleared(self):
+        with self._lock:
+            self._tasks.clear()
+            self.wheel.clear()
+            self._emit(TaskEvent("cleared"))
+
+    # --- dostarczanie ---
+
+    def _emit(self, event: TaskEvent):
+        self._pending.append(event)
+        if self.callback is not None and len(self._pending) >= self.batch_size:
+            self.flush()
+
+    # Przekazuje zebrane zdarzenia do callback (jedną listą).
+    def flush(self):
+        with self._lock:
+            if self._pending and self.callback is not None:
+                events, self._pending = self._pending, []
+                self.callback(events)
+
+    # Zwraca i usuwa z bufora zebrane zdarzenia (tryb bez callback).
+    def drain(self) -> List[TaskEvent]:
+        with self._lock:
+            events, self._pending = self._pending, []
+        return events
+
+    # Emituje "overdue" dla zadań, których termin minął do `now` (domyślnie clock.now()).
+    # Zwraca liczbę nowych zdarzeń.
+    def advance(self, now: Optional[datetime] = None) -> int:
+        with self._lock:
+            keys = self.wheel.advance(now or clock.now())
+            for key in keys:
+                self._emit(TaskEvent("overdue", key, self._tasks[key]))
+        return len(keys)
+
+    def next_deadline(self) -> Optional[datetime]:
+        with self._lock:
+            return self.wheel.next_deadline()
+
+    # --- samodzielne dostarczanie (max_delay) ---
+
+    # Planuje następne wybudzenie: za `max_delay` albo wcześniej, w chwili najbliższego terminu.
+    def _arm(self):
+        delay = self.max_delay
+        deadline = self.next_deadline()
+        if deadline is not None:
+            delay = min(delay, max(0.0, (deadline - clock.now()).total_seconds()))
+        timer = threading.Timer(delay, self._wake)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _wake(self):
+        with self._lock:
+            if self._timer is None:
+                return  # strumień zamknięty
+            self.advance()
+            self.flush()
+            self._arm()
+
+    # Dostarcza zaległe zdarzenia, zatrzymuje timer i odłącza strumień od trackera.
+    def close(self):
+        with self._lock:
+            timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            self.flush()
+        self.tracker.remove_listener(self)
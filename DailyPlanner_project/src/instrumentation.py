@@ -0,0 +1,161 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from math import inf
+from typing import Dict, Optional
+from src.itemCard import itemCard
+from src.tracker import Tracker
+
+# Górne granice kubełków histogramu opóźnień (sekundy).
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, inf)
+
+# Metody opakowywane po włączeniu pomiarów (nazwa metryki -> (klasa, atrybut)).
+_METHODS = {
+    "itemCard.__init__": (itemCard, "__init__"),
+    "Tracker.add_task": (Tracker, "add_task"),
+    "Tracker.add_tasks": (Tracker, "add_tasks"),
+    "Tracker.remove_task": (Tracker, "remove_task"),
+    "Tracker.get_completed_tasks": (Tracker, "get_completed_tasks"),
+    "Tracker.get_uncompleted_tasks": (Tracker, "get_uncompleted_tasks"),
+    "Tracker.get_overdue_tasks": (Tracker, "get_overdue_tasks"),
+    "Tracker.get_tasks_due_within": (Tracker, "get_tasks_due_within"),
+    "Tracker.get_tasks_due_between": (Tracker, "get_tasks_due_between"),
+}
+
+# Aktywne metryki albo None (pomiary wyłączone). supportBox sprawdza tę wartość przy zapisie
+# i odczycie plików; metody z _METHODS są opakowywane tylko na czas pomiarów.
+metrics: Optional["Metrics"] = None
+_originals: Dict[str, object] = {}
+
+
+class Histogram:
+    # Histogram opóźnień o stałych kubełkach (LATENCY_BUCKETS); liczniki nie są skumulowane.
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    # Liczniki skumulowane (jak w Prometheus: wywołania nie dłuższe niż granica).
+    def cumulative(self) -> Dict[float, int]:
+        result, total = {}, 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            total += count
+            result[bound] = total
+        return result
+
+
+class Metrics:
+    # Liczniki wywołań, histogramy opóźnień i liczba bajtów odczytanych/zapisanych dla operacji.
+    # Aktualizacje są chronione blokadą (zapis asynchroniczny działa w innym wątku).
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.latency: Dict[str, Histogram] = {}
+        self.bytes_read: Counter = Counter()
+        self.bytes_written: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self.calls[name] += 1
+            histogram = self.latency.get(name)
+            if histogram is None:
+                histogram = self.latency[name] = Histogram()
+            histogram.observe(seconds)
+
+    # Mierzy czas bloku jako jedno wywołanie operacji `name`.
+    @contextmanager
+    def timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def add_bytes(self, name: str, read: int = 0, written: int = 0):
+        with self._lock:
+            if read:
+                self.bytes_read[name] += read
+            if written:
+                self.bytes_written[name] += written
+
+    # Stan metryk jako słownik (np. do zapisu w JSON albo do testów).
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "latency": {
+                    name: {"count": h.count, "sum": h.sum,
+                           "buckets": {str(bound): count for bound, count in h.cumulative().items()}}
+                    for name, h in self.latency.items()
+                },
+                "bytes_read": dict(self.bytes_read),
+                "bytes_written": dict(self.bytes_written),
+            }
+
+    # Metryki w formacie tekstowym Prometheus.
+    def prometheus(self, prefix: str = "dailyplanner") -> str:
+        with self._lock:
+            lines = [f"# TYPE {prefix}_calls_total counter"]
+            lines += [f'{prefix}_calls_total{{op="{name}"}} {count}' for name, count in sorted(self.calls.items())]
+            lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+            for name, h in sorted(self.latency.items()):
+                for bound, count in h.cumulative().items():
+                    le = "+Inf" if bound == inf else repr(bound)
+                    lines.append(f'{prefix}_latency_seconds_bucket{{op="{name}",le="{le}"}} {count}')
+                lines.append(f'{prefix}_latency_seconds_sum{{op="{name}"}} {h.sum!r}')
+                lines.append(f'{prefix}_latency_seconds_count{{op="{name}"}} {h.count}')
+            for kind, counter in (("read", self.bytes_read), ("written", self.bytes_written)):
+                lines.append(f"# TYPE {prefix}_bytes_{kind}_total counter")
+                lines += [f'{prefix}_bytes_{kind}_total{{op="{name}"}} {count}'
+                          for name, count in sorted(counter.items())]
+        return "\n".join(lines) + "\n"
+
+    # Zapisuje metryki Prometheus do pliku (np. dla node_exporter textfile collector).
+    # Plik jest podmieniany w całości, więc czytelnik nie zobaczy go w połowie zapisu.
+    def write_prometheus(self, filename: str, prefix: str = "dailyplanner"):
+        temp = filename + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(self.prometheus(prefix))
+        os.replace(temp, filename)
+
+
+def _timed_method(name: str, func, target: Metrics):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            target.record(name, time.perf_counter() - start)
+    return wrapper
+
+
+# Włącza pomiary i zwraca metryki. Dopóki pomiary są wyłączone, mierzone metody są oryginalnymi
+# funkcjami (bez żadnego narzutu), a supportBox sprawdza tylko, czy `metrics` nie jest None.
+def enable(target: Optional[Metrics] = None) -> Metrics:
+    global metrics
+    disable()
+    metrics = target or Metrics()
+    for name, (cls, attribute) in _METHODS.items():
+        original = cls.__dict__[attribute]
+        _originals[name] = original
+        setattr(cls, attribute, _timed_method(name, original, metrics))
+    return metrics
+
+# Wyłącza pomiary i przywraca oryginalne metody.
+def disable():
+    global metrics
+    for name, original in _originals.items():
+        cls, attribute = _METHODS[name]
+        setattr(cls, attribute, original)
+    _originals.clear()
+    metrics = None
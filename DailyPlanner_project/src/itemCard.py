@@ -1,23 +1,247 @@
-from datetime import datetime
+import itertools
+import os
+import random
+from src import clock
+from src.recurrence import Recurrence
+
+
+# Identyfikatory zadań: 62-bitowe liczby – losowy prefiks procesu (30 bitów) i licznik (32 bity).
+# Prefiks jest losowany na nowo w procesie potomnym, więc zadania tworzone równolegle w kilku
+# procesach (np. load_many) nie dostają tych samych identyfikatorów.
+def _reset_ids():
+    global _ids
+    _ids = itertools.count(random.SystemRandom().getrandbits(30) << 32)
+
+
+_reset_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids)
+
+
+# Zwraca nowy, unikalny identyfikator zadania.
+def _new_id() -> int:
+    return next(_ids)
+
+
+# Sprawdza, czy tytuł nie jest pusty, i zwraca go bez białych znaków na brzegach.
+def _clean_title(title):
+    if not title or not title.strip():
+        raise ValueError("Task title cannot be empty.")
+    return title.strip()
+
+# Konwertuje termin podany jako tekst (YYYY-MM-DD) na datetime.
+def _parse_due_date(due_date):
+    if isinstance(due_date, str):
+        try:
+            return clock.parse_iso(due_date)
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+    return due_date
+
+# Uzupełnia krotkę (tytuł, opis, termin) wartościami domyślnymi.
+def _tuple_fields(title, description="", due_date=None):
+    return title, description, due_date
+
 
 class itemCard:
+    # Pola trzymane w slotach zamiast __dict__ (104 B na obiekt zamiast 56 B + 112 B słownika).
+    # Pełne zadanie i tak zajmuje ok. 190 B bez napisów (m.in. id i dwa datetime) – więcej niż
+    # pierwotne ~160 B, bo doszły pola id, owners i recurrence. Zwarty zapis dużej liczby zadań
+    # to TaskTable (ok. 50 B na zadanie bez napisów) – patrz benchmarks/bench.py.
+    # __weakref__ pozwala trzymać zadania w mapach tożsamości bez przedłużania ich życia (sqliteBox).
+    __slots__ = ("_id", "_title", "_description", "_due_date", "_completed", "_created_at", "_owners",
+                 "_recurrence", "__weakref__")
+
     # Tworzy nowe zadanie z tytułem, opcjonalnym opisem i terminem.
     # Sprawdza poprawność tytułu i konwertuje datę, jeśli podano ją jako tekst.
-    def __init__(self, title, description="", due_date=None):
-        if not title or not title.strip():
-            raise ValueError("Task title cannot be empty.")
-        self.title = title.strip()
-        self.description = description.strip()
-
-        if isinstance(due_date, str):
-            try:
-                due_date = datetime.fromisoformat(due_date)
-            except ValueError:
-                raise ValueError("Invalid date format. Use YYYY-MM-DD")
-
-        self.due_date = due_date
-        self.completed = False
-        self.created_at = datetime.now()
+    # Zadanie powtarzane (recurrence: Recurrence albo zapis tekstowy, np. "weekly") wymaga terminu.
+    def __init__(self, title, description="", due_date=None, recurrence=None):
+        self._id = next(_ids)
+        self._title = _clean_title(title)
+        self._description = description.strip()
+        self._owners = None
+        self._due_date = _parse_due_date(due_date)
+        self._completed = False
+        self._created_at = clock.now()
+        self._recurrence = None
+        if recurrence is not None:
+            self.recurrence = recurrence
+
+    # Tworzy wiele zadań naraz z rekordów: słowników (jak w task_to_dict) lub krotek
+    # (tytuł, opis, termin). Walidacja odbywa się w jednym przebiegu, a zadania bez
+    # własnego created_at dzielą jeden znacznik czasu utworzenia dla całej partii.
+    @classmethod
+    def from_records(cls, records, created_at=None):
+        created_at = created_at or clock.now()
+        tasks = []
+        for record in records:
+            if isinstance(record, dict):
+                title = record["title"]
+                description = record.get("description", "")
+                due_date = record.get("due_date")
+                completed = bool(record.get("completed", False))
+                created = record.get("created_at") or created_at
+                if isinstance(created, str):
+                    created = clock.parse_timestamp(created)
+                task_id = record.get("id")
+                recurrence = record.get("recurrence")
+            else:
+                title, description, due_date = _tuple_fields(*record)
+                completed = False
+                created = created_at
+                task_id = None
+                recurrence = None
+            task = cls._from_fields(_clean_title(title), description.strip() if description else "",
+                                    _parse_due_date(due_date), completed, created, task_id)
+            if recurrence:
+                task.recurrence = recurrence
+            tasks.append(task)
+        return tasks
+
+    # Odtwarza zadanie z gotowych, już sprawdzonych pól (bez walidacji i bez odczytu zegara).
+    # Termin i data utworzenia mogą być jeszcze tekstem ISO – są wtedy parsowane przy pierwszym
+    # odczycie (leniwe wczytywanie, zob. task_from_dict(..., lazy=True)).
+    # Bez podanego identyfikatora zadanie dostaje nowy; reguła powtarzania to obiekt Recurrence.
+    @classmethod
+    def _from_fields(cls, title, description, due_date, completed, created_at, task_id=None,
+                     recurrence=None):
+        task = cls.__new__(cls)
+        task._id = _new_id() if task_id is None else task_id
+        task._title = title
+        task._description = description
+        task._owners = None
+        task._due_date = due_date
+        task._completed = completed
+        task._created_at = created_at
+        task._recurrence = recurrence
+        return task
+
+    # Stały identyfikator zadania – zachowywany przy zapisie i odczycie z pliku.
+    # Tylko do odczytu: trackery indeksują po nim zadania.
+    @property
+    def id(self) -> int:
+        return self._id
+
+    # Tytuł i opis; zmiana powiadamia trackery (np. indeks wyszukiwania).
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        old = self._title
+        self._title = value
+        if self._owners and old != value:
+            self._notify("title", old, value)
+
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        old = self._description
+        self._description = value
+        if self._owners and old != value:
+            self._notify("description", old, value)
+
+    # Status wykonania; zmiana powiadamia trackery, które przechowują to zadanie.
+    @property
+    def completed(self):
+        return self._completed
+
+    @completed.setter
+    def completed(self, value):
+        old = self._completed
+        self._completed = value
+        if self._owners and old != value:
+            self._notify("completed", old, value)
+
+    # Termin wykonania; zmiana powiadamia trackery (indeks terminów musi zostać poprawiony).
+    # Termin zapisany jako tekst (leniwe wczytywanie) jest parsowany przy pierwszym odczycie;
+    # nowy termin podany jako tekst jest parsowany od razu (jak w konstruktorze).
+    @property
+    def due_date(self):
+        due_date = self._due_date
+        if due_date.__class__ is str:
+            due_date = self._due_date = _parse_due_date(due_date)
+        return due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        value = _parse_due_date(value)
+        old = self.due_date
+        self._due_date = value
+        if self._owners and old != value:
+            self._notify("due_date", old, value)
+
+    # Data utworzenia; podobnie jak termin może czekać na sparsowanie do pierwszego odczytu.
+    # Zmiana powiadamia trackery (indeksy uporządkowane wg daty utworzenia).
+    @property
+    def created_at(self):
+        created_at = self._created_at
+        if created_at.__class__ is str:
+            created_at = self._created_at = clock.parse_timestamp(created_at)
+        return created_at
+
+    @created_at.setter
+    def created_at(self, value):
+        if self._owners:
+            old = self.created_at
+            self._created_at = value
+            if old != value:
+                self._notify("created_at", old, value)
+        else:
+            self._created_at = value
+
+    # Reguła powtarzania (None dla zwykłego zadania). Termin zadania powtarzanego to najbliższe
+    # niewykonane wystąpienie serii; zmiana reguły powiadamia trackery.
+    @property
+    def recurrence(self):
+        return self._recurrence
+
+    @recurrence.setter
+    def recurrence(self, value):
+        if isinstance(value, str):
+            value = Recurrence.parse(value)
+        if value is not None:
+            if not isinstance(value, Recurrence):
+                raise TypeError("Recurrence must be a Recurrence rule or its text form.")
+            if self.due_date is None:
+                raise ValueError("Recurring task needs a due date.")
+        old = self._recurrence
+        self._recurrence = value
+        if self._owners and old != value:
+            self._notify("recurrence", old, value)
+
+    # Terminy zadania w przedziale [start, end], wyliczane na żądanie (generator). Zwykłe zadanie
+    # ma najwyżej jeden termin; zadanie powtarzane – kolejne wystąpienia od bieżącego terminu.
+    def occurrences(self, start, end):
+        due_date = self.due_date
+        if due_date is None:
+            return
+        if self._recurrence is None:
+            if start <= due_date <= end:
+                yield due_date
+            return
+        yield from self._recurrence.occurrences(due_date, start, end)
+
+    # Rejestruje tracker, który ma być powiadamiany o zmianach zadania.
+    def _attach(self, owner):
+        if self._owners is None:
+            self._owners = []
+        if owner not in self._owners:
+            self._owners.append(owner)
+
+    # Wyrejestrowuje tracker (np. po usunięciu zadania).
+    def _detach(self, owner):
+        if self._owners and owner in self._owners:
+            self._owners.remove(owner)
+
+    # Przekazuje informację o zmianie pola do wszystkich trackerów.
+    def _notify(self, field, old, new):
+        for owner in list(self._owners):
+            owner._task_changed(self, field, old, new)
 
     # Sprawdza, czy tytuł zadania jest poprawny (od 2 do 20 znaków).
     def _validate_title(self):
@@ -27,8 +251,14 @@ class itemCard:
             return False
         return True
 
-    # Ustawia zadanie jako wykonane.
+    # Ustawia zadanie jako wykonane. W zadaniu powtarzanym wykonane jest bieżące wystąpienie:
+    # termin przechodzi na następne, a zadanie jest wykonane dopiero po ostatnim wystąpieniu serii.
     def mark_completed(self):
+        if self._recurrence is not None and self.due_date is not None:
+            following = self._recurrence.next_after(self.due_date)
+            if following is not None:
+                self.due_date = following
+                return
         self.completed = True
 
     # Ustawia zadanie jako niewykonane.
@@ -36,12 +266,13 @@ class itemCard:
         self.completed = False
 
     # Sprawdza, czy zadanie jest po terminie (czy jest przeterminowane).
+    # Czas pochodzi z clock.now(), więc w bloku frozen_now() zegar nie jest odczytywany za każdym razem.
     def is_overdue(self):
         if self.due_date is None:
             return False
-        return datetime.now() > self.due_date
+        return clock.now() > self.due_date
 
     # Zwraca tekstową reprezentację zadania, np. [✓] Zakupy (2025-05-18)
     def __str__(self):
         status = "✓" if self.completed else "✗"
-        return f"[{status}] {self.title} ({self.created_at.strftime('%Y-%m-%d')})"
+        return f"[{status}] {self.title} ({clock.format_date(self.created_at)})"
@@ -0,0 +1,173 @@
+import json
+import os
+from src import clock
+from typing import Dict, Optional, Tuple
+from src.tracker import Tracker
+from src.supportBox import task_to_dict, task_from_dict, save_tasks_to_file, load_tasks_from_file
+
+
+# Zwraca nazwę pliku tymczasowego z zachowanym rozszerzeniem (format wybierany po rozszerzeniu).
+def _temp_name(filename: str) -> str:
+    root, ext = os.path.splitext(filename)
+    return f"{root}.tmp{ext}"
+
+
+class TrackerJournal:
+    # Dziennik zmian trackera (write-ahead log w formacie JSON Lines).
+    # Każda operacja (dodanie, usunięcie, zmiana statusu, terminu lub tekstu, czyszczenie) to jeden
+    # wiersz, więc koszt zapisu zależy od zmiany, a nie od liczby zadań. Wiersze są buforowane
+    # i zapisywane z fsync co `batch_size` operacji – awaria traci najwyżej ostatnią partię.
+    # Co `compact_every` operacji stan jest zrzucany do migawki, a dziennik czyszczony.
+    def __init__(self, tracker: Tracker, journal_path: str, snapshot_path: str,
+                 batch_size: int = 100, compact_every: Optional[int] = 100_000,
+                 _ids: Optional[Dict[int, int]] = None):
+        self.tracker = tracker
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.batch_size = batch_size
+        self.compact_every = compact_every
+        self._ids: Dict[int, int] = dict(_ids or {})
+        self._next_id = max(self._ids.values(), default=-1) + 1
+        self._buffer: list = []
+        self._since_compaction = 0
+        self._file = open(journal_path, "a", encoding="utf-8")
+        tracker.add_listener(self)
+
+    # --- zdarzenia trackera ---
+
+    def task_added(self, key, task):
+        if key in self._ids:
+            return
+        self._ids[key] = self._next_id
+        self._log({"op": "add", "id": self._next_id, "task": task_to_dict(task)})
+        self._next_id += 1
+
+    def task_removed(self, key, task):
+        self._log({"op": "remove", "id": self._ids.pop(key)})
+
+    def task_changed(self, key, task, field, old, new):
+        if field == "completed":
+            self._log({"op": "complete" if new else "uncomplete", "id": self._ids[key]})
+        elif field == "due_date":
+            self._log({"op": "due", "id": self._ids[key],
+                       "due_date": new.isoformat() if new else None})
+        elif field in ("title", "description"):
+            self._log({"op": "set", "id": self._ids[key], "field": field, "value": new})
+        elif field == "recurrence":
+            self._log({"op": "set", "id": self._ids[key], "field": field,
+                       "value": None if new is None else str(new)})
+        elif field == "created_at":
+            self._log({"op": "created", "id": self._ids[key], "created_at": new.isoformat()})
+
+    def tasks_cleared(self):
+        self._ids.clear()
+        self._log({"op": "clear"})
+
+    # --- zapis ---
+
+    def _log(self, entry: dict):
+        self._buffer.append(json.dumps(entry))
+        self._since_compaction += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    # Zapisuje zbuforowane operacje na dysk (z fsync).
+    def flush(self):
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        if self.compact_every and self._since_compaction >= self.compact_every:
+            self.compact()
+
+    # Zrzuca cały stan do migawki i zaczyna pusty dziennik.
+    # Kolejność kroków pozwala dokończyć lub wycofać kompaktowanie po awarii (zob. open_tracker).
+    def compact(self):
+        self._buffer.clear()
+        snapshot_tmp, journal_tmp = _temp_name(self.snapshot_path), self.journal_path + ".tmp"
+        save_tasks_to_file(self.tracker.tasks, snapshot_tmp)
+        _fsync_file(snapshot_tmp)
+        open(journal_tmp, "w").close()
+        os.replace(snapshot_tmp, self.snapshot_path)
+        self._file.close()
+        os.replace(journal_tmp, self.journal_path)
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        self._ids = {key: i for i, key in enumerate(self.tracker._entries)}
+        self._next_id = len(self._ids)
+        self._since_compaction = 0
+
+    # Zapisuje bufor i zamyka plik dziennika (tracker przestaje być śledzony).
+    def close(self):
+        compact_every, self.compact_every = self.compact_every, None
+        self.flush()
+        self.compact_every = compact_every
+        self._file.close()
+        self.tracker.remove_listener(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _fsync_file(filename: str):
+    with open(filename, "rb") as f:
+        os.fsync(f.fileno())
+
+
+# Odtwarza tracker z migawki i dziennika, a następnie podłącza do niego nowy dziennik.
+def open_tracker(journal_path: str, snapshot_path: str, **options) -> Tuple[Tracker, TrackerJournal]:
+    _recover_compaction(journal_path, snapshot_path)
+    tracker = Tracker()
+    keys: Dict[int, int] = {}
+    if os.path.exists(snapshot_path):
+        tracker.add_tasks(load_tasks_from_file(snapshot_path))
+        keys = {i: key for i, key in enumerate(tracker._entries)}
+    if os.path.exists(journal_path):
+        _replay(tracker, journal_path, keys)
+    ids = {key: journal_id for journal_id, key in keys.items()}
+    return tracker, TrackerJournal(tracker, journal_path, snapshot_path, _ids=ids, **options)
+
+
+# Dokańcza albo wycofuje kompaktowanie przerwane awarią.
+def _recover_compaction(journal_path: str, snapshot_path: str):
+    snapshot_tmp, journal_tmp = _temp_name(snapshot_path), journal_path + ".tmp"
+    if os.path.exists(snapshot_tmp):
+        os.remove(snapshot_tmp)
+        if os.path.exists(journal_tmp):
+            os.remove(journal_tmp)
+    elif os.path.exists(journal_tmp):
+        os.replace(journal_tmp, journal_path)
+
+
+# Stosuje operacje z dziennika; niepełny ostatni wiersz (przerwany zapis) jest pomijany.
+def _replay(tracker: Tracker, journal_path: str, keys: Dict[int, int]):
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            op = entry["op"]
+            if op == "add":
+                # Zadanie dodane ponownie (ten sam identyfikator) to ta sama karta.
+                task = task_from_dict(entry["task"])
+                tracker.add_task(tracker.get(task.id, task))
+                keys[entry["id"]] = tracker._next_key - 1
+            elif op == "remove":
+                tracker._remove_entry(keys.pop(entry["id"]))
+            elif op in ("complete", "uncomplete"):
+                tracker._entries[keys[entry["id"]]].completed = op == "complete"
+            elif op == "due":
+                due_date = entry["due_date"]
+                tracker._entries[keys[entry["id"]]].due_date = (
+                    clock.parse_iso(due_date) if due_date else None)
+            elif op == "set":
+                setattr(tracker._entries[keys[entry["id"]]], entry["field"], entry["value"])
+            elif op == "created":
+                tracker._entries[keys[entry["id"]]].created_at = clock.parse_timestamp(entry["created_at"])
+            elif op == "clear":
+                tracker.clear_all()
+                keys.clear()
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+from src import clock
+
+# Obsługiwane częstotliwości – stały krok, więc n-te wystąpienie liczy się w O(1).
+FREQUENCIES = {"hourly": timedelta(hours=1), "daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+
+
+class Recurrence:
+    # Reguła powtarzania zadania: co `interval` jednostek częstotliwości, opcjonalnie do `until`.
+    # Seria zaczyna się w terminie zadania; wystąpienia są wyliczane na żądanie (generatorem)
+    # tylko w zadanym oknie – pełna seria nigdy nie jest budowana.
+    # Zapis tekstowy: "daily", "weekly/2" albo "daily/1/2030-06-30T00:00:00".
+    __slots__ = ("frequency", "interval", "until", "step")
+
+    def __init__(self, frequency: str = "daily", interval: int = 1, until: Optional[datetime] = None):
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        if not isinstance(interval, int) or interval < 1:
+            raise ValueError("Interval must be a positive integer.")
+        self.frequency = frequency
+        self.interval = interval
+        self.until = until
+        self.step = FREQUENCIES[frequency] * interval
+
+    # Odczytuje regułę z zapisu tekstowego (jak w pliku zadań).
+    @classmethod
+    def parse(cls, text: str) -> "Recurrence":
+        parts = text.split("/")
+        try:
+            frequency = parts[0]
+            interval = int(parts[1]) if len(parts) > 1 else 1
+            until = clock.parse_timestamp(parts[2]) if len(parts) > 2 else None
+        except ValueError:
+            raise ValueError(f"Invalid recurrence rule: {text}")
+        if len(parts) > 3:
+            raise ValueError(f"Invalid recurrence rule: {text}")
+        return cls(frequency, interval, until)
+
+    def __str__(self):
+        text = self.frequency if self.interval == 1 and self.until is None else f"{self.frequency}/{self.interval}"
+        return text if self.until is None else f"{text}/{self.until.isoformat()}"
+
+    def __repr__(self):
+        return f"Recurrence({self.frequency!r}, {self.interval}, {self.until!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Recurrence):
+            return NotImplemented
+        return (self.frequency, self.interval, self.until) == (other.frequency, other.interval, other.until)
+
+    def __hash__(self):
+        return hash((self.frequency, self.interval, self.until))
+
+    # Pierwsze wystąpienie serii zaczynającej się w `start`, nie wcześniejsze niż `moment`
+    # (None, jeśli seria kończy się wcześniej).
+    def first_at_or_after(self, start: datetime, moment: datetime) -> Optional[datetime]:
+        when = start
+        if moment > start:
+            when = start + -(-(moment - start) // self.step) * self.step
+        return None if self.until is not None and when > self.until else when
+
+    # Wystąpienie następujące po `when` (None po końcu serii).
+    def next_after(self, when: datetime) -> Optional[datetime]:
+        when += self.step
+        return None if self.until is not None and when > self.until else when
+
+    # Wystąpienia serii zaczynającej się w `start`, mieszczące się w przedziale [window_start, window_end].
+    def occurrences(self, start: datetime, window_start: datetime, window_end: datetime) -> Iterator[datetime]:
+        when = self.first_at_or_after(start, window_start)
+        while when is not None and when <= window_end:
+            yield when
+            when = self.next_after(when)
+
+
+# Wpisy zadań powtarzanych (klucz, bieżący termin, reguła), których termin jest przed oknem
+# [start, end], a kolejne wystąpienie mieści się w oknie – jako pary (wystąpienie, klucz).
+# Wpisy z terminem w oknie znajduje zwykły indeks terminów, więc nie są tu powtarzane.
+# Wspólne dla wszystkich trackerów (get_tasks_due_between).
+def next_in_window(series: Iterable[Tuple[object, datetime, Recurrence]], start: datetime,
+                   end: datetime) -> List[Tuple[datetime, object]]:
+    found = []
+    for key, due, rule in series:
+        if due < start:
+            when = rule.first_at_or_after(due, start)
+            if when is not None and when <= end:
+                found.append((when, key))
+    return found
@@ -0,0 +1,158 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, List
+from src.itemCard import itemCard
+
+_WORD = re.compile(r"\w+")
+# Litery, których NFKD nie rozkłada na literę bazową i znak diakrytyczny.
+_FOLD = str.maketrans({"ł": "l", "Ł": "l", "đ": "d", "ø": "o", "ß": "ss"})
+TITLE_WEIGHT = 2
+
+
+# Dzieli tekst na słowa: małe litery, bez polskich znaków diakrytycznych ("Łódź" -> "lodz").
+def tokenize(text) -> List[str]:
+    if not isinstance(text, str) or not text:
+        return []
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text.translate(_FOLD))
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _WORD.findall(text)
+
+
+class SearchIndex:
+    # Odwrócony indeks słów z tytułów i opisów zadań trackera.
+    # Dla każdego słowa trzyma wpisy trackera z wagą (słowo w tytule liczy się podwójnie),
+    # a posortowany słownik słów pozwala szukać po prefiksie przez bisect. Słownik jest
+    # porządkowany leniwie – dopiero przy wyszukiwaniu po prefiksie.
+    def __init__(self, tracker):
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._terms: Dict[int, Counter] = {}
+        self._vocabulary: List[str] = []
+        self._new_words: List[str] = []
+        self._stale_words: set = set()
+        self._tasks: Dict[int, itemCard] = {}
+        tracker.add_listener(self)
+
+    # --- aktualizacje wywoływane przez Tracker ---
+
+    def task_added(self, key, task: itemCard):
+        terms = Counter()
+        for token in tokenize(task.title):
+            terms[token] += TITLE_WEIGHT
+        for token in tokenize(task.description):
+            terms[token] += 1
+        self._tasks[key] = task
+        self._terms[key] = terms
+        for token, weight in terms.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                if token in self._stale_words:
+                    self._stale_words.discard(token)  # słowo wciąż jest w słowniku
+                else:
+                    self._new_words.append(token)
+            posting[key] = weight
+
+    def task_removed(self, key, task: itemCard):
+        del self._tasks[key]
+        for token in self._terms.pop(key):
+            posting = self._postings[token]
+            del posting[key]
+            if not posting:
+                del self._postings[token]
+                self._stale_words.add(token)
+
+    def task_changed(self, key, task: itemCard, field, old, new):
+        if field in ("title", "description"):
+            self.task_removed(key, task)
+            self.task_added(key, task)
+
+    def tasks_cleared(self):
+        self._postings.clear()
+        self._terms.clear()
+        self._vocabulary.clear()
+        self._new_words.clear()
+        self._stale_words.clear()
+        self._tasks.clear()
+
+    # --- wyszukiwanie ---
+
+    # Słowa zaczynające się od prefiksu (zakres w posortowanym słowniku).
+    # Usunięte słowa mogą jeszcze być w słowniku – pomija je brak listy wpisów.
+    def _expand(self, prefix: str) -> List[str]:
+        self._sort_vocabulary()
+        start = bisect_left(self._vocabulary, prefix)
+        end = bisect_left(self._vocabulary, prefix + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+
+    # Dołącza nowe słowa do posortowanego słownika (pojedynczo albo jednym sortowaniem).
+    def _sort_vocabulary(self):
+        if len(self._stale_words) > len(self._postings) // 2:
+            self._vocabulary = sorted(self._postings)
+            self._new_words.clear()
+            self._stale_words.clear()
+        elif len(self._new_words) > 1000:
+            self._vocabulary.extend(self._new_words)
+            self._vocabulary.sort()
+            self._new_words.clear()
+        elif self._new_words:
+            for word in self._new_words:
+                insort(self._vocabulary, word)
+            self._new_words.clear()
+
+    # Zwraca najlepiej dopasowane zadania. Wszystkie słowa zapytania muszą wystąpić;
+    # przy prefix=True ostatnie słowo może być początkiem słowa ("zak" znajdzie "zakupy").
+    # Ranking: suma wag słów razy idf (rzadsze słowa ważą więcej).
+    # Kandydatów wyznacza słowo o najkrótszej liście wpisów, pozostałe są tylko sprawdzane.
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[itemCard]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        total = len(self._tasks)
+        terms = []
+        for i, token in enumerate(tokens):
+            words = self._expand(token) if prefix and i == len(tokens) - 1 else [token]
+            postings = [self._postings[word] for word in words if word in self._postings]
+            if not postings:
+                return []
+            weighted = [(posting, math.log(1 + total / len(posting))) for posting in postings]
+            terms.append((sum(len(posting) for posting in postings), weighted))
+        terms.sort(key=lambda term: term[0])
+        driver, rest = terms[0][1], [weighted for _, weighted in terms[1:]]
+
+        def candidates():
+            if len(driver) == 1:
+                posting, idf = driver[0]
+                scored = ((key, weight * idf) for key, weight in posting.items())
+            else:
+                scores: Dict[int, float] = {}
+                for posting, idf in driver:
+                    for key, weight in posting.items():
+                        scores[key] = scores.get(key, 0.0) + weight * idf
+                scored = scores.items()
+            for key, score in scored:
+                for weighted in rest:
+                    extra = 0.0
+                    for posting, idf in weighted:
+                        weight = posting.get(key)
+                        if weight:
+                            extra += weight * idf
+                    if not extra:
+                        break
+                    score += extra
+                else:
+                    yield score, -key
+
+        # To samo zadanie dodane kilka razy zwracamy raz (gdy trzeba, bierzemy więcej kandydatów).
+        size = limit
+        while True:
+            best = heapq.nlargest(size, candidates()) if limit else sorted(candidates(), reverse=True)
+            result = list(dict.fromkeys(self._tasks[-key] for _, key in best))
+            if not limit or len(result) >= limit or len(best) < size:
+                return result[:limit] if limit else result
+            size *= 2
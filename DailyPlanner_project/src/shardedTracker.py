@@ -0,0 +1,322 @@
+import multiprocessing
+import os
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from math import inf
+from typing import Dict, Iterable, List, Optional
+from src import clock
+from src.itemCard import itemCard
+from src.recurrence import next_in_window
+from src.taskTable import to_micros
+from src.tracker import Tracker
+
+
+# Pętla procesu roboczego: obsługuje partie operacji i zapytania koordynatora.
+def _worker(conn):
+    shard = _ShardWorker()
+    while True:
+        message = conn.recv()
+        command = message[0]
+        if command == "ops":
+            shard.apply(message[1])
+        elif command == "query":
+            conn.send(shard.query(*message[1:]))
+        elif command == "close":
+            conn.close()
+            return
+
+
+# Pola zadania w kolejności argumentów itemCard._from_fields.
+def _fields(task: itemCard) -> tuple:
+    return (task.title, task.description, task.due_date, task.completed, task.created_at, task.id,
+            task.recurrence)
+
+
+class _ShardWorker:
+    # Stan procesu roboczego: własny Tracker z zadaniami jednej części – jedyna pełna kopia stanu
+    # tych zadań (koordynator trzyma tylko słabe referencje). Tracker numeruje wpisy po kolei
+    # (lokalnie), a słownik tłumaczy klucze lokalne na klucze koordynatora; obie numeracje rosną
+    # razem, więc kolejność się zgadza. Zadania są wskazywane przez koordynatora identyfikatorem.
+    def __init__(self):
+        self.tracker = Tracker()
+        self.global_keys: Dict[int, int] = {}
+
+    # Stosuje partię operacji; kolejne dodania trafiają do trackera jednym add_tasks.
+    def apply(self, ops):
+        added = []
+        for op in ops:
+            if op[0] == "add":
+                added.append(op)
+                continue
+            if added:
+                self._add(added)
+                added = []
+            kind = op[0]
+            if kind == "remove":
+                # najstarszy wpis zadania, jak Tracker.remove_task
+                local = self.tracker._keys[self.tracker.get(op[1])][0]
+                del self.global_keys[local]
+                self.tracker._remove_entry(local)
+            elif kind == "set":
+                setattr(self.tracker.get(op[1]), op[2], op[3])
+            elif kind == "clear":
+                self.tracker.clear_all()
+                self.global_keys.clear()
+        if added:
+            self._add(added)
+
+    # Kolejne wpisy tego samego zadania (ten sam identyfikator) wskazują na jedną kopię.
+    def _add(self, ops):
+        local = self.tracker._next_key
+        copies: Dict[int, itemCard] = {}
+        tasks = []
+        for _, key, fields in ops:
+            self.global_keys[local] = key
+            local += 1
+            task_id = fields[5]
+            task = self.tracker.get(task_id) or copies.get(task_id)
+            if task is None:
+                task = copies[task_id] = itemCard._from_fields(*fields)
+            tasks.append(task)
+        self.tracker.add_tasks(tasks)
+
+    # Zwraca kolumny pasujących wpisów jako tablice liczb (szybkie przesyłanie między procesami):
+    # klucze koordynatora i identyfikatory, a dla zapytań o termin najpierw termin (to_micros).
+    # Zapytanie "records" zwraca pola zadań o podanych identyfikatorach.
+    def query(self, name, *args):
+        keys, entries = self.global_keys, self.tracker._entries
+        if name == "records":
+            return {task_id: _fields(self.tracker.get(task_id)) for task_id in args[0]}
+        if name in ("all", "completed"):
+            part = entries if name == "all" else self.tracker._ordered(args[0])
+            return array("q", map(keys.__getitem__, part)), array("q", [task.id for task in part.values()])
+        index = self.tracker._due_index
+        if name == "overdue":
+            selected = index[:bisect_left(index, (args[0],))]
+        elif name == "between":
+            start, end = args
+            selected = index[bisect_left(index, (start,)):bisect_right(index, (end, inf))]
+            later = next_in_window(((local, task.due_date, task._recurrence)
+                                    for local, task in self.tracker._recurring.items()), start, end)
+            if later:
+                selected = sorted(selected + later)
+        else:
+            raise ValueError(f"Unknown query: {name}")
+        return (array("q", [to_micros(due) for due, _ in selected]),
+                array("q", [keys[local] for _, local in selected]),
+                array("q", [entries[local].id for _, local in selected]))
+
+
+class ShardedTracker:
+    # Tracker rozdzielony na `workers` procesów (każdy z własnym Trackerem i własnym rdzeniem).
+    # Koordynator (ten obiekt) nadaje wpisom klucze, kieruje operacje do procesu wybranego wg
+    # identyfikatora zadania (wszystkie wpisy zadania trafiają do tego samego procesu),
+    # rozsyła zapytania do wszystkich procesów i scala ich posortowane wyniki.
+    # Stan zadań mają tylko procesy. Koordynator pamięta liczbę wpisów każdego identyfikatora
+    # i słabe referencje do zadań (mapa tożsamości jak w SQLiteTracker): zapytanie zwraca obiekt,
+    # który ktoś jeszcze trzyma, a pola pozostałych zadań pobiera z procesów i tworzy z nich nowe
+    # obiekty. Zadania nie są więc trzymane w pamięci dwa razy; ceną jest odtwarzanie zadań,
+    # których nikt już nie trzyma, przy każdym zapytaniu, które je zwraca.
+    # Operacje są wysyłane partiami (`batch_size`) bez czekania na odpowiedź; przed każdym
+    # zapytaniem zaległe partie są wysyłane, więc wyniki zawsze uwzględniają wcześniejsze zmiany.
+    # Zmiany pól zadań (np. mark_completed) są przekazywane do procesów automatycznie.
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 1000):
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Number of workers must be positive.")
+        self.batch_size = batch_size
+        self._refs: Dict[int, weakref.ref] = {}
+        self._counts: Dict[int, int] = {}
+        self._size = 0
+        self._next_key = 0
+        self._conns = []
+        self._processes = []
+        self._pending: List[list] = [[] for _ in range(workers)]
+        for _ in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    # --- kierowanie operacji ---
+
+    def _shard(self, task: itemCard) -> int:
+        return task.id % len(self._conns)
+
+    def _send(self, shard: int, op: tuple):
+        pending = self._pending[shard]
+        pending.append(op)
+        if len(pending) >= self.batch_size:
+            self._flush(shard)
+
+    def _flush(self, shard: int):
+        if self._pending[shard]:
+            self._conns[shard].send(("ops", self._pending[shard]))
+            self._pending[shard] = []
+
+    # Wysyła zapytanie do wszystkich procesów naraz i zbiera odpowiedzi (liczone równolegle).
+    def _fan_out(self, *query) -> list:
+        for shard, conn in enumerate(self._conns):
+            self._flush(shard)
+            conn.send(("query",) + query)
+        return [conn.recv() for conn in self._conns]
+
+    # --- zmiany ---
+
+    def add_task(self, task: itemCard):
+        self.add_tasks([task])
+
+    def add_tasks(self, tasks: Iterable[itemCard]):
+        tasks = list(tasks)
+        refs, counts, new_ids = self._refs, self._counts, {}
+        for task in tasks:
+            if not isinstance(task, itemCard):
+                raise TypeError("Can only add Task instances.")
+            other = new_ids.setdefault(task.id, task)
+            if other is not task and other != task:
+                raise ValueError("Another task with the same id is already in the tracker.")
+        for task_id, task in new_ids.items():
+            if task_id in counts and refs[task_id]() != task:
+                raise ValueError("Another task with the same id is already in the tracker.")
+        pending, workers, key = self._pending, len(self._conns), self._next_key
+        for task in tasks:
+            task_id = task.id
+            if task_id in counts:
+                counts[task_id] += 1
+            else:
+                counts[task_id] = 1
+                refs[task_id] = weakref.ref(task)
+                task._attach(self)
+            shard = task_id % workers  # to samo co _shard(task)
+            pending[shard].append(("add", key, _fields(task)))
+            if len(pending[shard]) >= self.batch_size:
+                self._flush(shard)
+            key += 1
+        self._next_key = key
+        self._size += len(tasks)
+
+    # Usuwa zadanie (najstarszy wpis, jeśli dodano je kilka razy).
+    def remove_task(self, task: itemCard):
+        if task not in self:
+            raise ValueError("Task not found.")
+        task_id = task.id
+        self._counts[task_id] -= 1
+        if not self._counts[task_id]:
+            del self._counts[task_id]
+            del self._refs[task_id]
+            task._detach(self)
+        self._size -= 1
+        self._send(self._shard(task), ("remove", task_id))
+
+    def get(self, task_id: int, default=None):
+        if task_id not in self._counts:
+            return default
+        return self._resolve([task_id])[0]
+
+    def remove_by_id(self, task_id: int):
+        task = self.get(task_id)
+        if task is None:
+            raise ValueError("Task not found.")
+        self.remove_task(task)
+
+    def clear_all(self):
+        for ref in self._refs.values():
+            task = ref()
+            if task is not None:
+                task._detach(self)
+        self._refs.clear()
+        self._counts.clear()
+        self._size = 0
+        for shard in range(len(self._conns)):
+            self._pending[shard] = [("clear",)]
+            self._flush(shard)
+
+    # Wywoływane przez itemCard po zmianie pola – zmiana trafia do procesu z kopią zadania.
+    def _task_changed(self, task: itemCard, field, old, new):
+        self._send(self._shard(task), ("set", task.id, field, new))
+
+    # --- odczyty ---
+
+    @property
+    def tasks(self) -> List[itemCard]:
+        return self._merged(self._fan_out("all"))
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __contains__(self, task):
+        ref = self._refs.get(task.id) if isinstance(task, itemCard) else None
+        return ref is not None and ref() == task
+
+    def get_completed_tasks(self) -> List[itemCard]:
+        return self._merged(self._fan_out("completed", True))
+
+    def get_uncompleted_tasks(self) -> List[itemCard]:
+        return self._merged(self._fan_out("completed", False))
+
+    # Zadania po terminie (posortowane wg terminu); czas jest odczytywany raz, w koordynatorze.
+    def get_overdue_tasks(self) -> List[itemCard]:
+        return self._merged(self._fan_out("overdue", clock.now()))
+
+    def get_tasks_due_within(self, hours: float) -> List[itemCard]:
+        now = clock.now()
+        return self.get_tasks_due_between(now, now + timedelta(hours=hours))
+
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[itemCard]:
+        return self._merged(self._fan_out("between", start, end))
+
+    # Scala posortowane kolumny z procesów (sortowanie rozpoznaje gotowe serie, więc to w praktyce
+    # scalanie) i zwraca zadania z ostatniej kolumny (identyfikatory).
+    def _merged(self, parts) -> List[itemCard]:
+        rows = []
+        for columns in parts:
+            rows.extend(zip(*columns))
+        rows.sort()
+        return self._resolve([row[-1] for row in rows])
+
+    # Zamienia identyfikatory na zadania: z mapy tożsamości albo nowe obiekty z polami pobranymi
+    # z procesów (jedno zapytanie do każdego procesu, który ma brakujące zadania).
+    def _resolve(self, ids: List[int]) -> List[itemCard]:
+        refs = self._refs
+        tasks = [refs[task_id]() for task_id in ids]
+        missing: Dict[int, set] = {}
+        for task_id, task in zip(ids, tasks):
+            if task is None:
+                missing.setdefault(task_id % len(self._conns), set()).add(task_id)
+        if not missing:
+            return tasks
+        for shard, group in missing.items():
+            self._flush(shard)
+            self._conns[shard].send(("query", "records", list(group)))
+        created = {}
+        for shard in missing:
+            for task_id, fields in self._conns[shard].recv().items():
+                task = created[task_id] = itemCard._from_fields(*fields)
+                task._attach(self)
+                refs[task_id] = weakref.ref(task)
+        return [created[task_id] if task is None else task for task_id, task in zip(ids, tasks)]
+
+    # Zamyka procesy robocze.
+    def close(self):
+        for conn, process in zip(self._conns, self._processes):
+            try:
+                conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+            process.join()
+        self._conns.clear()
+        self._processes.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,130 @@
+import mmap
+import shutil
+import struct
+import tempfile
+from collections.abc import Sequence
+from typing import Dict, Iterable
+from src.itemCard import itemCard
+from src.recurrence import Recurrence
+from src.taskTable import to_micros, from_micros
+
+# Układ pliku (little-endian):
+#   nagłówek:  magic (8 B), liczba zadań (Q), początek sterty napisów (Q)
+#   rekordy:   stała szerokość, jeden na zadanie
+#   sterta:    tytuły, opisy i reguły powtarzania w UTF-8 (opis i reguła zaraz po tytule)
+MAGIC = b"DPSNAP\x00\x03"
+_HEADER = struct.Struct("<8sQQ")
+# offset tytułu na stercie, długość tytułu, długość opisu, termin, utworzenie, identyfikator, flagi,
+# długość zapisu reguły powtarzania (0 – zadanie niepowtarzane)
+_RECORD = struct.Struct("<QIIqqqB3xI")
+# Wersje 1 (bez identyfikatora) i 2 (bez reguły powtarzania) są nadal czytane;
+# z wersji 1 zadania dostają nowe identyfikatory.
+_MAGIC_V2 = b"DPSNAP\x00\x02"
+_RECORD_V2 = struct.Struct("<QIIqqqB7x")
+_MAGIC_V1 = b"DPSNAP\x00\x01"
+_RECORD_V1 = struct.Struct("<QIIqqB7x")
+_RECORDS = {MAGIC: _RECORD, _MAGIC_V2: _RECORD_V2, _MAGIC_V1: _RECORD_V1}
+_COMPLETED = 0x01
+
+
+# Zapisuje zadania do pliku migawki. Rekordy trafiają od razu do pliku, a sterta napisów
+# do pliku tymczasowego dopisywanego na końcu – zużycie pamięci nie zależy od liczby zadań.
+def save_snapshot(tasks: Iterable[itemCard], filename: str):
+    with open(filename, "wb") as f, tempfile.TemporaryFile() as heap:
+        f.write(_HEADER.pack(MAGIC, 0, 0))
+        count = offset = 0
+        for task in tasks:
+            title = task.title.encode("utf-8")
+            description = task.description.encode("utf-8")
+            rule = b"" if task.recurrence is None else str(task.recurrence).encode("utf-8")
+            f.write(_RECORD.pack(offset, len(title), len(description),
+                                 to_micros(task.due_date), to_micros(task.created_at), task.id,
+                                 _COMPLETED if task.completed else 0, len(rule)))
+            heap.write(title)
+            heap.write(description)
+            heap.write(rule)
+            offset += len(title) + len(description) + len(rule)
+            count += 1
+        heap_start = f.tell()
+        heap.seek(0)
+        shutil.copyfileobj(heap, f)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, count, heap_start))
+
+
+class SnapshotView(Sequence):
+    # Leniwy widok na plik migawki zmapowany w pamięci (mmap).
+    # Otwarcie czyta tylko nagłówek; zadanie powstaje przy pierwszym dostępie do rekordu
+    # i jest zapamiętywane, więc kolejne odczyty zwracają ten sam obiekt (także dla rekordów
+    # o tym samym identyfikatorze – zadania zapisanego kilka razy).
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._count, self._heap = _HEADER.unpack_from(self._map, 0)
+        except (ValueError, struct.error):
+            self._file.close()
+            raise ValueError("Not a task snapshot file.")
+        if magic not in _RECORDS:
+            self.close()
+            raise ValueError("Not a task snapshot file.")
+        self._record = _RECORDS[magic]
+        self._cache: Dict[int, itemCard] = {}
+        self._by_id: Dict[int, itemCard] = {}
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Task index out of range.")
+        task = self._cache.get(index)
+        if task is None:
+            task = self._decode(index)
+            task = self._cache[index] = self._by_id.setdefault(task.id, task)
+        return task
+
+    # Odczytuje sam status zadania bez tworzenia obiektu (np. do szybkiego liczenia).
+    def is_completed(self, index: int) -> bool:
+        flags = self._map[_HEADER.size + (index + 1) * self._record.size - 8]
+        return bool(flags & _COMPLETED)
+
+    def _decode(self, index: int) -> itemCard:
+        fields = self._record.unpack_from(self._map, _HEADER.size + index * self._record.size)
+        offset, title_len, desc_len, due, created = fields[:5]
+        if len(fields) == 8:
+            task_id, flags, rule_len = fields[5:]
+        elif len(fields) == 7:
+            task_id, flags, rule_len = fields[5], fields[6], 0
+        else:
+            task_id, flags, rule_len = None, fields[5], 0
+        start = self._heap + offset
+        title = self._map[start:start + title_len].decode("utf-8")
+        start += title_len
+        description = self._map[start:start + desc_len].decode("utf-8")
+        start += desc_len
+        rule = self._map[start:start + rule_len].decode("utf-8")
+        recurrence = Recurrence.parse(rule) if rule else None
+        return itemCard._from_fields(title, description, from_micros(due),
+                                     bool(flags & _COMPLETED), from_micros(created), task_id, recurrence)
+
+    # Zamyka mapowanie pliku (już utworzone zadania pozostają ważne).
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Otwiera plik migawki jako leniwą sekwencję zadań.
+def load_snapshot(filename: str) -> SnapshotView:
+    return SnapshotView(filename)
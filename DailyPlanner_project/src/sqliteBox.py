@@ -0,0 +1,349 @@
+import os
+import sqlite3
+import weakref
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional
+from src import clock
+from src.cursorQuery import ORDERS, Page, decode_cursor, encode_cursor
+from src.itemCard import itemCard
+from src.recurrence import Recurrence, next_in_window
+from src.taskTable import to_micros, from_micros
+
+# Daty są zapisywane jako liczby mikrosekund (to_micros), więc porządek w indeksach to porządek dat.
+# Brak terminu to NULL. Kolumna `key` numeruje wpisy jak klucze Trackera (kolejność dodania).
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key INTEGER PRIMARY KEY,
+    id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    due_date INTEGER,
+    completed INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    recurrence TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_id ON tasks (id);
+CREATE INDEX IF NOT EXISTS tasks_completed ON tasks (completed, key);
+CREATE INDEX IF NOT EXISTS tasks_due_date ON tasks (due_date, key);
+CREATE INDEX IF NOT EXISTS tasks_created_at ON tasks (created_at, key);
+CREATE INDEX IF NOT EXISTS tasks_completed_due_date ON tasks (completed, due_date, key);
+CREATE INDEX IF NOT EXISTS tasks_completed_created_at ON tasks (completed, created_at, key);
+"""
+_COLUMNS = "id, title, description, due_date, completed, created_at, recurrence"
+_INSERT = f"INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+# Limit parametrów w jednym zapytaniu (starsze wersje SQLite pozwalają na 999).
+_CHUNK = 500
+
+
+def _connect(filename: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(filename)
+    conn.executescript(_SCHEMA)
+    # Bazy zapisane przed wprowadzeniem zadań powtarzanych nie mają kolumny reguły.
+    if "recurrence" not in {column[1] for column in conn.execute("PRAGMA table_info(tasks)")}:
+        conn.execute("ALTER TABLE tasks ADD COLUMN recurrence TEXT")
+        conn.commit()
+    # Częściowy indeks tylko zadań powtarzanych (zwykle nieliczne) – dla zapytań o przedział.
+    conn.execute("CREATE INDEX IF NOT EXISTS tasks_recurring ON tasks (due_date) "
+                 "WHERE recurrence IS NOT NULL")
+    conn.commit()
+    return conn
+
+# Zamienia zadanie na wiersz tabeli (w kolejności _COLUMNS).
+def _row(task: itemCard) -> tuple:
+    due = task.due_date
+    return (task.id, task.title, task.description, None if due is None else to_micros(due),
+            1 if task.completed else 0, to_micros(task.created_at), _rule(task.recurrence))
+
+def _rule(recurrence) -> Optional[str]:
+    return None if recurrence is None else str(recurrence)
+
+def _micros(value: Optional[datetime]) -> Optional[int]:
+    return None if value is None else to_micros(value)
+
+
+# Zapisuje zadania do bazy SQLite, zastępując jej zawartość (w jednej transakcji – przy błędzie
+# plik zostaje bez zmian). Wiersze są wstawiane strumieniowo, bez budowania listy.
+def save_tasks_to_db(tasks: Iterable[itemCard], filename: str):
+    conn = _connect(filename)
+    try:
+        with conn:
+            conn.execute("DELETE FROM tasks")
+            conn.executemany(_INSERT, (_row(task) for task in tasks))
+    finally:
+        conn.close()
+
+# Zwraca generator rekordów z bazy w formacie supportBox.task_to_dict (w kolejności dodania).
+def iter_db_records(filename: str) -> Iterator[dict]:
+    if not os.path.exists(filename):
+        raise FileNotFoundError(filename)
+    conn = _connect(filename)
+    try:
+        for task_id, title, description, due, completed, created, rule in conn.execute(
+                f"SELECT {_COLUMNS} FROM tasks ORDER BY key"):
+            record = {
+                "id": task_id,
+                "title": title,
+                "description": description,
+                "due_date": None if due is None else from_micros(due).isoformat(),
+                "completed": bool(completed),
+                "created_at": from_micros(created).isoformat(),
+            }
+            if rule:
+                record["recurrence"] = rule
+            yield record
+    finally:
+        conn.close()
+
+
+class SQLiteTracker:
+    # Tracker w trybie "backed": zadania są w bazie SQLite, a w pamięci są tylko te, których
+    # ktoś właśnie używa. Filtry to zapytania SQL korzystające z indeksów (status, termin, data
+    # utworzenia), więc zbiór zadań może być większy niż pamięć.
+    # Mapa tożsamości (słabe referencje, identyfikator -> zadanie) sprawia, że to samo zadanie
+    # wczytane kilka razy jest jednym obiektem, a jego zmiany (np. mark_completed) trafiają do bazy.
+    # Zmiany są wykonywane od razu, ale zatwierdzane co `batch_size` operacji (jedna transakcja
+    # zamiast zapisu na dysk przy każdej zmianie); commit() i close() zatwierdzają resztę.
+    # Zapytania widzą też zmiany jeszcze niezatwierdzone.
+    def __init__(self, filename: str, batch_size: int = 1000):
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive.")
+        self.filename = filename
+        self.batch_size = batch_size
+        self._conn = _connect(filename)
+        self._cards = weakref.WeakValueDictionary()
+        self._uncommitted = 0
+
+    # --- transakcje ---
+
+    def _written(self, count: int):
+        self._uncommitted += count
+        if self._uncommitted >= self.batch_size:
+            self.commit()
+
+    # Zatwierdza zaległe zmiany.
+    def commit(self):
+        self._conn.commit()
+        self._uncommitted = 0
+
+    # Zatwierdza zmiany i zamyka bazę; zadania przestają być śledzone.
+    def close(self):
+        if self._conn is None:
+            return
+        for task in list(self._cards.values()):
+            task._detach(self)
+        self._cards.clear()
+        self.commit()
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- zmiany ---
+
+    def add_task(self, task: itemCard):
+        self.add_tasks([task])
+
+    # Dodaje wiele zadań jednym executemany. Inne zadanie o tym samym identyfikatorze nie może
+    # być już w bazie (sprawdzane zapytaniami po indeksie identyfikatorów przed zmianami).
+    def add_tasks(self, tasks: Iterable[itemCard]):
+        tasks = list(tasks)
+        new_ids = {}
+        for task in tasks:
+            if not isinstance(task, itemCard):
+                raise TypeError("Can only add Task instances.")
+            other = new_ids.setdefault(task.id, task)
+            if other is not task and other != task:
+                raise ValueError("Another task with the same id is already in the tracker.")
+        for task_id in self._stored_ids(list(new_ids)):
+            other = self.get(task_id)
+            if other is not new_ids[task_id] and other != new_ids[task_id]:
+                raise ValueError("Another task with the same id is already in the tracker.")
+        self._conn.executemany(_INSERT, [_row(task) for task in tasks])
+        for task_id, task in new_ids.items():
+            self._cards[task_id] = task
+            task._attach(self)
+        self._written(len(tasks))
+
+    def _stored_ids(self, ids: List[int]) -> List[int]:
+        found = []
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start:start + _CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            found.extend(row[0] for row in self._conn.execute(
+                f"SELECT DISTINCT id FROM tasks WHERE id IN ({marks})", chunk))
+        return found
+
+    # Usuwa zadanie (najstarszy wpis, jeśli dodano je kilka razy).
+    def remove_task(self, task: itemCard):
+        if self._cards.get(task.id) is not task:
+            raise ValueError("Task not found.")
+        self._conn.execute("DELETE FROM tasks WHERE key = (SELECT MIN(key) FROM tasks WHERE id = ?)",
+                           (task.id,))
+        if self._conn.execute("SELECT 1 FROM tasks WHERE id = ? LIMIT 1", (task.id,)).fetchone() is None:
+            del self._cards[task.id]
+            task._detach(self)
+        self._written(1)
+
+    # Zwraca zadanie o podanym identyfikatorze (wczytane z bazy, jeśli nie ma go w pamięci).
+    def get(self, task_id: int, default=None):
+        task = self._cards.get(task_id)
+        if task is not None:
+            return task
+        row = self._conn.execute(f"SELECT {_COLUMNS} FROM tasks WHERE id = ? LIMIT 1", (task_id,)).fetchone()
+        return default if row is None else self._task(row)
+
+    def remove_by_id(self, task_id: int):
+        task = self.get(task_id)
+        if task is None:
+            raise ValueError("Task not found.")
+        self.remove_task(task)
+
+    def clear_all(self):
+        for task in list(self._cards.values()):
+            task._detach(self)
+        self._cards.clear()
+        self._conn.execute("DELETE FROM tasks")
+        self._written(1)
+
+    # Wywoływane przez itemCard po zmianie pola – zmiana trafia do wszystkich wpisów zadania.
+    def _task_changed(self, task: itemCard, field, old, new):
+        if field in ("due_date", "created_at"):
+            new = _micros(new)
+        elif field == "completed":
+            new = 1 if new else 0
+        elif field == "recurrence":
+            new = _rule(new)
+        elif field not in ("title", "description"):
+            return
+        self._conn.execute(f"UPDATE tasks SET {field} = ? WHERE id = ?", (new, task.id))
+        self._written(1)
+
+    # --- odczyty ---
+
+    # Zwraca zadanie dla wiersza – z mapy tożsamości albo nowo utworzone.
+    def _task(self, row) -> itemCard:
+        task_id, title, description, due, completed, created, rule = row
+        task = self._cards.get(task_id)
+        if task is None:
+            task = itemCard._from_fields(title, description, None if due is None else from_micros(due),
+                                         bool(completed), from_micros(created), task_id,
+                                         Recurrence.parse(rule) if rule else None)
+            task._attach(self)
+            self._cards[task_id] = task
+        return task
+
+    def _select(self, where: str = "", params: tuple = (), order: str = "key") -> List[itemCard]:
+        sql = f"SELECT {_COLUMNS} FROM tasks {where} ORDER BY {order}"
+        return [self._task(row) for row in self._conn.execute(sql, params)]
+
+    def _count(self, where: str = "", params: tuple = ()) -> int:
+        return self._conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+
+    @property
+    def tasks(self) -> List[itemCard]:
+        return self._select()
+
+    def __len__(self):
+        return self._count()
+
+    # Przechodzi po zadaniach partiami (w pamięci jest tylko bieżąca partia wierszy).
+    def __iter__(self) -> Iterator[itemCard]:
+        cursor = self._conn.execute(f"SELECT {_COLUMNS} FROM tasks ORDER BY key")
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._task(row)
+
+    def __contains__(self, task):
+        return isinstance(task, itemCard) and self._cards.get(task.id) is task
+
+    def get_completed_tasks(self) -> List[itemCard]:
+        return self._select("WHERE completed = 1")
+
+    def get_uncompleted_tasks(self) -> List[itemCard]:
+        return self._select("WHERE completed = 0")
+
+    def get_overdue_tasks(self) -> List[itemCard]:
+        return self._select("WHERE due_date < ?", (to_micros(clock.now()),), "due_date, key")
+
+    def get_tasks_due_within(self, hours: float) -> List[itemCard]:
+        now = clock.now()
+        return self.get_tasks_due_between(now, now + timedelta(hours=hours))
+
+    # Jak Tracker: zadanie powtarzane z terminem przed przedziałem trafia do wyniku, jeśli jego
+    # kolejne wystąpienie mieści się w przedziale (reguły są czytane przez indeks częściowy).
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[itemCard]:
+        found = [(row[3], row[7], row) for row in self._conn.execute(
+            f"SELECT {_COLUMNS}, key FROM tasks WHERE due_date BETWEEN ? AND ? ORDER BY due_date, key",
+            (to_micros(start), to_micros(end)))]
+        series = self._conn.execute(f"SELECT {_COLUMNS}, key FROM tasks "
+                                    "WHERE recurrence IS NOT NULL AND due_date < ?", (to_micros(start),))
+        later = next_in_window((((row[7], row), from_micros(row[3]), Recurrence.parse(row[6]))
+                                for row in series), start, end)
+        if later:
+            found = sorted(found + [(to_micros(when), key, row) for when, (key, row) in later])
+        return [self._task(row[:7]) for _, _, row in found]
+
+    def count_completed(self) -> int:
+        return self._count("WHERE completed = 1")
+
+    def count_uncompleted(self) -> int:
+        return self._count("WHERE completed = 0")
+
+    def count_overdue(self) -> int:
+        return self._count("WHERE due_date < ?", (to_micros(clock.now()),))
+
+    def completion_rate(self) -> float:
+        total = len(self)
+        return self.count_completed() / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "total": len(self),
+            "completed": self.count_completed(),
+            "uncompleted": self.count_uncompleted(),
+            "overdue": self.count_overdue(),
+            "completion_rate": self.completion_rate(),
+        }
+
+    # Strona zadań jak Tracker.query. Kursor to pozycja (wartość, klucz) ostatniego wpisu, więc
+    # zapytanie zaczyna od niej w indeksie daty – koszt strony nie zależy od jej numeru.
+    def query(self, order_by: str = "created", descending: bool = False, limit: int = 50,
+              cursor: str = None, completed: bool = None, due_after: datetime = None,
+              due_before: datetime = None, created_after: datetime = None,
+              created_before: datetime = None) -> Page:
+        if order_by not in ORDERS:
+            raise ValueError(f"Unknown order: {order_by}")
+        if limit < 1:
+            raise ValueError("Limit must be positive.")
+        column = ORDERS[order_by]
+        conditions, params = [f"{column} IS NOT NULL"], []
+        if cursor is not None:
+            value, key = decode_cursor(cursor, order_by, descending)
+            conditions.append(f"({column}, key) {'<' if descending else '>'} (?, ?)")
+            params += [to_micros(value), key]
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(1 if completed else 0)
+        for name, bound, op in (("due_date", due_after, ">="), ("due_date", due_before, "<="),
+                                ("created_at", created_after, ">="), ("created_at", created_before, "<=")):
+            if bound is not None:
+                conditions.append(f"{name} {op} ?")
+                params.append(to_micros(bound))
+        direction = "DESC" if descending else "ASC"
+        sql = (f"SELECT {_COLUMNS}, key FROM tasks WHERE {' AND '.join(conditions)} "
+               f"ORDER BY {column} {direction}, key {direction} LIMIT ?")
+        rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            value = last[3] if column == "due_date" else last[5]
+            next_cursor = encode_cursor(order_by, descending, from_micros(value), last[7])
+            del rows[limit:]
+        return Page([self._task(row[:7]) for row in rows], next_cursor)
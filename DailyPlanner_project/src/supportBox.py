@@ -1,36 +1,246 @@
+import asyncio
 import json
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from src import clock, instrumentation
+from typing import Iterable, Iterator, Optional
 from src.itemCard import itemCard
+from src.snapshot import SnapshotView, save_snapshot
+from src.sqliteBox import iter_db_records, save_tasks_to_db
+from src.taskArchive import iter_archive_records, write_archive
+from src.taskTable import TaskTable
+from src.tracker import Tracker
 
 
 # Zamienia obiekt itemCard na słownik (do zapisu w pliku JSON).
+# Reguła powtarzania jest zapisywana tylko dla zadań powtarzanych (w postaci tekstowej).
 def task_to_dict(task: itemCard) -> dict:
-    return {
+    data = {
+        "id": task.id,
         "title": task.title,
         "description": task.description,
         "due_date": task.due_date.isoformat() if task.due_date else None,
         "completed": task.completed,
         "created_at": task.created_at.isoformat()
     }
+    if task.recurrence is not None:
+        data["recurrence"] = str(task.recurrence)
+    return data
 
 # Tworzy obiekt itemCard na podstawie danych ze słownika (np. wczytanych z pliku).
-def task_from_dict(data: dict) -> itemCard:
+# Identyfikator i data utworzenia są odtwarzane z rekordu (starsze pliki ich nie mają –
+# zadanie dostaje wtedy nowy identyfikator i bieżący czas).
+# Z lazy=True rekord nie jest sprawdzany, a daty zostają tekstem ISO do pierwszego odczytu.
+# Błędna data zgłosi ValueError dopiero wtedy.
+def task_from_dict(data: dict, lazy: bool = False) -> itemCard:
+    if lazy:
+        task = itemCard._from_fields(data["title"], data.get("description", ""),
+                                     data["due_date"] or None, bool(data["completed"]),
+                                     data.get("created_at") or clock.now(), data.get("id"))
+        if data.get("recurrence"):
+            task.recurrence = data["recurrence"]
+        return task
     task = itemCard(
         title=data["title"],
         description=data.get("description", ""),
-        due_date=datetime.fromisoformat(data["due_date"]) if data["due_date"] else None
+        due_date=clock.parse_iso(data["due_date"]) if data["due_date"] else None,
+        recurrence=data.get("recurrence")
     )
+    # Status wprost (mark_completed przesunąłby termin zadania powtarzanego).
     if data["completed"]:
-        task.mark_completed()
+        task.completed = True
+    if data.get("created_at"):
+        task.created_at = clock.parse_timestamp(data["created_at"])
+    if data.get("id") is not None:
+        task._id = data["id"]
     return task
 
-# Zapisuje listę zadań do pliku .
-def save_tasks_to_file(tasks: list[itemCard], filename: str):
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump([task_to_dict(t) for t in tasks], f, indent=2)
+# Łączy kilka list zadań (np. wczytanych z dwóch plików) bez powtórzeń – po identyfikatorze.
+# Przy powtórzonym identyfikatorze wygrywa wersja z późniejszej listy; kolejność wyniku to
+# kolejność pierwszego wystąpienia. Koszt liniowy względem łącznej liczby zadań.
+def merge_tasks(*task_lists: Iterable[itemCard]) -> list[itemCard]:
+    merged: dict = {}
+    for tasks in task_lists:
+        for task in tasks:
+            merged[task.id] = task
+    return list(merged.values())
+
+# Zapisuje zadania do pliku (format wybierany po rozszerzeniu: .json, .jsonl, binarna migawka .dps
+# baza SQLite .db/.sqlite albo skompresowane archiwum blokowe .dpz).
+# Zadania są zapisywane po kolei, więc można przekazać dowolny iterator, np. generator.
+# Przy włączonych pomiarach (instrumentation.enable) zapis jest mierzony razem z rozmiarem pliku.
+def save_tasks_to_file(tasks: Iterable[itemCard], filename: str):
+    metrics = instrumentation.metrics
+    if metrics is None:
+        _WRITERS[_format_of(filename)](tasks, filename)
+        return
+    with metrics.timed("save_tasks_to_file"):
+        _WRITERS[_format_of(filename)](tasks, filename)
+    metrics.add_bytes("save_tasks_to_file", written=os.path.getsize(filename))
 
 # Wczytuje listę zadań z pliku i konwertuje je na obiekty itemCard.
-def load_tasks_from_file(filename: str) -> list[itemCard]:
+# Zawsze zwraca listę – także dla migawki .dps (plik jest zamykany po wczytaniu; leniwy widok
+# na zmapowany plik daje snapshot.load_snapshot, używany jako menedżer kontekstu).
+# Rekordy o tym samym identyfikatorze (zadanie dodane do trackera kilka razy) dają jeden obiekt.
+# Z lazy=True daty są parsowane dopiero przy pierwszym odczycie (zob. task_from_dict).
+def load_tasks_from_file(filename: str, lazy: bool = False) -> list[itemCard]:
+    metrics = instrumentation.metrics
+    if metrics is None:
+        return _load_tasks(filename, lazy)
+    with metrics.timed("load_tasks_from_file"):
+        tasks = _load_tasks(filename, lazy)
+    metrics.add_bytes("load_tasks_from_file", read=os.path.getsize(filename))
+    return tasks
+
+def _load_tasks(filename: str, lazy: bool) -> list[itemCard]:
+    fmt = _format_of(filename)
+    if fmt in _LOADERS:
+        return _LOADERS[fmt](filename)
+    with clock.frozen_now():
+        tasks: dict = {}
+        return [tasks.setdefault(task.id, task) for task in iter_tasks_from_file(filename, lazy)]
+
+# Zwraca generator zadań wczytywanych z pliku jedno po drugim (stałe zużycie pamięci).
+def iter_tasks_from_file(filename: str, lazy: bool = False) -> Iterator[itemCard]:
+    for data in iter_task_records(filename):
+        yield task_from_dict(data, lazy)
+
+# Zwraca generator surowych słowników z pliku – do filtrowania i agregacji bez tworzenia itemCard.
+def iter_task_records(filename: str) -> Iterator[dict]:
+    return _READERS[_format_of(filename)](filename)
+
+# Asynchroniczny zapis: serializacja i zapis odbywają się w wątku, więc pętla zdarzeń nie jest
+# blokowana. Lista zadań jest kopiowana przed startem wątku (zmiany listy w trakcie zapisu nie
+# przeszkadzają); zadanie zmienione w trakcie może trafić do pliku ze starą lub nową wartością.
+async def save_tasks_to_file_async(tasks: Iterable[itemCard], filename: str):
+    await asyncio.to_thread(save_tasks_to_file, list(tasks), filename)
+
+# Asynchroniczny odczyt – wczytanie i deserializacja w wątku, poza pętlą zdarzeń.
+async def load_tasks_from_file_async(filename: str, lazy: bool = False) -> list[itemCard]:
+    return await asyncio.to_thread(load_tasks_from_file, filename, lazy)
+
+# Wczytuje wiele plików (shardów) równolegle w puli procesów i łączy je w jeden Tracker.
+# Procesy odsyłają zwarte tabele kolumnowe (TaskTable), a nie listy obiektów itemCard,
+# więc do procesu głównego trafiają tylko napisy i tablice liczb.
+# Z views=True tracker przechowuje lekkie widoki na wspólną tabelę zamiast pełnych itemCard.
+# Wiersze o tym samym identyfikatorze (zadanie zapisane kilka razy albo obecne w kilku shardach)
+# są wpisami jednego zadania – pierwszego wczytanego, jak w load_tasks_from_file.
+def load_many(paths: Iterable[str], workers: Optional[int] = None, views: bool = False) -> Tracker:
+    paths = list(paths)
+    if workers == 1 or len(paths) <= 1:
+        tables = [_load_table(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tables = list(pool.map(_load_table, paths))
+    table = TaskTable()
+    for part in tables:
+        table.extend(part)
+    shared: dict = {}
+    rows = table if views else table.to_tasks()
+    tracker = Tracker()
+    tracker.add_tasks([shared.setdefault(task.id, task) for task in rows])
+    return tracker
+
+# Wczytuje jeden plik do tabeli kolumnowej (uruchamiane w procesie roboczym).
+def _load_table(filename: str) -> TaskTable:
+    table = TaskTable()
+    for data in iter_task_records(filename):
+        table.append_record(data)
+    return table
+
+
+# Rozpoznaje format pliku po rozszerzeniu (nieznane rozszerzenia traktowane są jak JSON).
+def _format_of(filename: str) -> str:
+    ext = os.path.splitext(filename)[1].lower()
+    return ext if ext in _WRITERS else ".json"
+
+# Zapisuje tablicę JSON przyrostowo – wynik jest identyczny z json.dump(..., indent=2).
+def _write_json(tasks: Iterable[itemCard], filename: str):
+    with open(filename, "w", encoding="utf-8") as f:
+        first = True
+        for task in tasks:
+            f.write("[\n  " if first else ",\n  ")
+            f.write(json.dumps(task_to_dict(task), indent=2).replace("\n", "\n  "))
+            first = False
+        f.write("[]" if first else "\n]")
+
+# Zapisuje zadania w formacie JSON Lines (jeden obiekt w wierszu).
+def _write_jsonl(tasks: Iterable[itemCard], filename: str):
+    with open(filename, "w", encoding="utf-8") as f:
+        for task in tasks:
+            f.write(json.dumps(task_to_dict(task)))
+            f.write("\n")
+
+# Zapisuje zadania do archiwum .dpz (bloki JSON Lines kompresowane równolegle, zob. taskArchive).
+def _write_archive(tasks: Iterable[itemCard], filename: str):
+    write_archive((task_to_dict(task) for task in tasks), filename)
+
+# Czyta tablicę JSON element po elemencie, trzymając w pamięci tylko bieżący fragment pliku.
+def _iter_json(filename: str, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    decoder = json.JSONDecoder()
+    with open(filename, "r", encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+
+        # Zwraca indeks pierwszego znaku niebędącego białym znakiem (doczytując plik).
+        def next_char():
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return buf[pos] if pos < len(buf) else ""
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+
+        if next_char() != "[":
+            raise ValueError("Task file must contain a JSON array.")
+        pos += 1
+        expect_item = True
+        while True:
+            char = next_char()
+            if char == "]":
+                return
+            if not expect_item:
+                if char != ",":
+                    raise ValueError("Malformed task file.")
+                pos += 1
+                next_char()
+            while True:
+                try:
+                    data, end = decoder.raw_decode(buf, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buf, pos = buf[pos:] + chunk, 0
+            pos = end
+            expect_item = False
+            yield data
+
+# Czyta plik JSON Lines wiersz po wierszu.
+def _iter_jsonl(filename: str) -> Iterator[dict]:
     with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return [task_from_dict(d) for d in data]
\ No newline at end of file
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+# Wczytuje wszystkie zadania migawki i zamyka plik.
+def _load_snapshot(filename: str) -> list[itemCard]:
+    with SnapshotView(filename) as view:
+        return list(view)
+
+# Czyta rekordy z binarnej migawki bez zapamiętywania utworzonych zadań.
+def _iter_snapshot(filename: str) -> Iterator[dict]:
+    with SnapshotView(filename) as view:
+        for index in range(len(view)):
+            yield task_to_dict(view._decode(index))
+
+
+_WRITERS = {".json": _write_json, ".jsonl": _write_jsonl, ".dps": save_snapshot,
+            ".db": save_tasks_to_db, ".sqlite": save_tasks_to_db, ".dpz": _write_archive}
+_READERS = {".json": _iter_json, ".jsonl": _iter_jsonl, ".dps": _iter_snapshot,
+            ".db": iter_db_records, ".sqlite": iter_db_records, ".dpz": iter_archive_records}
+_LOADERS = {".dps": _load_snapshot}
@@ -0,0 +1,173 @@
+import json
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Optional
+
+try:  # zstd jest opcjonalny: moduł standardowy (Python 3.14+) albo pakiet zstandard
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+# Układ pliku .dpz (little-endian):
+#   nagłówek:  magic (8 B), kodek (B), 7 B wyrównania
+#   bloki:     skompresowane fragmenty JSON Lines (po `block_size` rekordów)
+#   indeks:    dla każdego bloku: początek, długość po kompresji, liczba rekordów
+#   stopka:    początek indeksu, liczba bloków, magic
+# Indeks na końcu pozwala zapisywać bloki strumieniowo i czytać od dowolnego bloku.
+MAGIC = b"DPZARC\x00\x01"
+_HEADER = struct.Struct("<8sB7x")
+_ENTRY = struct.Struct("<QQI")
+_FOOTER = struct.Struct("<QQ8s")
+
+_ZLIB, _ZSTD = 0, 1
+_CODEC_IDS = {"zlib": _ZLIB, "zstd": _ZSTD}
+
+
+def _compressor(codec: int, level: Optional[int]):
+    if codec == _ZSTD:
+        return lambda data: zstd.compress(data, 3 if level is None else level)
+    return lambda data: zlib.compress(data, 6 if level is None else level)
+
+def _decompressor(codec: int):
+    if codec == _ZSTD:
+        if zstd is None:
+            raise ValueError("Archive uses zstd, which is not installed.")
+        return zstd.decompress
+    return zlib.decompress
+
+def _encode_block(records: List[dict]) -> bytes:
+    return "\n".join(json.dumps(record) for record in records).encode("utf-8")
+
+def _decode_block(data: bytes) -> List[dict]:
+    return [json.loads(line) for line in data.decode("utf-8").split("\n")]
+
+def _workers(workers: Optional[int]) -> int:
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be positive.")
+    return workers
+
+
+# Zapisuje rekordy (słowniki jak supportBox.task_to_dict) do archiwum blokowego.
+# Bloki są kompresowane równolegle w puli wątków (zlib i zstd zwalniają GIL podczas kompresji),
+# a w pamięci jest najwyżej 2 * `workers` bloków naraz – zużycie pamięci nie zależy od liczby zadań.
+# codec: "zlib" (zawsze dostępny) albo "zstd" (jeśli zainstalowany).
+def write_archive(records: Iterable[dict], filename: str, codec: str = "zlib", level: Optional[int] = None,
+                  block_size: int = 4096, workers: Optional[int] = None):
+    if codec not in _CODEC_IDS:
+        raise ValueError(f"Unknown codec: {codec}")
+    if codec == "zstd" and zstd is None:
+        raise ValueError("zstd is not installed.")
+    if block_size < 1:
+        raise ValueError("Block size must be positive.")
+    workers = _workers(workers)
+    compress = _compressor(_CODEC_IDS[codec], level)
+    index = []
+    with open(filename, "wb") as f, ThreadPoolExecutor(workers) as pool:
+        f.write(_HEADER.pack(MAGIC, _CODEC_IDS[codec]))
+
+        def write(count, future):
+            data = future.result()
+            index.append((f.tell(), len(data), count))
+            f.write(data)
+
+        in_flight = deque()
+        records = iter(records)
+        while True:
+            block = list(islice(records, block_size))
+            if not block:
+                break
+            in_flight.append((len(block), pool.submit(compress, _encode_block(block))))
+            if len(in_flight) >= 2 * workers:
+                write(*in_flight.popleft())
+        while in_flight:
+            write(*in_flight.popleft())
+        index_start = f.tell()
+        for entry in index:
+            f.write(_ENTRY.pack(*entry))
+        f.write(_FOOTER.pack(index_start, len(index), MAGIC))
+
+
+class ArchiveReader:
+    # Czytnik archiwum .dpz. Otwarcie czyta tylko nagłówek i indeks bloków; bloki są czytane
+    # i rozpakowywane na żądanie. Skumulowane liczby rekordów pozwalają zacząć od dowolnego
+    # rekordu (seek) bez rozpakowywania wcześniejszych bloków.
+    def __init__(self, filename: str, workers: Optional[int] = None):
+        self.workers = _workers(workers)
+        self._file = open(filename, "rb")
+        try:
+            magic, codec = _HEADER.unpack(self._file.read(_HEADER.size))
+            self._file.seek(-_FOOTER.size, os.SEEK_END)
+            index_start, count, end_magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+            if magic != MAGIC or end_magic != MAGIC:
+                raise ValueError("Not a task archive file.")
+            self._file.seek(index_start)
+            raw = self._file.read(count * _ENTRY.size)
+            self._blocks = [_ENTRY.unpack_from(raw, i * _ENTRY.size) for i in range(count)]
+            self._decompress = _decompressor(codec)
+        except (struct.error, OSError, ValueError) as e:
+            self._file.close()
+            raise ValueError("Not a task archive file.") from e
+        # _starts[i] – numer pierwszego rekordu bloku i
+        self._starts = [0] + list(accumulate(entry[2] for entry in self._blocks))
+
+    def __len__(self):
+        return self._starts[-1]
+
+    @property
+    def block_count(self) -> int:
+        return len(self._blocks)
+
+    def _read(self, block: int) -> bytes:
+        offset, length, _ = self._blocks[block]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    # Zwraca rekordy jednego bloku.
+    def read_block(self, block: int) -> List[dict]:
+        return _decode_block(self._decompress(self._read(block)))
+
+    # Zwraca generator rekordów od rekordu numer `start`. Następne bloki są rozpakowywane
+    # w tle (w puli wątków), gdy bieżący jest przetwarzany; odczyt z pliku jest w tym wątku.
+    def iter_records(self, start: int = 0) -> Iterator[dict]:
+        if start >= len(self):
+            return
+        first = bisect_right(self._starts, start) - 1
+        skip = start - self._starts[first]
+        with ThreadPoolExecutor(self.workers) as pool:
+            in_flight = deque()
+            blocks = iter(range(first, len(self._blocks)))
+            for block in islice(blocks, 2 * self.workers):
+                in_flight.append(pool.submit(self._decompress, self._read(block)))
+            while in_flight:
+                records = _decode_block(in_flight.popleft().result())
+                for block in islice(blocks, 1):
+                    in_flight.append(pool.submit(self._decompress, self._read(block)))
+                yield from records[skip:] if skip else records
+                skip = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter_records()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Generator rekordów całego archiwum (plik jest zamykany po przeczytaniu).
+def iter_archive_records(filename: str, start: int = 0) -> Iterator[dict]:
+    with ArchiveReader(filename) as reader:
+        yield from reader.iter_records(start)
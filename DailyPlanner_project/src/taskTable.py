@@ -0,0 +1,231 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+from src import clock
+from src.itemCard import itemCard, _clean_title, _new_id, _parse_due_date
+from src.recurrence import Recurrence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny – kolumny i tak są trzymane w array
+    np = None
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# Wartość oznaczająca brak terminu (największy int64 – "nigdy").
+NO_DATE = 2 ** 63 - 1
+
+
+# Zamienia datetime na liczbę mikrosekund od 1970-01-01 (bez strefy czasowej, dokładnie).
+def to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return NO_DATE
+    return (value - _EPOCH) // _MICROSECOND
+
+# Odwrotność to_micros.
+def from_micros(value: int) -> Optional[datetime]:
+    if value == NO_DATE:
+        return None
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+class TaskTable:
+    # Kolumnowy magazyn zadań: tytuły i opisy w listach, status i daty w zwartych tablicach.
+    # Wiersz zajmuje 25 bajtów plus napisy i referencję reguły powtarzania (zwykle None) –
+    # w sumie ok. 50 B bez napisów, zamiast ok. 190 B pełnego obiektu itemCard z dwoma datetime
+    # (pomiar: benchmarks/bench.py, przypadki TaskTable.append i itemCard.__init__). To zalecany
+    # sposób trzymania dużej liczby zadań; obiekty itemCard tworzy dopiero to_tasks().
+    def __init__(self):
+        self.ids = array("q")
+        self.titles: list[str] = []
+        self.descriptions: list[str] = []
+        self.completed = array("b")
+        self.due = array("q")
+        self.created = array("q")
+        self.recurrences: list[Optional[Recurrence]] = []
+        self._owners: dict[int, list] = {}
+
+    # Tworzy tabelę na podstawie istniejących zadań.
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[itemCard]) -> "TaskTable":
+        table = cls()
+        for task in tasks:
+            table.ids.append(task.id)
+            table.titles.append(task.title)
+            table.descriptions.append(task.description)
+            table.completed.append(1 if task.completed else 0)
+            table.due.append(to_micros(task.due_date))
+            table.created.append(to_micros(task.created_at))
+            table.recurrences.append(task.recurrence)
+        return table
+
+    # Dodaje wiersz (z tą samą walidacją co itemCard) i zwraca jego numer.
+    def append(self, title, description="", due_date=None, completed=False, created_at=None,
+               task_id=None, recurrence=None) -> int:
+        title = _clean_title(title)
+        due = to_micros(_parse_due_date(due_date))
+        if isinstance(recurrence, str):
+            recurrence = Recurrence.parse(recurrence)
+        if recurrence is not None and due == NO_DATE:
+            raise ValueError("Recurring task needs a due date.")
+        self.ids.append(_new_id() if task_id is None else task_id)
+        self.titles.append(title)
+        self.descriptions.append(description.strip())
+        self.completed.append(1 if completed else 0)
+        self.due.append(due)
+        self.created.append(to_micros(created_at or clock.now()))
+        self.recurrences.append(recurrence)
+        return len(self.titles) - 1
+
+    # Dodaje wiersz z rekordu w formacie task_to_dict (np. odczytanego z pliku).
+    def append_record(self, data: dict) -> int:
+        due_date, created_at = data.get("due_date"), data.get("created_at")
+        return self.append(data["title"], data.get("description", ""),
+                           clock.parse_iso(due_date) if due_date else None,
+                           data.get("completed", False),
+                           clock.parse_timestamp(created_at) if created_at else None,
+                           data.get("id"), data.get("recurrence"))
+
+    # Dopisuje na końcu wszystkie wiersze innej tabeli.
+    def extend(self, other: "TaskTable"):
+        self.ids.extend(other.ids)
+        self.titles.extend(other.titles)
+        self.descriptions.extend(other.descriptions)
+        self.completed.extend(other.completed)
+        self.due.extend(other.due)
+        self.created.extend(other.created)
+        self.recurrences.extend(other.recurrences)
+
+    # Tworzy pełne obiekty itemCard dla wszystkich wierszy.
+    def to_tasks(self) -> list[itemCard]:
+        make = itemCard._from_fields
+        return [make(title, description, from_micros(due), bool(completed), from_micros(created),
+                     task_id, rule)
+                for task_id, title, description, completed, due, created, rule
+                in zip(self.ids, self.titles, self.descriptions, self.completed, self.due, self.created,
+                       self.recurrences)]
+
+    def __len__(self):
+        return len(self.titles)
+
+    # Zwraca lekki widok itemCard na wiersz.
+    def __getitem__(self, row: int) -> "TaskRow":
+        if row < 0:
+            row += len(self.titles)
+        if not 0 <= row < len(self.titles):
+            raise IndexError("Task row out of range.")
+        return TaskRow(self, row)
+
+    def __iter__(self) -> Iterator["TaskRow"]:
+        for row in range(len(self.titles)):
+            yield TaskRow(self, row)
+
+    # Zwraca kolumny liczbowe jako tablice NumPy bez kopiowania (wymaga numpy).
+    # Dopóki istnieje któraś z tych tablic, kolumny nie mogą zmienić rozmiaru: append() i extend()
+    # zgłaszają BufferError (bez zmiany tabeli – kolumna ids jest zmieniana pierwsza). Przed
+    # dodawaniem wierszy trzeba zwolnić widoki albo skopiować je (np. .copy()).
+    def as_numpy(self):
+        if np is None:
+            raise ImportError("NumPy is required for as_numpy().")
+        return {
+            "id": np.frombuffer(self.ids, dtype=np.int64),
+            "completed": np.frombuffer(self.completed, dtype=np.int8).view(np.bool_),
+            "due": np.frombuffer(self.due, dtype=np.int64),
+            "created": np.frombuffer(self.created, dtype=np.int64),
+        }
+
+
+class TaskRow(itemCard):
+    # Widok na wiersz TaskTable – ma API itemCard, ale dane czyta i zapisuje w tabeli.
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: TaskTable, row: int):
+        self._table = table
+        self._row = row
+
+    # Trackery obserwujące wiersz są trzymane w tabeli, więc widzą zmiany z każdego widoku.
+    @property
+    def _owners(self):
+        return self._table._owners.get(self._row)
+
+    @_owners.setter
+    def _owners(self, value):
+        self._table._owners[self._row] = value
+
+    @property
+    def id(self):
+        return self._table.ids[self._row]
+
+    # Reguła powtarzania w kolumnie tabeli (sprawdzana i zgłaszana przez itemCard.recurrence).
+    @property
+    def _recurrence(self):
+        return self._table.recurrences[self._row]
+
+    @_recurrence.setter
+    def _recurrence(self, value):
+        self._table.recurrences[self._row] = value
+
+    @property
+    def title(self):
+        return self._table.titles[self._row]
+
+    @title.setter
+    def title(self, value):
+        old = self.title
+        self._table.titles[self._row] = value
+        if self._owners and old != value:
+            self._notify("title", old, value)
+
+    @property
+    def description(self):
+        return self._table.descriptions[self._row]
+
+    @description.setter
+    def description(self, value):
+        old = self.description
+        self._table.descriptions[self._row] = value
+        if self._owners and old != value:
+            self._notify("description", old, value)
+
+    @property
+    def completed(self):
+        return bool(self._table.completed[self._row])
+
+    @completed.setter
+    def completed(self, value):
+        old = self.completed
+        self._table.completed[self._row] = 1 if value else 0
+        if self._owners and old != bool(value):
+            self._notify("completed", old, bool(value))
+
+    @property
+    def due_date(self):
+        return from_micros(self._table.due[self._row])
+
+    @due_date.setter
+    def due_date(self, value):
+        value = _parse_due_date(value)
+        old = self.due_date
+        self._table.due[self._row] = to_micros(value)
+        if self._owners and old != value:
+            self._notify("due_date", old, value)
+
+    @property
+    def created_at(self):
+        return from_micros(self._table.created[self._row])
+
+    @created_at.setter
+    def created_at(self, value):
+        old = self.created_at
+        self._table.created[self._row] = to_micros(value)
+        if self._owners and old != value:
+            self._notify("created_at", old, value)
+
+    # Dwa widoki tego samego wiersza to to samo zadanie.
+    def __eq__(self, other):
+        if isinstance(other, TaskRow):
+            return self._table is other._table and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._table), self._row))
@@ -1,35 +1,436 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from math import inf
+from src import clock
+from src.cursorQuery import CursorIndex, Page
+from src.events import EventStream
 from src.itemCard import itemCard
-from typing import List
+from src.recurrence import next_in_window
+from src.searchIndex import SearchIndex
+from src.sqliteBox import SQLiteTracker
+from src.trackerStats import TrackerStats
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TaskList(list):
+    # Lista zadań zwracana przez Tracker.tasks – kopia wpisów z chwili odczytu. Dodanie i usunięcie
+    # zadania przez listę trafia też do trackera (add_task, add_tasks, remove_task, clear_all);
+    # inne zmiany zawartości (wstawianie, podmiana, pop) zgłaszają TypeError, żeby zmiana samej
+    # kopii nie przechodziła po cichu. Sortowanie i odwracanie zmieniają tylko kopię.
+    __slots__ = ("_tracker",)
+
+    def __init__(self, tracker: "Tracker", tasks: Iterable[itemCard]):
+        super().__init__(tasks)
+        self._tracker = tracker
+
+    def append(self, task: itemCard):
+        self._tracker.add_task(task)
+        super().append(task)
+
+    def extend(self, tasks: Iterable[itemCard]):
+        tasks = list(tasks)
+        self._tracker.add_tasks(tasks)
+        super().extend(tasks)
+
+    def __iadd__(self, tasks: Iterable[itemCard]):
+        self.extend(tasks)
+        return self
+
+    def remove(self, task: itemCard):
+        self._tracker.remove_task(task)
+        super().remove(task)
+
+    def clear(self):
+        self._tracker.clear_all()
+        super().clear()
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError("Tracker.tasks only supports append, extend, remove and clear; "
+                        "use the Tracker methods to change tasks.")
+
+    insert = pop = __setitem__ = __delitem__ = __imul__ = _unsupported
+
+    # Kopia (copy, pickle) to zwykła lista, już niezwiązana z trackerem.
+    def __reduce__(self):
+        return list, (list(self),)
+
 
 class Tracker:
-    # Inicjalizuje menedżera zadań z pustą listą.
+    # Inicjalizuje menedżera zadań z pustym indeksem.
+    # Każdy wpis dostaje własny klucz, więcej wpisów może wskazywać na to samo zadanie.
+    # Zadania są dodatkowo podzielone na wykonane i niewykonane (słowniki klucz -> zadanie),
+    # a zadania z terminem trafiają do posortowanego indeksu par (termin, klucz).
+    # Słownik identyfikator -> zadanie pozwala znaleźć zadanie po itemCard.id bez przeglądania listy.
+    # Wpisy zadań powtarzanych są też w osobnym słowniku – ich kolejne wystąpienia są wyliczane
+    # dopiero w zapytaniach o przedział czasu.
     def __init__(self):
-        self.tasks: List[itemCard] = []
+        self._entries: Dict[int, itemCard] = {}
+        self._keys: Dict[itemCard, List[int]] = {}
+        self._by_id: Dict[int, itemCard] = {}
+        self._completed: Dict[int, itemCard] = {}
+        self._uncompleted: Dict[int, itemCard] = {}
+        self._unordered = {True: False, False: False}
+        self._due_index: List[Tuple[datetime, int]] = []
+        self._recurring: Dict[int, itemCard] = {}
+        self._listeners: list = []
+        self._search_index = None
+        self._stats = None
+        self._cursor_index = None
+        self._manifest = None
+        self._next_key = 0
+
+    # Zwraca listę wszystkich zadań w kolejności dodania (TaskList – zmiany listy trafiają do trackera).
+    @property
+    def tasks(self) -> "TaskList":
+        return TaskList(self, self._entries.values())
+
+    # Zastępuje wszystkie zadania podaną listą.
+    @tasks.setter
+    def tasks(self, tasks: List[itemCard]):
+        self.clear_all()
+        for task in tasks:
+            self.add_task(task)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries.values()))
+
+    def __contains__(self, task):
+        return task in self._keys
+
+    # Podłącza obiekt nasłuchujący zmian (np. dodatkowy indeks) i przekazuje mu obecne zadania.
+    # Obiekt implementuje task_added, task_removed, task_changed i tasks_cleared.
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+        for key, task in self._entries.items():
+            listener.task_added(key, task)
+
+    # Odłącza obiekt nasłuchujący.
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
 
     # Dodaje nowe zadanie do listy (musi być typu itemCard).
+    # Inne zadanie o tym samym identyfikatorze nie może być jednocześnie w trackerze.
     def add_task(self, task: itemCard):
         if not isinstance(task, itemCard):
             raise TypeError("Can only add Task instances.")
-        self.tasks.append(task)
+        other = self._by_id.get(task.id)
+        if other is not None and other != task:
+            raise ValueError("Another task with the same id is already in the tracker.")
+        key = self._next_key
+        self._next_key += 1
+        self._entries[key] = task
+        keys = self._keys.get(task)
+        if keys is None:
+            self._keys[task] = [key]
+            self._by_id[task.id] = task
+            task._attach(self)
+        else:
+            keys.append(key)
+        self._partition(task.completed)[key] = task
+        if task.due_date is not None:
+            insort(self._due_index, (task.due_date, key))
+            if task._recurrence is not None:
+                self._recurring[key] = task
+        for listener in self._listeners:
+            listener.task_added(key, task)
 
-    # Usuwa konkretne zadanie z listy.
+    # Dodaje wiele zadań naraz. Typy i identyfikatory są sprawdzane przed jakąkolwiek zmianą,
+    # a indeks terminów jest sortowany raz dla całej partii.
+    def add_tasks(self, tasks: Iterable[itemCard]):
+        tasks = list(tasks)
+        by_id, new_ids = self._by_id, {}
+        for task in tasks:
+            if not isinstance(task, itemCard):
+                raise TypeError("Can only add Task instances.")
+            other = new_ids.setdefault(task.id, task)
+            if other is not task and other != task:
+                raise ValueError("Another task with the same id is already in the tracker.")
+        if by_id:
+            for task_id in new_ids.keys() & by_id.keys():
+                if by_id[task_id] != new_ids[task_id]:
+                    raise ValueError("Another task with the same id is already in the tracker.")
+        by_id.update(new_ids)
+        entries, keys_of = self._entries, self._keys
+        new_due = []
+        key = self._next_key
+        for task in tasks:
+            entries[key] = task
+            keys = keys_of.get(task)
+            if keys is None:
+                keys_of[task] = [key]
+                task._attach(self)
+            else:
+                keys.append(key)
+            (self._completed if task.completed else self._uncompleted)[key] = task
+            if task.due_date is not None:
+                new_due.append((task.due_date, key))
+                if task._recurrence is not None:
+                    self._recurring[key] = task
+            key += 1
+        first_key, self._next_key = self._next_key, key
+        if new_due:
+            self._due_index.extend(new_due)
+            self._due_index.sort()
+        for listener in self._listeners:
+            for new_key in range(first_key, key):
+                listener.task_added(new_key, entries[new_key])
+
+    # Usuwa konkretne zadanie z listy (najstarszy wpis, jeśli dodano je kilka razy).
     def remove_task(self, task: itemCard):
-        if task not in self.tasks:
+        keys = self._keys.get(task)
+        if keys is None:
+            raise ValueError("Task not found.")
+        self._remove_entry(keys[0])
+
+    # Zwraca zadanie o podanym identyfikatorze (albo `default`, jeśli go nie ma).
+    def get(self, task_id: int, default=None):
+        return self._by_id.get(task_id, default)
+
+    # Usuwa zadanie o podanym identyfikatorze (najstarszy wpis, jak remove_task).
+    def remove_by_id(self, task_id: int):
+        task = self._by_id.get(task_id)
+        if task is None:
             raise ValueError("Task not found.")
-        self.tasks.remove(task)
+        self.remove_task(task)
+
+    # Łączy zadania z innego źródła (np. wczytane z pliku) z trackerem po identyfikatorze.
+    # Zadanie o nowym identyfikatorze jest dodawane, a istniejące dostaje pola z przychodzącej
+    # wersji (zmiany są zgłaszane jak zwykłe edycje). Zwraca liczbę dodanych zadań.
+    def merge(self, tasks: Iterable[itemCard]) -> int:
+        added = {}
+        for task in tasks:
+            current = self._by_id.get(task.id)
+            if current is None:
+                added[task.id] = task
+            elif current is not task:
+                current.title = task.title
+                current.description = task.description
+                current.due_date = task.due_date
+                current.completed = task.completed
+                current.recurrence = task.recurrence
+        self.add_tasks(added.values())
+        return len(added)
+
+    # Usuwa pojedynczy wpis o podanym kluczu.
+    def _remove_entry(self, key: int):
+        task = self._entries.pop(key)
+        keys = self._keys[task]
+        keys.remove(key)
+        if not keys:
+            del self._keys[task]
+            del self._by_id[task.id]
+            task._detach(self)
+        self._partition(task.completed).pop(key, None)
+        if task.due_date is not None:
+            self._unindex_due(task.due_date, key)
+            if task._recurrence is not None:
+                del self._recurring[key]
+        for listener in self._listeners:
+            listener.task_removed(key, task)
 
     # Zwraca listę zadań oznaczonych jako wykonane.
     def get_completed_tasks(self) -> List[itemCard]:
-        return [task for task in self.tasks if task.completed]
+        return list(self._ordered(True).values())
 
     # Zwraca listę zadań, które jeszcze nie zostały ukończone.
     def get_uncompleted_tasks(self) -> List[itemCard]:
-        return [task for task in self.tasks if not task.completed]
+        return list(self._ordered(False).values())
 
-    # Zwraca listę zadań, których termin już minął.
+    # Zwraca listę zadań, których termin już minął (posortowaną wg terminu).
     def get_overdue_tasks(self) -> List[itemCard]:
-        return [task for task in self.tasks if task.is_overdue()]
+        end = bisect_left(self._due_index, (clock.now(),))
+        return [self._entries[key] for _, key in self._due_index[:end]]
+
+    # Zwraca zadania z terminem w ciągu najbliższych `hours` godzin (jeszcze nieprzeterminowane).
+    def get_tasks_due_within(self, hours: float) -> List[itemCard]:
+        now = clock.now()
+        return self.get_tasks_due_between(now, now + timedelta(hours=hours))
+
+    # Zwraca zadania z terminem w przedziale [start, end] (posortowane wg terminu).
+    # Zadanie powtarzane, którego bieżący termin jest wcześniejszy, też trafia do wyniku, jeśli
+    # w przedziale wypada jego kolejne wystąpienie (liczone w O(1), bez rozwijania serii).
+    def get_tasks_due_between(self, start: datetime, end: datetime) -> List[itemCard]:
+        lo = bisect_left(self._due_index, (start,))
+        hi = bisect_right(self._due_index, (end, inf))
+        found = self._due_index[lo:hi]
+        if self._recurring:
+            later = next_in_window(((key, task.due_date, task._recurrence)
+                                    for key, task in self._recurring.items()), start, end)
+            if later:
+                found = sorted(found + later)
+        return [self._entries[key] for _, key in found]
+
+    # Generator par (termin, zadanie) w przedziale [start, end], posortowany wg terminu.
+    # Zadanie powtarzane daje każde swoje wystąpienie z przedziału; wystąpienia są wyliczane
+    # leniwie, więc pamięć zależy od liczby zadań powtarzanych, a nie od długości serii.
+    # Tracker nie powinien być zmieniany w trakcie przeglądania.
+    def occurrences(self, start: datetime, end: datetime) -> Iterator[Tuple[datetime, itemCard]]:
+        index, recurring = self._due_index, self._recurring
+        lo = bisect_left(index, (start,))
+        hi = bisect_right(index, (end, inf))
+        single = (index[i] for i in range(lo, hi) if index[i][1] not in recurring)
+        series = [_keyed(task.occurrences(start, end), key) for key, task in recurring.items()]
+        for when, key in heapq.merge(single, *series):
+            yield when, self._entries[key]
+
+    # --- statystyki (bez budowania list zadań) ---
+
+    # Liczba wykonanych i niewykonanych wpisów – rozmiary utrzymywanych podziałów, O(1).
+    def count_completed(self) -> int:
+        return len(self._completed)
+
+    def count_uncompleted(self) -> int:
+        return len(self._uncompleted)
+
+    # Liczba przeterminowanych wpisów – pozycja bieżącej chwili w indeksie terminów, O(log n).
+    def count_overdue(self) -> int:
+        return bisect_left(self._due_index, (clock.now(),))
+
+    # Odsetek wykonanych wpisów (0.0 dla pustego trackera).
+    def completion_rate(self) -> float:
+        return len(self._completed) / len(self._entries) if self._entries else 0.0
+
+    # Liczba zadań utworzonych w poszczególnych dniach. Liczniki (TrackerStats) powstają przy
+    # pierwszym wywołaniu i są potem aktualizowane przy każdym dodaniu i usunięciu.
+    def created_per_day(self) -> Dict[date, int]:
+        if self._stats is None:
+            self._stats = TrackerStats(self)
+        return self._stats.created_per_day()
+
+    # Wszystkie liczniki naraz (np. dla panelu ze statystykami).
+    def stats(self) -> dict:
+        return {
+            "total": len(self._entries),
+            "completed": self.count_completed(),
+            "uncompleted": self.count_uncompleted(),
+            "overdue": self.count_overdue(),
+            "completion_rate": self.completion_rate(),
+        }
+
+    # Wyszukuje zadania po słowach z tytułu i opisu (bez względu na wielkość liter i polskie znaki).
+    # Indeks powstaje przy pierwszym wyszukiwaniu i jest potem aktualizowany przy każdej zmianie.
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[itemCard]:
+        if self._search_index is None:
+            self._search_index = SearchIndex(self)
+        return self._search_index.search(query, limit, prefix)
+
+    # Zwraca jedną stronę zadań uporządkowanych wg daty utworzenia ("created") albo terminu ("due"),
+    # opcjonalnie zawężonych do statusu i przedziałów dat. Strona zawiera kursor następnej strony,
+    # który przekazuje się w kolejnym wywołaniu (z tym samym porządkiem). Posortowane indeksy
+    # (CursorIndex) powstają przy pierwszym zapytaniu i są potem aktualizowane przy każdej zmianie,
+    # więc strona kosztuje O(log n + limit) niezależnie od tego, jak daleko jest od początku.
+    def query(self, order_by: str = "created", descending: bool = False, limit: int = 50,
+              cursor: str = None, completed: bool = None, due_after: datetime = None,
+              due_before: datetime = None, created_after: datetime = None,
+              created_before: datetime = None) -> Page:
+        if self._cursor_index is None:
+            self._cursor_index = CursorIndex(self)
+        return self._cursor_index.page(order_by, descending, limit, cursor, completed,
+                                       due_after, due_before, created_after, created_before)
+
+    # Zwraca strumień zdarzeń (dodanie, usunięcie, zmiana statusu, minięcie terminu) zamiast
+    # odpytywania filtrów; zdarzenia są dostarczane do callback partiami po `batch_size`,
+    # a z `max_delay` strumień sam sprawdza terminy i dostarcza zdarzenia (EventStream).
+    def subscribe(self, callback=None, batch_size: int = 100, resolution: float = 1.0,
+                  max_delay: Optional[float] = None) -> EventStream:
+        return EventStream(self, callback, batch_size, resolution, max_delay)
+
+    # Manifest skrótów treści zadań do synchronizacji przyrostowej (deltaSync.make_patch).
+    # Powstaje przy pierwszym wywołaniu (albo przy innej liczbie kubełków) i jest potem
+    # aktualizowany przy każdej zmianie, więc porównanie z drugą stroną nie przelicza skrótów.
+    def manifest(self, buckets: int = 4096):
+        from src.deltaSync import TrackerManifest  # deltaSync korzysta z supportBox, który importuje Tracker
+        if self._manifest is None or len(self._manifest.digests) != buckets:
+            if self._manifest is not None:
+                self.remove_listener(self._manifest)
+            self._manifest = TrackerManifest(self, buckets)
+        return self._manifest
+
+    # Włącza automatyczny zapis do pliku: zmiany z okresu `interval` sekund są łączone w jeden
+    # zapis wykonywany poza pętlą zdarzeń (wymaga działającej pętli asyncio).
+    def autosave(self, filename: str, interval: float = 1.0):
+        from src.autosave import AutoSaver  # autosave korzysta z supportBox, który importuje Tracker
+        return AutoSaver(self, filename, interval)
+
+    # Tracker w trybie "backed": zadania w bazie SQLite `filename`, filtry jako zapytania SQL
+    # po indeksach, zmiany zatwierdzane co `batch_size` operacji (zob. sqliteBox.SQLiteTracker).
+    @staticmethod
+    def backed(filename: str, batch_size: int = 1000) -> SQLiteTracker:
+        return SQLiteTracker(filename, batch_size)
 
     # Czyści całą listę zadań.
     def clear_all(self):
-        self.tasks.clear()
+        for task in self._keys:
+            task._detach(self)
+        self._entries.clear()
+        self._keys.clear()
+        self._by_id.clear()
+        self._completed.clear()
+        self._uncompleted.clear()
+        self._due_index.clear()
+        self._recurring.clear()
+        self._unordered = {True: False, False: False}
+        for listener in self._listeners:
+            listener.tasks_cleared()
+
+    # Wywoływane przez itemCard po zmianie pola – aktualizuje podziały i indeks terminów.
+    def _task_changed(self, task: itemCard, field, old, new):
+        if field == "completed":
+            self._move_partition(task, old, new)
+        elif field == "due_date":
+            for key in self._keys.get(task, ()):
+                if old is not None:
+                    self._unindex_due(old, key)
+                if new is not None:
+                    insort(self._due_index, (new, key))
+            self._track_recurring(task)
+        elif field == "recurrence":
+            self._track_recurring(task)
+        for listener in self._listeners:
+            for key in self._keys.get(task, ()):
+                listener.task_changed(key, task, field, old, new)
+
+    def _track_recurring(self, task: itemCard):
+        for key in self._keys.get(task, ()):
+            if task.recurrence is not None and task.due_date is not None:
+                self._recurring[key] = task
+            else:
+                self._recurring.pop(key, None)
+
+    def _move_partition(self, task: itemCard, old, new):
+        if bool(old) == bool(new):
+            return
+        source = self._partition(old)
+        target = self._partition(new)
+        for key in self._keys.get(task, ()):
+            source.pop(key, None)
+            if target and key < next(reversed(target)):
+                self._unordered[bool(new)] = True
+            target[key] = task
+
+    def _unindex_due(self, due: datetime, key: int):
+        i = bisect_left(self._due_index, (due, key))
+        del self._due_index[i]
+
+    def _partition(self, completed) -> Dict[int, itemCard]:
+        return self._completed if completed else self._uncompleted
+
+    # Zwraca podział uporządkowany wg kolejności dodania (sortuje tylko po zmianach statusu).
+    def _ordered(self, completed) -> Dict[int, itemCard]:
+        part = self._partition(completed)
+        if self._unordered[bool(completed)]:
+            ordered = {key: part[key] for key in sorted(part)}
+            part.clear()
+            part.update(ordered)
+            self._unordered[bool(completed)] = False
+        return part
+
+
+# Dokleja klucz wpisu do kolejnych terminów (do scalania wg terminu).
+def _keyed(dates: Iterator[datetime], key: int) -> Iterator[Tuple[datetime, int]]:
+    for when in dates:
+        yield when, key
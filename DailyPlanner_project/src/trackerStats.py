@@ -0,0 +1,42 @@
+from collections import Counter
+from datetime import date
+from typing import Dict
+from src.itemCard import itemCard
+
+
+class TrackerStats:
+    # Liczniki zadań utworzonych danego dnia (słuchacz zmian trackera).
+    # Każde dodanie i usunięcie zmienia jeden licznik, więc odczyt nie wymaga przeglądania zadań.
+    def __init__(self, tracker):
+        self._created: Counter = Counter()
+        tracker.add_listener(self)
+
+    def task_added(self, key, task: itemCard):
+        self._created[task.created_at.date()] += 1
+
+    def task_removed(self, key, task: itemCard):
+        self._discount(task.created_at)
+
+    def task_changed(self, key, task: itemCard, field, old, new):
+        if field == "created_at":
+            self._discount(old)
+            self._created[new.date()] += 1
+
+    def _discount(self, created_at):
+        day = created_at.date()
+        count = self._created[day] - 1
+        if count > 0:
+            self._created[day] = count
+        else:
+            del self._created[day]
+
+    def tasks_cleared(self):
+        self._created.clear()
+
+    # Liczba zadań utworzonych danego dnia.
+    def created_on(self, day: date) -> int:
+        return self._created.get(day, 0)
+
+    # Liczba zadań utworzonych w poszczególnych dniach (posortowana wg daty).
+    def created_per_day(self) -> Dict[date, int]:
+        return dict(sorted(self._created.items()))
@@ -0,0 +1,140 @@
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from src import clock
+from src.itemCard import itemCard
+from src.taskTable import to_micros
+
+try:
+    import numpy as np
+except ImportError:  # bez NumPy zapytania liczone są pętlą po tablicach array
+    np = None
+
+_DAY = 86_400_000_000  # mikrosekundy w dobie
+_EPOCH_DAY = date(1970, 1, 1)
+
+
+# Widok NumPy na tablicę array bez kopiowania (pusta tablica daje pusty wektor).
+def _column(values: array, dtype):
+    if not values:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(values, dtype=dtype)
+
+
+class VectorIndex:
+    # Kolumnowa kopia stanu trackera (status, termin, data utworzenia) do zapytań wektorowych.
+    # Podłącza się do trackera jako obiekt nasłuchujący i jest aktualizowana przy każdej zmianie.
+    # Z NumPy filtry i liczniki to operacje na maskach; bez niego – pętle po tablicach array.
+    def __init__(self, tracker, use_numpy: Optional[bool] = None):
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ImportError("NumPy is not installed.")
+        self._completed = array("b")
+        self._due = array("q")
+        self._created = array("q")
+        self._tasks: List[itemCard] = []
+        self._row_keys: List[int] = []
+        self._rows: Dict[int, int] = {}
+        tracker.add_listener(self)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    # --- aktualizacje wywoływane przez Tracker ---
+
+    def task_added(self, key, task: itemCard):
+        self._rows[key] = len(self._tasks)
+        self._row_keys.append(key)
+        self._tasks.append(task)
+        self._completed.append(1 if task.completed else 0)
+        self._due.append(to_micros(task.due_date))
+        self._created.append(to_micros(task.created_at))
+
+    # Usuwa wiersz, przenosząc na jego miejsce ostatni (O(1)).
+    def task_removed(self, key, task: itemCard):
+        row = self._rows.pop(key)
+        last = len(self._tasks) - 1
+        if row != last:
+            moved = self._row_keys[last]
+            self._rows[moved] = row
+            self._row_keys[row] = moved
+            self._tasks[row] = self._tasks[last]
+            self._completed[row] = self._completed[last]
+            self._due[row] = self._due[last]
+            self._created[row] = self._created[last]
+        self._row_keys.pop()
+        self._tasks.pop()
+        self._completed.pop()
+        self._due.pop()
+        self._created.pop()
+
+    def task_changed(self, key, task: itemCard, field, old, new):
+        row = self._rows[key]
+        if field == "completed":
+            self._completed[row] = 1 if new else 0
+        elif field == "due_date":
+            self._due[row] = to_micros(new)
+        elif field == "created_at":
+            self._created[row] = to_micros(new)
+
+    def tasks_cleared(self):
+        self._completed = array("b")
+        self._due = array("q")
+        self._created = array("q")
+        self._tasks.clear()
+        self._row_keys.clear()
+        self._rows.clear()
+
+    # --- zapytania ---
+
+    # Zwraca zadania wykonane (lub niewykonane, gdy completed=False).
+    def get_completed_tasks(self, completed: bool = True) -> List[itemCard]:
+        if self.use_numpy:
+            mask = _column(self._completed, np.int8) != 0
+            return self._select(mask if completed else ~mask)
+        flag = 1 if completed else 0
+        return [task for task, c in zip(self._tasks, self._completed) if c == flag]
+
+    def get_uncompleted_tasks(self) -> List[itemCard]:
+        return self.get_completed_tasks(False)
+
+    # Zwraca zadania przeterminowane względem `now` (domyślnie clock.now()).
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> List[itemCard]:
+        limit = to_micros(now or clock.now())
+        if self.use_numpy:
+            return self._select(_column(self._due, np.int64) < limit)
+        return [task for task, due in zip(self._tasks, self._due) if due < limit]
+
+    # Liczba zadań przeterminowanych.
+    def count_overdue(self, now: Optional[datetime] = None) -> int:
+        limit = to_micros(now or clock.now())
+        if self.use_numpy:
+            return int(np.count_nonzero(_column(self._due, np.int64) < limit))
+        return sum(1 for due in self._due if due < limit)
+
+    # Liczba zadań wykonanych.
+    def count_completed(self) -> int:
+        if self.use_numpy:
+            return int(np.count_nonzero(_column(self._completed, np.int8)))
+        return sum(self._completed)
+
+    # Odsetek wykonanych zadań (0.0 dla pustego trackera).
+    def completion_ratio(self) -> float:
+        if not self._tasks:
+            return 0.0
+        return self.count_completed() / len(self._tasks)
+
+    # Histogram liczby zadań utworzonych w poszczególnych dniach.
+    def created_per_day(self) -> Dict[date, int]:
+        if self.use_numpy:
+            days, counts = np.unique(_column(self._created, np.int64) // _DAY,
+                                     return_counts=True)
+            pairs = zip(days.tolist(), counts.tolist())
+        else:
+            pairs = sorted(Counter(created // _DAY for created in self._created).items())
+        return {_EPOCH_DAY + timedelta(days=day): count for day, count in pairs}
+
+    def _select(self, mask) -> List[itemCard]:
+        tasks = self._tasks
+        return [tasks[i] for i in np.flatnonzero(mask).tolist()]
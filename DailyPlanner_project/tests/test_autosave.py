@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import unittest
+from unittest.mock import patch
+from src.autosave import _save_atomic
+from src.itemCard import itemCard
+from src.supportBox import (load_tasks_from_file, save_tasks_to_file_async,
+                            load_tasks_from_file_async)
+from src.tracker import Tracker
+
+
+class TestAutoSave(unittest.IsolatedAsyncioTestCase):
+
+    # Nazwa pliku używana w testach
+    def setUp(self):
+        self.filename = "test_autosave.jsonl"
+
+    # Usunięcie plików utworzonych przez test
+    def tearDown(self):
+        for filename in (self.filename, "test_autosave.tmp.jsonl"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    # Asynchroniczny zapis i odczyt dają te same zadania co wersje blokujące
+    async def test_async_save_and_load(self):
+        tasks = [itemCard("Zadanie A"), itemCard("Zadanie B", due_date="2030-01-01")]
+        await save_tasks_to_file_async(iter(tasks), self.filename)
+        loaded = await load_tasks_from_file_async(self.filename)
+        self.assertEqual([t.title for t in loaded], ["Zadanie A", "Zadanie B"])
+        self.assertEqual(loaded[1].due_date, tasks[1].due_date)
+
+    # Seria zmian w krótkim czasie kończy się jednym zapisem
+    async def test_burst_is_coalesced(self):
+        manager = Tracker()
+        saver = manager.autosave(self.filename, interval=0.05)
+        tasks = [itemCard(f"Zadanie {i}") for i in range(50)]
+        for task in tasks:
+            manager.add_task(task)
+        tasks[0].mark_completed()
+        manager.remove_task(tasks[1])
+        await asyncio.sleep(0.2)
+        self.assertEqual(saver.saves, 1)
+        loaded = load_tasks_from_file(self.filename)
+        self.assertEqual(len(loaded), 49)
+        self.assertTrue(loaded[0].completed)
+        await saver.close()
+
+    # Zmiany w trakcie zapisu trafiają do kolejnego zapisu, a zapisy nigdy się nie nakładają
+    async def test_changes_during_write_are_saved_next(self):
+        manager = Tracker()
+        saver = manager.autosave(self.filename, interval=10)
+        started, release = threading.Event(), threading.Event()
+        sizes, active = [], []
+
+        def blocking_save(tasks, filename):
+            active.append(filename)
+            self.assertEqual(len(active), 1)
+            sizes.append(len(tasks))
+            started.set()
+            release.wait(5)
+            _save_atomic(tasks, filename)
+            active.pop()
+
+        with patch("src.autosave._save_atomic", blocking_save):
+            manager.add_task(itemCard("Zadanie A"))
+            flush = asyncio.ensure_future(saver.flush())
+            await asyncio.to_thread(started.wait, 5)
+            manager.add_task(itemCard("Zadanie B"))
+            manager.add_task(itemCard("Zadanie C"))
+            release.set()
+            await flush
+        self.assertEqual(sizes, [1, 3])
+        self.assertEqual(saver.saves, 2)
+        self.assertEqual(len(load_tasks_from_file(self.filename)), 3)
+        await saver.close()
+
+    # Po zamknięciu zmiany nie są już zapisywane
+    async def test_close_stops_tracking(self):
+        manager = Tracker()
+        async with manager.autosave(self.filename, interval=10) as saver:
+            manager.add_task(itemCard("Zadanie A"))
+        manager.add_task(itemCard("Zadanie B"))
+        self.assertEqual(saver.saves, 1)
+        self.assertEqual(len(load_tasks_from_file(self.filename)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime
+from src import clock
+from src.itemCard import itemCard
+from src.tracker import Tracker
+
+
+class TestClock(unittest.TestCase):
+
+    # Wewnątrz frozen_now() zegar zwraca zawsze ten sam moment, po wyjściu – znowu bieżący czas
+    def test_frozen_now(self):
+        moment = datetime(2030, 5, 1, 12, 0)
+        with clock.frozen_now(moment) as frozen:
+            self.assertIs(frozen, moment)
+            self.assertIs(clock.now(), moment)
+            with clock.frozen_now():
+                self.assertIs(clock.now(), moment)
+        self.assertLess(clock.now(), moment)
+
+    # Zadania tworzone w jednym bloku mają wspólną datę utworzenia i wspólne "teraz"
+    def test_item_card_uses_clock(self):
+        with clock.frozen_now(datetime(2030, 5, 1)):
+            a, b = itemCard("Zadanie A"), itemCard("Zadanie B", due_date="2030-04-30")
+            self.assertEqual(a.created_at, datetime(2030, 5, 1))
+            self.assertIs(a.created_at, b.created_at)
+            self.assertTrue(b.is_overdue())
+        self.assertFalse(b.is_overdue())
+
+    # Tracker liczy przeterminowanie względem zamrożonego zegara
+    def test_tracker_uses_frozen_now(self):
+        manager = Tracker()
+        task = itemCard("Zadanie", due_date="2030-01-01")
+        manager.add_task(task)
+        with clock.frozen_now(datetime(2030, 1, 2)):
+            self.assertEqual(manager.get_overdue_tasks(), [task])
+            self.assertEqual(manager.get_tasks_due_within(24), [])
+        self.assertEqual(manager.get_overdue_tasks(), [])
+
+    # Powtarzająca się data jest parsowana raz, a wynik współdzielony
+    def test_parse_iso_is_memoized(self):
+        self.assertIs(clock.parse_iso("2030-01-01"), clock.parse_iso("2030-01-01"))
+        with self.assertRaises(ValueError):
+            clock.parse_iso("jutro")
+
+    # Zapamiętany napis daty jest taki sam jak wynik strftime
+    def test_format_date(self):
+        moment = datetime(2030, 1, 2, 23, 59)
+        self.assertEqual(clock.format_date(moment), moment.strftime("%Y-%m-%d"))
+        with clock.frozen_now(moment):
+            self.assertEqual(str(itemCard("Zakupy")), "[✗] Zakupy (2030-01-02)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import threading
+import unittest
+from datetime import datetime
+from src import clock
+from src.concurrentTracker import ConcurrentTracker
+from src.itemCard import itemCard
+
+
+class TestConcurrentTracker(unittest.TestCase):
+
+    # Tracker z kilkoma częściami i zadaniami z terminami
+    def setUp(self):
+        self.manager = ConcurrentTracker(shards=4)
+        self.tasks = [itemCard(f"Zadanie {i}", due_date=datetime(2030, 1, 10 - i)) for i in range(6)]
+        self.manager.add_tasks(self.tasks)
+
+    # Zadania z różnych części wracają w kolejności dodania
+    def test_tasks_keep_insertion_order(self):
+        extra = itemCard("Dodatkowe")
+        self.manager.add_task(extra)
+        self.assertEqual(self.manager.tasks, self.tasks + [extra])
+        self.assertEqual(len(self.manager), 7)
+        self.assertIn(extra, self.manager)
+
+    # Filtry działają jak w zwykłym Trackerze (przeterminowane posortowane wg terminu)
+    def test_filters(self):
+        self.tasks[1].mark_completed()
+        self.tasks[4].mark_completed()
+        self.assertEqual(self.manager.get_completed_tasks(), [self.tasks[1], self.tasks[4]])
+        self.assertEqual(len(self.manager.get_uncompleted_tasks()), 4)
+        with clock.frozen_now(datetime(2030, 1, 7)):
+            self.assertEqual(self.manager.get_overdue_tasks(), [self.tasks[5], self.tasks[4]])
+        self.assertEqual(self.manager.get_tasks_due_between(datetime(2030, 1, 9), datetime(2030, 1, 10)),
+                         [self.tasks[1], self.tasks[0]])
+
+    # Snapshot nie widzi zmian wprowadzonych po jego utworzeniu
+    def test_snapshot_is_isolated(self):
+        snapshot = self.manager.snapshot()
+        self.manager.remove_task(self.tasks[0])
+        self.tasks[1].mark_completed()
+        self.manager.clear_all()
+        self.assertEqual(snapshot.tasks, self.tasks)
+        self.assertEqual(snapshot.get_completed_tasks(), [])
+        self.assertEqual(self.manager.tasks, [])
+
+    # Snapshot bez zmian nie czeka na blokady części; zmieniona część blokuje tylko przebudowę siebie
+    def test_snapshot_does_not_take_other_locks(self):
+        self.manager.snapshot()
+        shards = self.manager._shards
+        busy = self.manager._shard(self.tasks[0])
+        next(task for task in self.tasks if self.manager._shard(task) is not busy).mark_completed()
+        held, release = threading.Event(), threading.Event()
+
+        def hold():
+            with busy.lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        held.wait(5)
+        result = []
+        reader = threading.Thread(target=lambda: result.append(self.manager.snapshot()))
+        reader.start()
+        reader.join(2)
+        finished = bool(result)
+        release.set()
+        holder.join()
+        reader.join()
+        self.assertTrue(finished)
+        self.assertEqual(len(result[0]), 6)
+        self.assertEqual(len(result[0].get_completed_tasks()), 1)
+        self.assertTrue(all(shard.view is not None for shard in shards))
+
+    # Zły typ zadania jest odrzucany przed jakąkolwiek zmianą
+    def test_add_tasks_rejects_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.manager.add_tasks([itemCard("Zadanie"), "nie zadanie"])
+        self.assertEqual(len(self.manager), 6)
+        with self.assertRaises(ValueError):
+            self.manager.remove_task(itemCard("Nieznane"))
+
+    # Powtórzony identyfikator w dalszej części partii odrzuca całą partię (nic nie jest dodane)
+    def test_add_tasks_is_atomic(self):
+        fresh = [itemCard(f"Nowe {i}") for i in range(4)]
+        clash = itemCard._from_fields("Inne", "", None, False, datetime(2030, 1, 1), self.tasks[3].id)
+        next_key = self.manager._next_key
+        with self.assertRaises(ValueError):
+            self.manager.add_tasks(fresh + [clash])
+        self.assertEqual(self.manager.tasks, self.tasks)
+        self.assertEqual(self.manager._next_key, next_key)
+        with self.assertRaises(ValueError):
+            self.manager.add_task(clash)
+        self.manager.add_tasks(fresh)
+        self.assertEqual(self.manager.tasks, self.tasks + fresh)
+
+    # Wątki piszące i czytające jednocześnie – stan końcowy jest spójny
+    def test_parallel_writers_and_readers(self):
+        errors = []
+
+        def writer(n):
+            try:
+                for i in range(200):
+                    task = itemCard(f"W{n} {i}", due_date=datetime(2020, 1, 1))
+                    self.manager.add_task(task)
+                    task.mark_completed()
+                    if i % 2:
+                        self.manager.remove_task(task)
+            except Exception as exc:
+                errors.append(exc)
+
+        def reader():
+            try:
+                for _ in range(50):
+                    snapshot = self.manager.snapshot()
+                    tasks = snapshot.tasks
+                    self.assertEqual(len(tasks), len(snapshot))
+                    self.assertLessEqual(len(snapshot.get_overdue_tasks()), len(tasks))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.manager), 6 + 4 * 100)
+        self.assertEqual(len(self.manager.get_completed_tasks()), 4 * 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
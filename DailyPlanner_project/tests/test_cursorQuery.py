@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta
+from src import clock
+from src.itemCard import itemCard
+from src.tracker import Tracker
+
+
+class TestCursorQuery(unittest.TestCase):
+
+    # Tracker z zadaniami tworzonymi co godzinę; co trzecie wykonane, co drugie z terminem
+    def setUp(self):
+        self.manager = Tracker()
+        self.tasks = []
+        start = datetime(2030, 1, 1)
+        for i in range(10):
+            with clock.frozen_now(start + timedelta(hours=i)):
+                due = datetime(2030, 2, 10 - i) if i % 2 == 0 else None
+                task = itemCard(f"Zadanie {i}", due_date=due)
+            if i % 3 == 0:
+                task.mark_completed()
+            self.tasks.append(task)
+        self.manager.add_tasks(self.tasks)
+
+    def _all_pages(self, **query):
+        result, cursor = [], None
+        while True:
+            page = self.manager.query(cursor=cursor, **query)
+            result.extend(page.tasks)
+            cursor = page.cursor
+            if cursor is None:
+                return result
+
+    # Kolejne strony pokrywają wszystkie zadania wg daty utworzenia, bez powtórzeń
+    def test_pages_by_created(self):
+        page = self.manager.query(limit=4)
+        self.assertEqual(page.tasks, self.tasks[:4])
+        self.assertIsNotNone(page.cursor)
+        self.assertEqual(self._all_pages(limit=4), self.tasks)
+        self.assertEqual(self._all_pages(limit=3, descending=True), self.tasks[::-1])
+        self.assertIsNone(self.manager.query(limit=10).cursor)
+
+    # Porządek wg terminu pomija zadania bez terminu, filtry łączą się z porządkiem
+    def test_due_order_with_filters(self):
+        self.assertEqual(self._all_pages(order_by="due", limit=2),
+                         [self.tasks[i] for i in (8, 6, 4, 2, 0)])
+        self.assertEqual(self._all_pages(order_by="due", limit=1, completed=True),
+                         [self.tasks[6], self.tasks[0]])
+        self.assertEqual(self._all_pages(limit=2, completed=False, due_before=datetime(2030, 2, 7)),
+                         [self.tasks[4], self.tasks[8]])
+        self.assertEqual(self._all_pages(order_by="due", descending=True, limit=2,
+                                         due_after=datetime(2030, 2, 4), due_before=datetime(2030, 2, 8)),
+                         [self.tasks[2], self.tasks[4], self.tasks[6]])
+
+    # Zmiany między stronami nie psują kursora: strona zaczyna się za ostatnim zwróconym wpisem
+    def test_cursor_survives_changes(self):
+        page = self.manager.query(limit=3)
+        self.manager.remove_task(self.tasks[2])
+        self.tasks[5].mark_completed()
+        self.tasks[4].created_at = datetime(2029, 12, 31)
+        rest = self.manager.query(limit=3, cursor=page.cursor)
+        self.assertEqual(rest.tasks, [self.tasks[3], self.tasks[5], self.tasks[6]])
+        self.assertEqual(self.manager.query(limit=1).tasks, [self.tasks[4]])
+        self.assertEqual(self._all_pages(completed=True, limit=2),
+                         [self.tasks[0], self.tasks[3], self.tasks[5], self.tasks[6], self.tasks[9]])
+
+    # Kursor z innego porządku albo uszkodzony jest odrzucany
+    def test_invalid_cursor(self):
+        cursor = self.manager.query(limit=2).cursor
+        with self.assertRaises(ValueError):
+            self.manager.query(limit=2, cursor=cursor, descending=True)
+        with self.assertRaises(ValueError):
+            self.manager.query(cursor="nie-kursor")
+        with self.assertRaises(ValueError):
+            self.manager.query(order_by="title")
+        with self.assertRaises(ValueError):
+            self.manager.query(limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
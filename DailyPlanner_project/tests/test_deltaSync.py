@@ -0,0 +1,106 @@
+import json
+import os
+import unittest
+from src.deltaSync import Manifest, apply_patch, diff, diff_files, make_patch
+from src.itemCard import itemCard
+from src.supportBox import save_tasks_to_file, load_tasks_from_file
+from src.tracker import Tracker
+
+
+class TestDeltaSync(unittest.TestCase):
+
+    # Dwa trackery z tymi samymi zadaniami (kopia jak po wczytaniu z pliku)
+    def setUp(self):
+        self.filenames = ["test_sync_a.json", "test_sync_b.json"]
+        self.local = Tracker()
+        self.local.add_tasks(itemCard(f"Zadanie {i}", due_date="2030-01-02") for i in range(20))
+        save_tasks_to_file(self.local.tasks, self.filenames[0])
+        self.remote = Tracker()
+        self.remote.add_tasks(load_tasks_from_file(self.filenames[0]))
+
+    # Usunięcie plików po teście
+    def tearDown(self):
+        for filename in self.filenames:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _change_local(self):
+        tasks = self.local.tasks
+        tasks[1].mark_completed()
+        tasks[2].title = "Nowy tytuł"
+        self.local.remove_task(tasks[3])
+        self.added = itemCard("Nowe zadanie")
+        self.local.add_task(self.added)
+        return tasks
+
+    # Identyczne zbiory nie mają różnic; różnice są podzielone na rodzaje
+    def test_diff(self):
+        base = Manifest.from_tasks(self.remote.tasks, buckets=8)
+        self.assertEqual(diff(base, self.local.manifest(8)), ([], [], [], [], []))
+        tasks = self._change_local()
+        changes = diff(base, self.local.manifest(8))
+        self.assertEqual(changes.added, [self.added.id])
+        self.assertEqual(changes.removed, [tasks[3].id])
+        self.assertEqual(changes.changed, [tasks[2].id])
+        self.assertEqual(changes.completed, [tasks[1].id])
+        self.assertEqual(changes.uncompleted, [])
+
+    # Dwie zmiany statusu w tym samym kubełku nie znoszą się w sumie kontrolnej
+    def test_status_flips_in_one_bucket(self):
+        base = self.remote.manifest(4)
+        tasks = self.local.tasks
+        tasks[0].mark_completed()
+        same_bucket = next(t for t in tasks[1:] if t.id % 4 == tasks[0].id % 4)
+        same_bucket.mark_completed()
+        patch = make_patch(base, self.local)
+        self.assertEqual(sorted(patch["complete"]), sorted([tasks[0].id, same_bucket.id]))
+        apply_patch(self.remote, patch)
+        self.assertEqual(self.remote.count_completed(), 2)
+
+    # Zmiana statusu zadania powtarzanego nie przesuwa terminu na drugiej kopii
+    def test_recurring_status_flip(self):
+        local, remote = self.local.tasks[0], self.remote.tasks[0]
+        local.recurrence = remote.recurrence = "daily"
+        base = self.remote.manifest()
+        local.completed = True
+        patch = make_patch(base, self.local)
+        self.assertEqual(patch["complete"], [local.id])
+        apply_patch(self.remote, patch)
+        self.assertEqual((remote.due_date, remote.completed), (local.due_date, True))
+        local.completed = False
+        apply_patch(self.remote, make_patch(self.remote.manifest(), self.local))
+        self.assertEqual((remote.due_date, remote.completed), (local.due_date, False))
+        self.assertEqual(self.remote.manifest().digests, self.local.manifest().digests)
+
+    # Łatka (zapisana jako JSON) przenosi zmiany na drugi tracker
+    def test_patch_round_trip(self):
+        base = self.remote.manifest()
+        self._change_local()
+        patch = json.loads(json.dumps(make_patch(base, self.local)))
+        self.assertEqual(len(patch["add"]) + len(patch["update"]), 2)
+        self.assertEqual(apply_patch(self.remote, patch), 4)
+        self.assertEqual(self.remote.manifest().digests, self.local.manifest().digests)
+        self.assertEqual(self.remote.get(self.added.id).title, "Nowe zadanie")
+        self.assertEqual(len(self.remote), len(self.local))
+        with self.assertRaises(ValueError):
+            apply_patch(Tracker(), {"complete": [self.added.id]})
+
+    # Łatka między dwoma plikami
+    def test_diff_files(self):
+        self._change_local()
+        save_tasks_to_file(self.local.tasks, self.filenames[1])
+        patch = diff_files(self.filenames[0], self.filenames[1])
+        apply_patch(self.remote, patch)
+        self.assertEqual(Manifest.from_tasks(self.remote.tasks).digests,
+                         Manifest.from_file(self.filenames[1]).digests)
+
+    # Plik bez identyfikatorów (starszy format) daje czytelny błąd zamiast KeyError
+    def test_records_without_ids(self):
+        with open(self.filenames[1], "w", encoding="utf-8") as f:
+            json.dump([{"title": "Stare", "description": "", "due_date": None, "completed": False}], f)
+        with self.assertRaises(ValueError):
+            diff_files(self.filenames[0], self.filenames[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.events import TaskEvent, TimerWheel
+from src.itemCard import itemCard
+from src.tracker import Tracker
+
+
+class TestEventStream(unittest.TestCase):
+
+    # Tracker z jednym zadaniem i strumień zdarzeń w trybie bez callback
+    def setUp(self):
+        self.manager = Tracker()
+        self.task = itemCard("Zadanie A", due_date=datetime(2030, 1, 1, 12))
+        self.manager.add_task(self.task)
+        self.stream = self.manager.subscribe()
+
+    # Strumień zaczyna od zadań już obecnych, a potem dostaje kolejne zmiany
+    def test_events_follow_changes(self):
+        other = itemCard("Zadanie B")
+        self.manager.add_task(other)
+        self.task.mark_completed()
+        self.task.mark_uncompleted()
+        self.task.title = "Nowy tytuł"
+        self.manager.remove_task(other)
+        self.manager.clear_all()
+        events = self.stream.drain()
+        self.assertEqual([e.kind for e in events],
+                         ["added", "added", "completed", "uncompleted", "changed", "removed", "cleared"])
+        self.assertIs(events[1].task, other)
+        self.assertEqual((events[4].field, events[4].new), ("title", "Nowy tytuł"))
+        self.assertEqual(self.stream.drain(), [])
+
+    # Zdarzenia są dostarczane do callback partiami
+    def test_batched_delivery(self):
+        batches = []
+        stream = self.manager.subscribe(batches.append, batch_size=3)
+        for i in range(4):
+            self.manager.add_task(itemCard(f"Zadanie {i}"))
+        self.assertEqual([len(batch) for batch in batches], [3])
+        stream.close()
+        self.assertEqual([len(batch) for batch in batches], [3, 2])
+        self.manager.add_task(itemCard("Po zamknięciu"))
+        self.assertEqual(len(batches), 2)
+
+    # "overdue" pojawia się dokładnie raz, gdy minie termin
+    def test_overdue_fires_when_due_passes(self):
+        self.stream.drain()
+        self.assertEqual(self.stream.next_deadline(), datetime(2030, 1, 1, 12))
+        self.assertEqual(self.stream.advance(datetime(2030, 1, 1, 12)), 0)
+        self.assertEqual(self.stream.advance(datetime(2030, 1, 1, 12, 0, 0, 1)), 1)
+        self.assertEqual(self.stream.drain(), [TaskEvent("overdue", 0, self.task)])
+        self.assertEqual(self.stream.advance(datetime(2030, 1, 2)), 0)
+        self.assertIsNone(self.stream.next_deadline())
+
+    # Z max_delay strumień sam emituje "overdue" po minięciu terminu i dostarcza zdarzenia,
+    # bez ręcznego advance() ani flush()
+    def test_driver_delivers_overdue(self):
+        delivered = threading.Event()
+        batches = []
+
+        def receive(events):
+            batches.append(events)
+            if any(event.kind == "overdue" for event in events):
+                delivered.set()
+        soon = itemCard("Za chwilę", due_date=datetime.now() + timedelta(seconds=0.2))
+        stream = self.manager.subscribe(receive, resolution=0.05, max_delay=0.1)
+        try:
+            self.manager.add_task(soon)
+            self.assertTrue(delivered.wait(5))
+        finally:
+            stream.close()
+        events = [event for batch in batches for event in batch]
+        self.assertEqual([e.kind for e in events], ["added", "added", "overdue"])
+        self.assertIs(events[2].task, soon)
+        self.assertGreater(datetime.now(), soon.due_date)
+        with self.assertRaises(ValueError):
+            self.manager.subscribe(max_delay=0)
+
+    # Zmiana terminu przesuwa zdarzenie, usunięcie zadania je anuluje
+    def test_due_date_change_reschedules(self):
+        self.task.due_date = datetime(2030, 1, 3)
+        self.assertEqual(self.stream.advance(datetime(2030, 1, 2)), 0)
+        self.assertEqual(self.stream.next_deadline(), datetime(2030, 1, 3))
+        self.manager.remove_task(self.task)
+        self.assertEqual(self.stream.advance(datetime(2030, 1, 4)), 0)
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    # Elementy z tego samego kubełka odpalają się tylko po minięciu własnego terminu
+    def test_same_bucket(self):
+        wheel = TimerWheel(resolution=3600)
+        start = datetime(2030, 1, 1, 10)
+        for minutes in (30, 10, 50):
+            wheel.schedule(minutes, start + timedelta(minutes=minutes))
+        self.assertEqual(wheel.advance(start + timedelta(minutes=35)), [10, 30])
+        self.assertEqual(wheel.next_deadline(), start + timedelta(minutes=50))
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.advance(start + timedelta(days=1)), [50])
+
+    # Ponowne zaplanowanie na ten sam termin nie odpala elementu dwa razy
+    def test_reschedule_same_time(self):
+        wheel = TimerWheel()
+        when = datetime(2030, 1, 1)
+        wheel.schedule("a", when)
+        wheel.schedule("a", when)
+        self.assertEqual(wheel.advance(when + timedelta(seconds=1)), ["a"])
+        with self.assertRaises(ValueError):
+            TimerWheel(resolution=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
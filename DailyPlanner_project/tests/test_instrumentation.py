@@ -0,0 +1,63 @@
+import os
+import unittest
+from src import instrumentation
+from src.itemCard import itemCard
+from src.supportBox import save_tasks_to_file, load_tasks_from_file
+from src.tracker import Tracker
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    # Włączone pomiary i plik na dane
+    def setUp(self):
+        self.filename = "test_metrics.jsonl"
+        self.metrics = instrumentation.enable()
+
+    # Wyłączenie pomiarów i usunięcie plików po teście
+    def tearDown(self):
+        instrumentation.disable()
+        for filename in (self.filename, self.filename + ".prom"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    # Wywołania metod i operacje na plikach są liczone, razem z bajtami
+    def test_counts_and_bytes(self):
+        manager = Tracker()
+        task = itemCard("Zadanie A")
+        manager.add_task(task)
+        manager.get_completed_tasks()
+        manager.get_tasks_due_within(24)
+        manager.remove_task(task)
+        save_tasks_to_file([task], self.filename)
+        load_tasks_from_file(self.filename)
+        snapshot = self.metrics.snapshot()
+        size = os.path.getsize(self.filename)
+        self.assertEqual(snapshot["calls"]["itemCard.__init__"], 2)  # także przy wczytaniu pliku
+        self.assertEqual(snapshot["calls"]["Tracker.add_task"], 1)
+        self.assertEqual(snapshot["calls"]["Tracker.get_tasks_due_between"], 1)
+        self.assertEqual(snapshot["bytes_written"], {"save_tasks_to_file": size})
+        self.assertEqual(snapshot["bytes_read"], {"load_tasks_from_file": size})
+        latency = snapshot["latency"]["Tracker.remove_task"]
+        self.assertEqual((latency["count"], latency["buckets"]["inf"]), (1, 1))
+
+    # Po wyłączeniu metody są znowu oryginalnymi funkcjami, a nic nie jest liczone
+    def test_disable_restores_methods(self):
+        instrumentation.disable()
+        self.assertFalse(hasattr(Tracker.add_task, "__wrapped__"))
+        Tracker().add_task(itemCard("Zadanie B"))
+        self.assertEqual(self.metrics.calls, {})
+        self.assertIsNone(instrumentation.metrics)
+
+    # Eksport w formacie Prometheus do pliku
+    def test_prometheus(self):
+        Tracker().get_overdue_tasks()
+        self.metrics.write_prometheus(self.filename + ".prom")
+        with open(self.filename + ".prom", encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn('dailyplanner_calls_total{op="Tracker.get_overdue_tasks"} 1', text)
+        self.assertIn('dailyplanner_latency_seconds_bucket{op="Tracker.get_overdue_tasks",le="+Inf"} 1', text)
+        self.assertIn("# TYPE dailyplanner_latency_seconds histogram", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -490,6 +490,43 @@ class TestItemCard(unittest.TestCase):
         task = itemCard("Zadanie", due_date=datetime.now() + timedelta(days=1))
         self.assertFalse(task.is_overdue())
 
+    # Zadanie korzysta ze slotów, więc nie ma słownika __dict__ ani dowolnych atrybutów
+    def test_task_uses_slots_100(self):
+        task = itemCard("Zadanie 100")
+        self.assertFalse(hasattr(task, "__dict__"))
+        with self.assertRaises(AttributeError):
+            task.priority = 1
+
+    # Tworzenie wielu zadań z krotek i słowników; partia dzieli jeden czas utworzenia
+    def test_from_records_mixed_101(self):
+        tasks = itemCard.from_records([
+            ("  Zakupy  ",),
+            ("Zadanie", "Opis", "2030-01-02"),
+            {"title": "Raport", "due_date": None, "completed": True},
+        ])
+        self.assertEqual([t.title for t in tasks], ["Zakupy", "Zadanie", "Raport"])
+        self.assertEqual(tasks[1].due_date, datetime(2030, 1, 2))
+        self.assertEqual(tasks[1].description, "Opis")
+        self.assertTrue(tasks[2].completed)
+        self.assertEqual(len({t.created_at for t in tasks}), 1)
+
+    # Błędne rekordy są odrzucane tak samo jak w konstruktorze
+    def test_from_records_validation_102(self):
+        with self.assertRaises(ValueError):
+            itemCard.from_records([("Dobre",), (" ",)])
+        with self.assertRaises(ValueError):
+            itemCard.from_records([("Zadanie", "", "2025/07/06")])
+
+    # Każde zadanie dostaje inny, stały 63-bitowy identyfikator tylko do odczytu
+    def test_task_id_103(self):
+        tasks = [itemCard(f"Zadanie {i}") for i in range(100)]
+        self.assertEqual(len({t.id for t in tasks}), 100)
+        self.assertTrue(all(0 <= t.id < 2 ** 63 for t in tasks))
+        with self.assertRaises(AttributeError):
+            tasks[0].id = 1
+        restored = itemCard.from_records([{"id": 42, "title": "Zadanie"}])
+        self.assertEqual(restored[0].id, 42)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import os
+from datetime import datetime
+from src.itemCard import itemCard
+from src.journal import TrackerJournal, open_tracker
+
+
+class TestTrackerJournal(unittest.TestCase):
+
+    # Nazwy plików dziennika i migawki używane w testach
+    def setUp(self):
+        self.journal_path = "test_journal.jsonl"
+        self.snapshot_path = "test_journal_snapshot.jsonl"
+
+    # Usunięcie wszystkich plików utworzonych przez test
+    def tearDown(self):
+        for filename in (self.journal_path, self.snapshot_path, self.journal_path + ".tmp",
+                         "test_journal_snapshot.tmp.jsonl"):
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def _lines(self):
+        with open(self.journal_path, encoding="utf-8") as f:
+            return f.readlines()
+
+    # Operacje są dopisywane do dziennika i odtwarzane przy ponownym otwarciu
+    def test_replay_after_reopen(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=1)
+        a, b, c = itemCard("Zadanie A"), itemCard("Zadanie B"), itemCard("Zadanie C")
+        tracker.add_tasks([a, b, c])
+        b.mark_completed()
+        c.due_date = datetime(2030, 1, 2)
+        tracker.remove_task(a)
+        journal.close()
+        self.assertEqual(len(self._lines()), 6)
+
+        restored, journal = open_tracker(self.journal_path, self.snapshot_path)
+        self.assertEqual([t.title for t in restored.tasks], ["Zadanie B", "Zadanie C"])
+        self.assertEqual([t.title for t in restored.get_completed_tasks()], ["Zadanie B"])
+        self.assertEqual(restored.tasks[1].due_date, datetime(2030, 1, 2))
+        journal.close()
+
+    # Niezapisana partia przepada, ale zapisane operacje pozostają
+    def test_unflushed_batch_is_lost_on_crash(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=2)
+        tracker.add_task(itemCard("Zadanie A"))
+        tracker.add_task(itemCard("Zadanie B"))
+        tracker.add_task(itemCard("Zadanie C"))  # zostaje w buforze
+        journal._file.close()  # symulacja awarii bez flush
+        restored, journal = open_tracker(self.journal_path, self.snapshot_path)
+        self.assertEqual(len(restored), 2)
+        journal.close()
+
+    # Kompaktowanie zapisuje migawkę, czyści dziennik i zachowuje identyfikatory dla kolejnych zmian
+    def test_compaction(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=1,
+                                        compact_every=4)
+        tasks = [itemCard(f"Zadanie {i}") for i in range(4)]
+        for task in tasks:
+            tracker.add_task(task)
+        self.assertTrue(os.path.exists(self.snapshot_path))
+        self.assertEqual(self._lines(), [])
+        tasks[2].mark_completed()
+        tracker.remove_task(tasks[0])
+        journal.close()
+        restored, journal = open_tracker(self.journal_path, self.snapshot_path)
+        self.assertEqual([t.title for t in restored.tasks], ["Zadanie 1", "Zadanie 2", "Zadanie 3"])
+        self.assertEqual([t.title for t in restored.get_completed_tasks()], ["Zadanie 2"])
+        journal.close()
+
+    # Przerwany ostatni wiersz dziennika jest pomijany przy odtwarzaniu
+    def test_torn_last_line_is_ignored(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=1)
+        tracker.add_task(itemCard("Zadanie A"))
+        journal.close()
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "id": 1, "ta')
+        restored, journal = open_tracker(self.journal_path, self.snapshot_path)
+        self.assertEqual(len(restored), 1)
+        journal.close()
+
+    # Dziennik podłączony do trackera z zadaniami zapisuje je jako dodane
+    def test_attach_to_existing_tracker(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path)
+        journal.close()
+        tracker.add_task(itemCard("Zadanie A"))
+        TrackerJournal(tracker, self.journal_path, self.snapshot_path).close()
+        self.assertEqual(len(self._lines()), 1)
+
+    # Zadanie dodane dwa razy wraca jako jedna karta – z dziennika i z migawki po kompaktowaniu
+    def test_duplicated_entry_round_trip(self):
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=1)
+        task = itemCard("Zadanie A")
+        tracker.add_task(task)
+        tracker.add_task(task)
+        tracker.add_task(itemCard("Zadanie B"))
+        journal.close()
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path, batch_size=1)
+        self.assertEqual(len(tracker.tasks), 3)
+        self.assertIs(tracker.tasks[0], tracker.tasks[1])
+        tracker.tasks[0].mark_completed()
+        journal.compact()
+        journal.close()
+        tracker, journal = open_tracker(self.journal_path, self.snapshot_path)
+        journal.close()
+        self.assertIs(tracker.tasks[0], tracker.tasks[1])
+        self.assertEqual(len(tracker.get_completed_tasks()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+from itertools import islice
+from src import clock
+from src.itemCard import itemCard
+from src.concurrentTracker import ConcurrentTracker
+from src.recurrence import Recurrence
+from src.shardedTracker import ShardedTracker
+from src.supportBox import (save_tasks_to_file, load_tasks_from_file, load_many, task_from_dict,
+                            task_to_dict)
+from src.tracker import Tracker
+
+
+class TestRecurrence(unittest.TestCase):
+
+    # Zapis tekstowy reguły w obie strony i odrzucanie błędnych reguł
+    def test_parse(self):
+        for text in ("daily", "weekly/2", "hourly/1/2030-06-30T00:00:00"):
+            self.assertEqual(str(Recurrence.parse(text)), text)
+        self.assertEqual(Recurrence.parse("weekly/2"), Recurrence("weekly", 2))
+        for text in ("monthly", "daily/0", "daily/x", "daily/1/2030-13-01"):
+            with self.assertRaises(ValueError):
+                Recurrence.parse(text)
+
+    # Wystąpienia w oknie są liczone od razu od właściwego miejsca, także po latach
+    def test_occurrences_in_window(self):
+        rule = Recurrence("daily", 2, until=datetime(2040, 1, 1))
+        start = datetime(2030, 1, 1, 9)
+        self.assertEqual(list(rule.occurrences(start, datetime(2035, 6, 1), datetime(2035, 6, 6, 9))),
+                         [datetime(2035, 6, 2, 9), datetime(2035, 6, 4, 9), datetime(2035, 6, 6, 9)])
+        self.assertEqual(list(rule.occurrences(start, datetime(2040, 1, 1), datetime(2041, 1, 1))), [])
+        self.assertEqual(next(Recurrence("daily").occurrences(start, datetime(1, 1, 1), datetime.max)), start)
+
+
+class TestRecurringTasks(unittest.TestCase):
+
+    # Tracker z zadaniem codziennym, cotygodniowym (kończącym się) i zwykłym
+    def setUp(self):
+        self.filename = "test_recurring.json"
+        self.manager = Tracker()
+        self.daily = itemCard("Codzienne", due_date=datetime(2030, 1, 1, 8), recurrence="daily")
+        self.weekly = itemCard("Cotygodniowe", due_date=datetime(2030, 1, 3, 12),
+                               recurrence=Recurrence("weekly", until=datetime(2030, 1, 10, 12)))
+        self.single = itemCard("Jednorazowe", due_date=datetime(2030, 1, 2, 10))
+        self.manager.add_tasks([self.daily, self.weekly, self.single])
+
+    # Usunięcie pliku po teście
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    # Wykonanie zadania powtarzanego przesuwa termin; po ostatnim wystąpieniu zadanie jest wykonane
+    def test_mark_completed_advances(self):
+        self.daily.mark_completed()
+        self.assertEqual((self.daily.due_date, self.daily.completed), (datetime(2030, 1, 2, 8), False))
+        self.weekly.mark_completed()
+        self.weekly.mark_completed()
+        self.assertEqual((self.weekly.due_date, self.weekly.completed), (datetime(2030, 1, 10, 12), True))
+        with clock.frozen_now(datetime(2030, 1, 2, 9)):
+            self.assertEqual(self.manager.get_overdue_tasks(), [self.daily])
+        with self.assertRaises(ValueError):
+            itemCard("Bez terminu", recurrence="daily")
+
+    # Zapytania o przedział widzą kolejne wystąpienia, a nie tylko bieżący termin
+    def test_due_between_and_occurrences(self):
+        start, end = datetime(2030, 1, 5), datetime(2030, 1, 11)
+        self.assertEqual(self.manager.get_tasks_due_between(start, end), [self.daily, self.weekly])
+        with clock.frozen_now(datetime(2030, 1, 2)):
+            self.assertEqual(self.manager.get_tasks_due_within(12), [self.daily, self.single])
+        found = list(self.manager.occurrences(datetime(2030, 1, 2), datetime(2030, 1, 4, 8)))
+        self.assertEqual(found, [(datetime(2030, 1, 2, 8), self.daily), (datetime(2030, 1, 2, 10), self.single),
+                                 (datetime(2030, 1, 3, 8), self.daily), (datetime(2030, 1, 3, 12), self.weekly),
+                                 (datetime(2030, 1, 4, 8), self.daily)])
+        endless = self.manager.occurrences(datetime(2030, 1, 1), datetime.max - timedelta(days=1))
+        self.assertEqual(len(list(islice(endless, 1000))), 1000)
+
+    # Zmiana i usunięcie reguły oraz usunięcie zadania aktualizują tracker
+    def test_rule_changes(self):
+        self.daily.recurrence = None
+        self.assertEqual(self.manager.get_tasks_due_between(datetime(2030, 1, 5), datetime(2030, 1, 11)),
+                         [self.weekly])
+        self.single.recurrence = "weekly"
+        self.assertEqual(self.manager.get_tasks_due_between(datetime(2030, 1, 8), datetime(2030, 1, 10, 12)),
+                         [self.single, self.weekly])
+        self.manager.remove_task(self.single)
+        self.manager.remove_task(self.weekly)
+        self.assertEqual(list(self.manager.occurrences(datetime(2030, 1, 2), datetime(2030, 2, 1))), [])
+
+    # Reguła jest zapisywana w pliku jako jedno pole – seria nie jest rozwijana
+    def test_round_trip(self):
+        save_tasks_to_file(self.manager.tasks, self.filename)
+        for lazy in (False, True):
+            loaded = load_tasks_from_file(self.filename, lazy=lazy)
+            self.assertEqual([task.recurrence for task in loaded],
+                             [Recurrence("daily"), self.weekly.recurrence, None])
+
+    # Rekord wykonanego zadania powtarzanego wczytuje się jako wykonany, bez przesuwania terminu
+    def test_completed_record(self):
+        data = {"title": "Codzienne", "due_date": "2030-01-01T08:00:00", "completed": True,
+                "recurrence": "daily"}
+        for lazy in (False, True):
+            task = task_from_dict(data, lazy=lazy)
+            self.assertEqual((task.due_date, task.completed), (datetime(2030, 1, 1, 8), True))
+
+    # Każdy format pliku, load_many (tabela kolumnowa) i from_records zachowują regułę
+    def test_round_trip_all_formats(self):
+        rules = [Recurrence("daily"), self.weekly.recurrence, None]
+        window = (datetime(2030, 1, 5), datetime(2030, 1, 11))
+        for ext in (".jsonl", ".dps", ".db", ".dpz"):
+            filename = "test_recurring" + ext
+            try:
+                save_tasks_to_file(self.manager.tasks, filename)
+                loaded = load_tasks_from_file(filename)
+                self.assertEqual([task.recurrence for task in loaded], rules)
+                for views in (False, True):
+                    tracker = load_many([filename], views=views)
+                    self.assertEqual([task.recurrence for task in tracker.tasks], rules)
+                    self.assertEqual(tracker.get_tasks_due_between(*window), tracker.tasks[:2])
+                if ext == ".db":
+                    with Tracker.backed(filename) as backed:
+                        self.assertEqual(backed.get_tasks_due_between(*window), backed.tasks[:2])
+            finally:
+                if os.path.exists(filename):
+                    os.remove(filename)
+        self.assertEqual(self.manager.get_tasks_due_between(*window), [self.daily, self.weekly])
+        concurrent = ConcurrentTracker(shards=2)
+        concurrent.add_tasks(self.manager.tasks)
+        self.assertEqual(concurrent.get_tasks_due_between(*window), [self.daily, self.weekly])
+        self.assertEqual(concurrent.snapshot().get_tasks_due_between(*window), [self.daily, self.weekly])
+        with ShardedTracker(workers=2) as sharded:
+            sharded.add_tasks(self.manager.tasks)
+            self.assertEqual(sharded.get_tasks_due_between(*window), [self.daily, self.weekly])
+        records = [task_to_dict(task) for task in self.manager.tasks]
+        self.assertEqual([task.recurrence for task in itemCard.from_records(records)], rules)
+
+    # Baza SQLite zapisuje zmianę reguły od razu
+    def test_sqlite_rule_change(self):
+        filename = "test_recurring.db"
+        try:
+            with Tracker.backed(filename) as backed:
+                backed.add_task(itemCard("Codzienne", due_date=datetime(2030, 1, 1, 8)))
+            with Tracker.backed(filename) as backed:
+                backed.tasks[0].recurrence = "weekly/2"
+            with Tracker.backed(filename) as backed:
+                self.assertEqual(backed.tasks[0].recurrence, Recurrence("weekly", 2))
+        finally:
+            os.remove(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from src.itemCard import itemCard
+from src.searchIndex import tokenize
+from src.tracker import Tracker
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    # Tracker z kilkoma zadaniami o polskich tytułach
+    def setUp(self):
+        self.manager = Tracker()
+        self.shopping = itemCard("Zakupy", description="mleko, chleb, masło")
+        self.call = itemCard("Zadzwonić do Łukasza", description="w sprawie zakupów")
+        self.report = itemCard("Raport kwartalny", description="Przygotować raport")
+        self.manager.add_tasks([self.shopping, self.call, self.report])
+
+    # Tokenizacja usuwa polskie znaki i wielkość liter
+    def test_tokenize_folds_diacritics(self):
+        self.assertEqual(tokenize("Łódź, ŻÓŁĆ i gęś!"), ["lodz", "zolc", "i", "ges"])
+        self.assertEqual(tokenize(None), [])
+
+    # Zapytanie bez polskich znaków znajduje tytuł z polskimi znakami
+    def test_search_without_diacritics(self):
+        self.assertEqual(self.manager.search("lukasza"), [self.call])
+        self.assertEqual(self.manager.search("MASLO"), [self.shopping])
+
+    # Ostatnie słowo zapytania działa jak prefiks, wynik jest uszeregowany (tytuł waży więcej)
+    def test_prefix_search_is_ranked(self):
+        self.assertEqual(self.manager.search("zakup"), [self.shopping, self.call])
+        self.assertEqual(self.manager.search("zakup", prefix=False), [])
+        self.assertEqual(self.manager.search("zak", limit=1), [self.shopping])
+
+    # Wszystkie słowa zapytania muszą wystąpić w zadaniu
+    def test_multi_term_query(self):
+        self.assertEqual(self.manager.search("raport kwart"), [self.report])
+        self.assertEqual(self.manager.search("raport mleko"), [])
+
+    # Indeks nadąża za dodawaniem, usuwaniem i zmianą tytułu
+    def test_index_follows_tracker(self):
+        self.manager.search("zakupy")
+        self.manager.remove_task(self.shopping)
+        self.assertEqual(self.manager.search("mleko"), [])
+        self.report.title = "Sprawozdanie"
+        self.assertEqual(self.manager.search("kwartalny"), [])
+        self.assertEqual(self.manager.search("sprawozdanie"), [self.report])
+        extra = itemCard("Mleko dla kota")
+        self.manager.add_task(extra)
+        self.assertEqual(self.manager.search("mleko"), [extra])
+        self.manager.clear_all()
+        self.assertEqual(self.manager.search("mleko"), [])
+
+    # Słowo usunięte i dodane ponownie nie jest liczone podwójnie przy wyszukiwaniu po prefiksie
+    def test_readded_word_is_not_duplicated(self):
+        self.assertEqual(self.manager.search("rap"), [self.report])
+        self.manager.remove_task(self.report)
+        self.manager.add_task(self.report)
+        index = self.manager._search_index
+        self.assertEqual(index._expand("raport"), ["raport"])
+        self.assertEqual(self.manager.search("rap"), [self.report])
+
+
+if __name__ == "__main__":
+    unittest.main()
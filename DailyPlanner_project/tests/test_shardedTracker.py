@@ -0,0 +1,83 @@
+import gc
+import unittest
+import weakref
+from datetime import datetime
+from src import clock
+from src.itemCard import itemCard
+from src.shardedTracker import ShardedTracker
+
+
+class TestShardedTracker(unittest.TestCase):
+
+    # Tracker z trzema procesami roboczymi i zadaniami z terminami
+    def setUp(self):
+        self.manager = ShardedTracker(workers=3, batch_size=4)
+        self.tasks = [itemCard(f"Zadanie {i}", due_date=datetime(2030, 1, 10 - i)) for i in range(8)]
+        self.manager.add_tasks(self.tasks)
+
+    # Zamknięcie procesów po każdym teście
+    def tearDown(self):
+        self.manager.close()
+
+    # Zapytania rozsyłane do procesów zwracają oryginalne zadania w kolejności dodania
+    def test_completed_queries_are_merged(self):
+        self.tasks[6].mark_completed()
+        self.tasks[1].mark_completed()
+        self.assertEqual(self.manager.get_completed_tasks(), [self.tasks[1], self.tasks[6]])
+        self.assertEqual(len(self.manager.get_uncompleted_tasks()), 6)
+        self.tasks[1].mark_uncompleted()
+        self.assertEqual(self.manager.get_completed_tasks(), [self.tasks[6]])
+
+    # Przeterminowane zadania z różnych procesów są scalane wg terminu
+    def test_overdue_and_due_between(self):
+        with clock.frozen_now(datetime(2030, 1, 5)):
+            self.assertEqual(self.manager.get_overdue_tasks(), [self.tasks[7], self.tasks[6]])
+        self.tasks[0].due_date = datetime(2030, 1, 3, 12)
+        self.assertEqual(self.manager.get_tasks_due_between(datetime(2030, 1, 3), datetime(2030, 1, 4)),
+                         [self.tasks[7], self.tasks[0], self.tasks[6]])
+
+    # Usuwanie i czyszczenie trafiają do właściwych procesów
+    def test_remove_and_clear(self):
+        self.manager.remove_task(self.tasks[2])
+        self.assertNotIn(self.tasks[2], self.manager)
+        self.assertEqual(len(self.manager.get_uncompleted_tasks()), 7)
+        with self.assertRaises(ValueError):
+            self.manager.remove_task(self.tasks[2])
+        self.manager.clear_all()
+        self.assertEqual(self.manager.get_uncompleted_tasks(), [])
+        self.manager.add_task(self.tasks[0])
+        self.assertEqual(self.manager.get_uncompleted_tasks(), [self.tasks[0]])
+
+    # Zadanie dodane dwa razy jest usuwane wpis po wpisie
+    def test_duplicate_entries(self):
+        self.manager.add_task(self.tasks[0])
+        self.manager.remove_task(self.tasks[0])
+        self.assertEqual(self.manager.tasks, self.tasks[1:] + [self.tasks[0]])
+        self.assertEqual(self.manager.get_uncompleted_tasks()[-1], self.tasks[0])
+
+    # Koordynator nie trzyma zadań: porzucone zadanie jest odtwarzane z procesu, a jego zmiany
+    # trafiają z powrotem do procesu
+    def test_cards_live_in_workers(self):
+        self.tasks[3].mark_completed()
+        task_id, ref = self.tasks[3].id, weakref.ref(self.tasks[3])
+        del self.tasks[3]
+        gc.collect()
+        self.assertIsNone(ref())
+        task = self.manager.get(task_id)
+        self.assertEqual((task.title, task.completed), ("Zadanie 3", True))
+        self.assertIs(self.manager.get_completed_tasks()[0], task)
+        task.mark_uncompleted()
+        self.assertEqual(self.manager.get_completed_tasks(), [])
+        self.assertEqual(len(self.manager.tasks), 8)
+        self.manager.remove_by_id(task_id)
+        self.assertEqual(self.manager.tasks, self.tasks)
+        self.assertEqual(len(self.manager), 7)
+
+    # Zły typ zadania jest odrzucany
+    def test_rejects_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.manager.add_task("nie zadanie")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+from src.itemCard import itemCard
+from src.snapshot import (save_snapshot, load_snapshot, _HEADER, _RECORD, _MAGIC_V1,
+                          _RECORD_V1, _MAGIC_V2, _RECORD_V2)
+from src.supportBox import save_tasks_to_file, load_tasks_from_file, iter_task_records
+
+
+class TestSnapshot(unittest.TestCase):
+
+    # Przygotowanie zadań i nazwy pliku migawki
+    def setUp(self):
+        self.filename = "test_tasks.dps"
+        self.tasks = [
+            itemCard("Zakupy", description="mleko, chleb, masło", due_date="2030-01-02"),
+            itemCard("Zadzwonić do Ani"),
+            itemCard("Łączność – ćwiczenie", description="Linia 1\nLinia 2"),
+        ]
+        self.tasks[1].mark_completed()
+
+    # Usunięcie pliku po teście
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    # Zapis i odczyt zachowuje wszystkie pola, także created_at i polskie znaki
+    def test_round_trip(self):
+        save_snapshot(self.tasks, self.filename)
+        with load_snapshot(self.filename) as view:
+            self.assertEqual(len(view), 3)
+            for original, loaded in zip(self.tasks, view):
+                self.assertEqual(
+                    (loaded.title, loaded.description, loaded.due_date, loaded.completed, loaded.created_at),
+                    (original.title, original.description, original.due_date, original.completed,
+                     original.created_at))
+
+    # Zadania są tworzone leniwie i zapamiętywane przy kolejnych odczytach
+    def test_lazy_access_is_cached(self):
+        save_snapshot(self.tasks, self.filename)
+        with load_snapshot(self.filename) as view:
+            self.assertIs(view[-1], view[2])
+            self.assertEqual(len(view._cache), 1)
+            self.assertTrue(view.is_completed(1))
+            self.assertFalse(view.is_completed(0))
+            with self.assertRaises(IndexError):
+                view[3]
+
+    # Pusta migawka i plik w innym formacie
+    def test_empty_and_invalid_file(self):
+        save_snapshot([], self.filename)
+        with load_snapshot(self.filename) as view:
+            self.assertEqual(list(view), [])
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write("[]")
+        with self.assertRaises(ValueError):
+            load_snapshot(self.filename)
+
+    # supportBox wybiera format migawki po rozszerzeniu pliku i zwraca listę (plik jest zamknięty)
+    def test_support_box_picks_format_by_extension(self):
+        save_tasks_to_file(self.tasks, self.filename)
+        open_files = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+        loaded = load_tasks_from_file(self.filename)
+        self.assertIsInstance(loaded, list)
+        self.assertEqual([t.title for t in loaded], [t.title for t in self.tasks])
+        if open_files is not None:
+            self.assertEqual(len(os.listdir("/proc/self/fd")), open_files)
+        self.assertEqual([r["completed"] for r in iter_task_records(self.filename)], [False, True, False])
+
+    # Migawka zachowuje identyfikatory; starszy format (bez identyfikatorów) nadal się wczytuje
+    def test_ids_and_version_1(self):
+        save_snapshot(self.tasks, self.filename)
+        with load_snapshot(self.filename) as view:
+            self.assertEqual([t.id for t in view], [t.id for t in self.tasks])
+        with open(self.filename, "r+b") as f:
+            data = f.read()
+            magic, count, heap = _HEADER.unpack_from(data)
+            records = [_RECORD.unpack_from(data, _HEADER.size + i * _RECORD.size) for i in range(count)]
+            f.seek(0)
+            f.truncate()
+            f.write(_HEADER.pack(_MAGIC_V1, count, _HEADER.size + count * _RECORD_V1.size))
+            for fields in records:
+                f.write(_RECORD_V1.pack(*fields[:5], fields[6]))
+            f.write(data[heap:])
+        with load_snapshot(self.filename) as view:
+            self.assertEqual([t.title for t in view], [t.title for t in self.tasks])
+            self.assertTrue(view.is_completed(1))
+            self.assertNotIn(view[0].id, {t.id for t in self.tasks})
+
+    # Reguła powtarzania jest na stercie; wersja 2 (bez reguł) nadal się wczytuje
+    def test_recurrence_and_version_2(self):
+        self.tasks[0].recurrence = "weekly/2"
+        save_snapshot(self.tasks, self.filename)
+        with load_snapshot(self.filename) as view:
+            self.assertEqual([str(t.recurrence) for t in view], ["weekly/2", "None", "None"])
+            self.assertEqual(view[1].title, "Zadzwonić do Ani")
+        self.tasks[0].recurrence = None
+        save_snapshot(self.tasks, self.filename)
+        with open(self.filename, "r+b") as f:
+            data = f.read()
+            magic, count, heap = _HEADER.unpack_from(data)
+            records = [_RECORD.unpack_from(data, _HEADER.size + i * _RECORD.size) for i in range(count)]
+            f.seek(0)
+            f.truncate()
+            f.write(_HEADER.pack(_MAGIC_V2, count, _HEADER.size + count * _RECORD_V2.size))
+            for fields in records:
+                f.write(_RECORD_V2.pack(*fields[:7]))
+            f.write(data[heap:])
+        with load_snapshot(self.filename) as view:
+            self.assertEqual([t.id for t in view], [t.id for t in self.tasks])
+            self.assertTrue(view.is_completed(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
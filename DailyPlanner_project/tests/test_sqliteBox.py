@@ -0,0 +1,128 @@
+import gc
+import os
+import sqlite3
+import unittest
+from datetime import datetime
+from src import clock
+from src.itemCard import itemCard
+from src.supportBox import save_tasks_to_file, load_tasks_from_file
+from src.tracker import Tracker
+
+
+class TestSQLiteTracker(unittest.TestCase):
+
+    # Baza z czterema zadaniami (dwa z terminem, jedno wykonane)
+    def setUp(self):
+        self.filename = "test_tasks.db"
+        self.manager = Tracker.backed(self.filename, batch_size=2)
+        with clock.frozen_now(datetime(2030, 1, 1)):
+            self.tasks = [
+                itemCard("Zadanie A", due_date="2030-01-05"),
+                itemCard("Zadanie B", description="opis"),
+                itemCard("Zadanie C", due_date="2030-01-03"),
+                itemCard("Zadanie D"),
+            ]
+        self.tasks[1].mark_completed()
+        self.manager.add_tasks(self.tasks)
+
+    # Zamknięcie bazy i usunięcie pliku po teście
+    def tearDown(self):
+        self.manager.close()
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    # Filtry zwracają te same obiekty, które dodano, w porządku jak Tracker
+    def test_filters(self):
+        self.assertEqual(self.manager.tasks, self.tasks)
+        self.assertEqual(self.manager.get_completed_tasks(), [self.tasks[1]])
+        self.assertEqual(self.manager.get_uncompleted_tasks(), [self.tasks[0], self.tasks[2], self.tasks[3]])
+        with clock.frozen_now(datetime(2030, 1, 4)):
+            self.assertEqual(self.manager.get_overdue_tasks(), [self.tasks[2]])
+            self.assertEqual(self.manager.get_tasks_due_within(48), [self.tasks[0]])
+            self.assertEqual(self.manager.stats(), {
+                "total": 4, "completed": 1, "uncompleted": 3, "overdue": 1, "completion_rate": 0.25,
+            })
+
+    # Zmiany zadań trafiają do bazy i są widoczne po ponownym otwarciu
+    def test_changes_survive_reopen(self):
+        self.tasks[0].mark_completed()
+        self.tasks[3].title = "Nowy tytuł"
+        self.manager.remove_task(self.tasks[2])
+        self.manager.close()
+        ids = [task.id for task in self.tasks]
+        with Tracker.backed(self.filename) as reopened:
+            self.assertEqual([task.id for task in reopened], [ids[0], ids[1], ids[3]])
+            self.assertEqual(reopened.count_completed(), 2)
+            task = reopened.get(ids[3])
+            self.assertEqual(task.title, "Nowy tytuł")
+            self.assertIs(reopened.get(ids[3]), task)
+            self.assertEqual(task.created_at, datetime(2030, 1, 1))
+            task.due_date = datetime(2030, 2, 1)
+            reopened.commit()
+        self.assertEqual(load_tasks_from_file(self.filename)[2].due_date, datetime(2030, 2, 1))
+
+    # Zadania nieużywane nie są trzymane w pamięci; wczytane ponownie śledzą zmiany
+    def test_identity_map_is_weak(self):
+        task_id = self.tasks[3].id
+        del self.tasks
+        gc.collect()
+        task = self.manager.get(task_id)
+        task.mark_completed()
+        self.assertEqual(self.manager.count_completed(), 2)
+        self.assertIn(task, self.manager)
+        self.manager.remove_by_id(task_id)
+        self.assertNotIn(task, self.manager)
+        self.assertIsNone(self.manager.get(task_id))
+
+    # Inne zadanie o tym samym identyfikatorze jest odrzucane, to samo można dodać ponownie
+    def test_duplicate_ids(self):
+        copy = itemCard("Kopia")
+        copy._id = self.tasks[0].id
+        with self.assertRaises(ValueError):
+            self.manager.add_task(copy)
+        self.manager.add_task(self.tasks[0])
+        self.assertEqual(len(self.manager), 5)
+        self.manager.remove_task(self.tasks[0])
+        self.assertEqual(self.manager.tasks[-1], self.tasks[0])
+        with self.assertRaises(TypeError):
+            self.manager.add_task("nie zadanie")
+
+    # Stronicowanie jak Tracker.query, ale w SQL
+    def test_query_pages(self):
+        page = self.manager.query(order_by="due", limit=1)
+        self.assertEqual(page.tasks, [self.tasks[2]])
+        self.assertEqual(self.manager.query(order_by="due", cursor=page.cursor).tasks, [self.tasks[0]])
+        self.assertEqual(self.manager.query(completed=False, descending=True, limit=2).tasks,
+                         [self.tasks[3], self.tasks[2]])
+        with self.assertRaises(ValueError):
+            self.manager.query(order_by="created", cursor=page.cursor)
+
+    # Baza jest też formatem pliku supportBox (.db)
+    def test_supportbox_format(self):
+        self.manager.close()
+        save_tasks_to_file(self.tasks[:2], self.filename)
+        loaded = load_tasks_from_file(self.filename)
+        self.assertEqual([task.id for task in loaded], [self.tasks[0].id, self.tasks[1].id])
+        self.assertEqual(loaded[0].due_date, datetime(2030, 1, 5))
+        self.assertTrue(loaded[1].completed)
+        with self.assertRaises(FileNotFoundError):
+            load_tasks_from_file("brak_pliku.db")
+
+    # Baza bez kolumny reguły powtarzania (starszy schemat) dostaje ją przy otwarciu
+    def test_old_schema(self):
+        self.manager.close()
+        conn = sqlite3.connect(self.filename)
+        conn.execute("DROP TABLE tasks")
+        conn.execute("CREATE TABLE tasks (key INTEGER PRIMARY KEY, id INTEGER NOT NULL, title TEXT NOT NULL, "
+                     "description TEXT NOT NULL, due_date INTEGER, completed INTEGER NOT NULL, "
+                     "created_at INTEGER NOT NULL)")
+        conn.execute("INSERT INTO tasks VALUES (1, 7, 'Stare', '', NULL, 0, 0)")
+        conn.commit()
+        conn.close()
+        self.assertEqual([task.title for task in load_tasks_from_file(self.filename)], ["Stare"])
+        self.manager = Tracker.backed(self.filename)
+        self.assertIsNone(self.manager.get(7).recurrence)
+
+
+if __name__ == "__main__":
+    unittest.main()
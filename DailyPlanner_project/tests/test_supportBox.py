@@ -66,6 +66,22 @@ class TestTaskManager(unittest.TestCase):
         self.manager.clear_all()
         self.assertEqual(len(self.manager.tasks), 0)
 
+    # Dodanie i usunięcie przez listę tasks zmienia tracker; inne zmiany kopii zgłaszają błąd
+    def test_tasks_list_mutations(self):
+        self.manager.tasks.append(self.task1)
+        self.manager.tasks.extend([self.task2, self.task1])
+        self.assertEqual(self.manager.tasks, [self.task1, self.task2, self.task1])
+        tasks = self.manager.tasks
+        tasks.remove(self.task1)
+        self.assertEqual(tasks, [self.task2, self.task1])
+        self.assertEqual(self.manager.tasks, [self.task2, self.task1])
+        for change in (lambda: tasks.insert(0, self.task1), lambda: tasks.pop(),
+                       lambda: tasks.__setitem__(0, self.task1), lambda: tasks.__delitem__(0)):
+            with self.assertRaises(TypeError):
+                change()
+        self.manager.tasks.clear()
+        self.assertEqual(len(self.manager), 0)
+
     # Test dodania wielu zadań do listy
     def test_add_multiple_tasks(self):
         tasks = [itemCard(f"Task {i}") for i in range(10)]
@@ -92,6 +108,123 @@ class TestTaskManager(unittest.TestCase):
         self.manager.clear_all()  # ponownie, nie powinien wystąpić błąd
         self.assertEqual(len(self.manager.tasks), 0)
 
+    # Zmiana statusu zadania już dodanego do trackera aktualizuje podział wykonane/niewykonane
+    def test_status_change_updates_partitions(self):
+        self.manager.add_task(self.task1)
+        self.task1.mark_completed()
+        self.assertIn(self.task1, self.manager.get_completed_tasks())
+        self.assertNotIn(self.task1, self.manager.get_uncompleted_tasks())
+        self.task1.mark_uncompleted()
+        self.assertEqual(self.manager.get_completed_tasks(), [])
+
+    # Filtry zachowują kolejność dodania także po zmianach statusu
+    def test_partitions_keep_insertion_order(self):
+        tasks = [itemCard(f"Task {i}") for i in range(5)]
+        for task in tasks:
+            self.manager.add_task(task)
+        tasks[3].mark_completed()
+        tasks[1].mark_completed()
+        self.assertEqual(self.manager.get_completed_tasks(), [tasks[1], tasks[3]])
+        self.assertEqual(self.manager.get_uncompleted_tasks(), [tasks[0], tasks[2], tasks[4]])
+
+    # Usunięcie duplikatu zostawia drugi wpis, a zadanie nadal jest śledzone
+    def test_remove_duplicate_keeps_other_entry(self):
+        self.manager.add_task(self.task1)
+        self.manager.add_task(self.task1)
+        self.manager.remove_task(self.task1)
+        self.assertEqual(self.manager.tasks, [self.task1])
+        self.task1.mark_completed()
+        self.assertEqual(self.manager.get_completed_tasks(), [self.task1])
+
+    # Usunięte zadanie nie wpływa już na tracker po zmianie statusu
+    def test_removed_task_is_detached(self):
+        self.manager.add_task(self.task1)
+        self.manager.remove_task(self.task1)
+        self.task1.mark_completed()
+        self.assertEqual(self.manager.get_completed_tasks(), [])
+        self.assertNotIn(self.task1, self.manager)
+
+    # Zadania przeterminowane są zwracane w kolejności terminów
+    def test_overdue_sorted_by_due_date(self):
+        older = itemCard("Starsze", due_date=datetime.now() - timedelta(days=5))
+        self.manager.add_task(self.task2)
+        self.manager.add_task(older)
+        self.assertEqual(self.manager.get_overdue_tasks(), [older, self.task2])
+
+    # Zmiana terminu zadania w trackerze aktualizuje indeks terminów
+    def test_due_date_change_updates_index(self):
+        self.manager.add_task(self.task2)
+        self.task2.due_date = datetime.now() + timedelta(hours=2)
+        self.assertEqual(self.manager.get_overdue_tasks(), [])
+        self.assertEqual(self.manager.get_tasks_due_within(3), [self.task2])
+        self.task2.due_date = None
+        self.assertEqual(self.manager.get_tasks_due_within(3), [])
+
+    # Termin podany jako tekst jest parsowany przed aktualizacją indeksu; błędny nie zmienia zadania
+    def test_due_date_change_from_text(self):
+        self.manager.add_tasks([self.task1, self.task2])
+        self.task1.due_date = "2030-01-02"
+        self.assertEqual(self.task1.due_date, datetime(2030, 1, 2))
+        self.assertEqual(self.manager.get_tasks_due_between(datetime(2030, 1, 1), datetime(2030, 1, 3)),
+                         [self.task1])
+        with self.assertRaises(ValueError):
+            self.task1.due_date = "jutro"
+        self.assertEqual(self.task1.due_date, datetime(2030, 1, 2))
+
+    # Zadania z terminem w zadanym przedziale (granice włącznie)
+    def test_get_tasks_due_between(self):
+        start = datetime(2030, 1, 1)
+        inside = itemCard("W środku", due_date=start + timedelta(days=1))
+        edge = itemCard("Na granicy", due_date=start + timedelta(days=2))
+        outside = itemCard("Poza", due_date=start + timedelta(days=3))
+        for task in (outside, edge, inside, self.task1):
+            self.manager.add_task(task)
+        result = self.manager.get_tasks_due_between(start, start + timedelta(days=2))
+        self.assertEqual(result, [inside, edge])
+
+    # Dodanie partii zadań aktualizuje wszystkie indeksy
+    def test_add_tasks_batch(self):
+        self.manager.add_task(self.task2)
+        self.manager.add_tasks([self.task1, self.task3, self.task2])
+        self.assertEqual(self.manager.tasks, [self.task2, self.task1, self.task3, self.task2])
+        self.assertEqual(self.manager.get_completed_tasks(), [self.task3])
+        self.assertEqual(self.manager.get_overdue_tasks(), [self.task2, self.task2])
+
+    # Niepoprawny element partii powoduje błąd, zanim cokolwiek zostanie dodane
+    def test_add_tasks_rejects_invalid_batch(self):
+        with self.assertRaises(TypeError):
+            self.manager.add_tasks([self.task1, "Nie jestem zadaniem"])
+        self.assertEqual(len(self.manager.tasks), 0)
+
+    # Wyszukiwanie i usuwanie po identyfikatorze
+    def test_get_and_remove_by_id(self):
+        self.manager.add_tasks([self.task1, self.task2])
+        self.assertIs(self.manager.get(self.task2.id), self.task2)
+        self.assertIsNone(self.manager.get(-1))
+        self.manager.remove_by_id(self.task1.id)
+        self.assertEqual(self.manager.tasks, [self.task2])
+        self.assertIsNone(self.manager.get(self.task1.id))
+        with self.assertRaises(ValueError):
+            self.manager.remove_by_id(self.task1.id)
+
+    # Inne zadanie z tym samym identyfikatorem nie może trafić do trackera
+    def test_duplicate_id_is_rejected(self):
+        self.manager.add_task(self.task1)
+        copy = itemCard._from_fields("Kopia", "", None, False, self.task1.created_at, self.task1.id)
+        with self.assertRaises(ValueError):
+            self.manager.add_task(copy)
+        with self.assertRaises(ValueError):
+            self.manager.add_tasks([self.task2, copy])
+        self.assertEqual(self.manager.tasks, [self.task1])
+
+    # Łączenie po identyfikatorze: nowe zadania są dodawane, istniejące aktualizowane
+    def test_merge_by_id(self):
+        self.manager.add_tasks([self.task1, self.task2])
+        newer = itemCard._from_fields("Nowy tytuł", "", None, True, self.task1.created_at, self.task1.id)
+        self.assertEqual(self.manager.merge([newer, self.task3, self.task2]), 1)
+        self.assertEqual(self.manager.tasks, [self.task1, self.task2, self.task3])
+        self.assertEqual(self.task1.title, "Nowy tytuł")
+        self.assertEqual(self.manager.get_completed_tasks(), [self.task1, self.task3])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+import os
+import unittest
+from src.itemCard import itemCard
+from src.supportBox import save_tasks_to_file, load_tasks_from_file, task_to_dict
+from src.taskArchive import ArchiveReader, write_archive, zstd
+
+
+class TestTaskArchive(unittest.TestCase):
+
+    # Rekordy dziesięciu zadań (kilka bloków po trzy rekordy)
+    def setUp(self):
+        self.filename = "test_tasks.dpz"
+        self.tasks = [itemCard(f"Zadanie {i}", description="Linia 1\nLinia 2", due_date="2030-01-02")
+                      for i in range(10)]
+        self.records = [task_to_dict(task) for task in self.tasks]
+
+    # Usunięcie pliku po teście
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    # Bloki zapisane i czytane równolegle dają te same rekordy w tej samej kolejności
+    def test_round_trip_in_blocks(self):
+        write_archive(self.records, self.filename, block_size=3, workers=2)
+        with ArchiveReader(self.filename, workers=2) as reader:
+            self.assertEqual(len(reader), 10)
+            self.assertEqual(reader.block_count, 4)
+            self.assertEqual(list(reader), self.records)
+            self.assertEqual(reader.read_block(3), self.records[9:])
+
+    # Odczyt od dowolnego rekordu nie wymaga wcześniejszych bloków
+    def test_seek(self):
+        write_archive(self.records, self.filename, block_size=3)
+        with ArchiveReader(self.filename) as reader:
+            self.assertEqual(list(reader.iter_records(4)), self.records[4:])
+            self.assertEqual(list(reader.iter_records(9)), self.records[9:])
+            self.assertEqual(list(reader.iter_records(10)), [])
+
+    # Archiwum jest formatem pliku supportBox (.dpz), także dla pustej listy
+    def test_supportbox_format(self):
+        save_tasks_to_file(self.tasks, self.filename)
+        loaded = load_tasks_from_file(self.filename, lazy=True)
+        self.assertEqual([task.id for task in loaded], [task.id for task in self.tasks])
+        self.assertEqual(loaded[0].description, "Linia 1\nLinia 2")
+        save_tasks_to_file([], self.filename)
+        self.assertEqual(load_tasks_from_file(self.filename), [])
+
+    # Błędny kodek albo plik, który nie jest archiwum, zgłasza ValueError
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            write_archive(self.records, self.filename, codec="lzma")
+        with open(self.filename, "wb") as f:
+            f.write(b"[]")
+        with self.assertRaises(ValueError):
+            ArchiveReader(self.filename)
+
+    # Kodek zstd (jeśli jest zainstalowany)
+    @unittest.skipIf(zstd is None, "zstd is not installed")
+    def test_zstd(self):
+        write_archive(self.records, self.filename, codec="zstd", block_size=4)
+        with ArchiveReader(self.filename) as reader:
+            self.assertEqual(list(reader), self.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
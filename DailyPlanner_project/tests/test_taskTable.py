@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+from src.itemCard import itemCard
+from src.taskTable import TaskTable, TaskRow, to_micros, from_micros, NO_DATE
+from src.tracker import Tracker
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestTaskTable(unittest.TestCase):
+
+    # Przygotowanie tabeli z dwoma zadaniami
+    def setUp(self):
+        self.table = TaskTable()
+        self.table.append("  Zakupy ", "mleko", due_date="2030-01-02")
+        self.table.append("Sprzątanie", completed=True)
+
+    # Konwersja dat na mikrosekundy jest dokładna w obie strony
+    def test_micros_round_trip(self):
+        date = datetime(2025, 5, 17, 14, 30, 15, 123456)
+        self.assertEqual(from_micros(to_micros(date)), date)
+        self.assertEqual(to_micros(None), NO_DATE)
+        self.assertIsNone(from_micros(NO_DATE))
+
+    # Żywy widok as_numpy blokuje dodawanie wierszy; po zwolnieniu widoku append działa
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_view_blocks_append(self):
+        columns = self.table.as_numpy()
+        with self.assertRaises(BufferError):
+            self.table.append("Nowe")
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(len(self.table.ids), 2)
+        del columns
+        self.table.append("Nowe")
+        self.assertEqual(len(self.table), 3)
+
+    # Widok wiersza zachowuje się jak itemCard
+    def test_row_view_attributes(self):
+        row = self.table[0]
+        self.assertIsInstance(row, itemCard)
+        self.assertEqual(row.title, "Zakupy")
+        self.assertEqual(row.description, "mleko")
+        self.assertEqual(row.due_date, datetime(2030, 1, 2))
+        self.assertFalse(row.completed)
+        self.assertIsInstance(row.created_at, datetime)
+        self.assertIn("✓", str(self.table[1]))
+
+    # Tabela stosuje tę samą walidację tytułu co itemCard
+    def test_append_rejects_empty_title(self):
+        with self.assertRaises(ValueError):
+            self.table.append("   ")
+
+    # Zmiana przez widok zapisuje się w kolumnach tabeli
+    def test_row_view_writes_back(self):
+        self.table[0].mark_completed()
+        self.assertEqual(self.table.completed[0], 1)
+        self.table[0].due_date = None
+        self.assertEqual(self.table.due[0], NO_DATE)
+
+    # Tabela zbudowana z istniejących zadań zachowuje ich dane
+    def test_from_tasks(self):
+        task = itemCard("Zadanie", due_date="2030-03-04")
+        task.mark_completed()
+        row = TaskTable.from_tasks([task])[0]
+        self.assertEqual((row.title, row.due_date, row.completed, row.created_at),
+                         (task.title, task.due_date, task.completed, task.created_at))
+
+    # Widoki wierszy można trzymać w trackerze, a zmiana statusu z innego widoku jest widoczna
+    def test_rows_in_tracker(self):
+        manager = Tracker()
+        for row in self.table:
+            manager.add_task(row)
+        TaskRow(self.table, 0).mark_completed()
+        self.assertEqual(manager.get_completed_tasks(), [self.table[0], self.table[1]])
+        manager.remove_task(self.table[1])
+        self.assertEqual(len(manager), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 import unittest
 import os
+import json
 from datetime import datetime, timedelta
 from src.itemCard import itemCard
-from src.supportBox import save_tasks_to_file, load_tasks_from_file
+from src.supportBox import (save_tasks_to_file, load_tasks_from_file, iter_tasks_from_file,
+                            iter_task_records, task_to_dict, load_many, merge_tasks)
+from src.taskTable import TaskRow
+from src.tracker import Tracker
 
 
 class TestTracker(unittest.TestCase):
@@ -16,11 +20,13 @@ class TestTracker(unittest.TestCase):
         )
         self.task.mark_completed()
         self.filename = "test_tasks.json"
+        self.jsonl_filename = "test_tasks.jsonl"
 
-    # Usunięcie pliku testowego po każdym teście (żeby nie zostawał na dysku)
+    # Usunięcie plików testowych po każdym teście (żeby nie zostawały na dysku)
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        for filename in (self.filename, self.jsonl_filename):
+            if os.path.exists(filename):
+                os.remove(filename)
 
     # Test zapisu pojedynczego zadania do pliku i jego poprawnego odczytu
     def test_save_and_load_tasks(self):
@@ -51,6 +57,117 @@ class TestTracker(unittest.TestCase):
         loaded = load_tasks_from_file(self.filename)
         self.assertEqual(loaded, [])
 
+    # Strumieniowy zapis JSON daje ten sam plik co json.dump z wcięciem 2
+    def test_streamed_json_matches_json_dump(self):
+        tasks = [self.task, itemCard("Task B", description="Linia 1\nLinia 2")]
+        save_tasks_to_file(tasks, self.filename)
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(f.read(), json.dumps([task_to_dict(t) for t in tasks], indent=2))
+
+    # Zapis i odczyt w formacie JSON Lines (wybranym po rozszerzeniu pliku)
+    def test_save_and_load_jsonl(self):
+        save_tasks_to_file((itemCard(f"Task {i}") for i in range(5)), self.jsonl_filename)
+        with open(self.jsonl_filename, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+        loaded = load_tasks_from_file(self.jsonl_filename)
+        self.assertEqual([t.title for t in loaded], [f"Task {i}" for i in range(5)])
+
+    # Generator zwraca zadania po kolei, zamiast budować całą listę
+    def test_iter_tasks_from_file(self):
+        tasks = [itemCard(f"Task {i}", description="ą" * 50) for i in range(20)]
+        tasks[3].mark_completed()
+        save_tasks_to_file(tasks, self.filename)
+        loaded = iter_tasks_from_file(self.filename)
+        self.assertNotIsInstance(loaded, list)
+        self.assertEqual([t.completed for t in loaded], [t.completed for t in tasks])
+
+    # Agregacja na surowych rekordach bez tworzenia obiektów itemCard
+    def test_iter_task_records_aggregation(self):
+        tasks = [itemCard("Task A"), itemCard("Task B"), itemCard("Task C")]
+        tasks[0].mark_completed()
+        save_tasks_to_file(tasks, self.jsonl_filename)
+        self.assertEqual(sum(r["completed"] for r in iter_task_records(self.jsonl_filename)), 1)
+
+    # Równoległe wczytanie kilku plików łączy je w jeden tracker w kolejności plików
+    def test_load_many_parallel(self):
+        save_tasks_to_file([self.task, itemCard("Task B")], self.filename)
+        save_tasks_to_file([itemCard("Task C", due_date="2020-01-01")], self.jsonl_filename)
+        tracker = load_many([self.filename, self.jsonl_filename], workers=2)
+        self.assertEqual([t.title for t in tracker.tasks], ["Testowe zadanie", "Task B", "Task C"])
+        self.assertEqual(tracker.get_completed_tasks()[0].created_at, self.task.created_at)
+        self.assertEqual([t.title for t in tracker.get_overdue_tasks()], ["Task C"])
+
+    # Tryb widoków przechowuje w trackerze wiersze wspólnej tabeli
+    def test_load_many_views(self):
+        save_tasks_to_file([self.task], self.filename)
+        tracker = load_many([self.filename], views=True)
+        self.assertIsInstance(tracker.tasks[0], TaskRow)
+        self.assertEqual(tracker.get_completed_tasks(), tracker.tasks)
+
+    # Zadanie zapisane dwa razy i zadanie obecne w dwóch shardach to wpisy jednego zadania
+    def test_load_many_duplicated_ids(self):
+        other = itemCard("Task B")
+        save_tasks_to_file([self.task, other, self.task], self.filename)
+        save_tasks_to_file([other, itemCard("Task C")], self.jsonl_filename)
+        for views in (False, True):
+            tracker = load_many([self.filename, self.jsonl_filename], workers=2, views=views)
+            tasks = tracker.tasks
+            self.assertEqual([t.title for t in tasks],
+                             ["Testowe zadanie", "Task B", "Testowe zadanie", "Task B", "Task C"])
+            self.assertIs(tracker.get(self.task.id), tasks[0])
+            self.assertEqual(tasks[2], tasks[0])
+            self.assertEqual(tasks[3], tasks[1])
+            self.assertEqual(len(tracker.get_completed_tasks()), 2)
+
+    # Leniwe wczytywanie: filtrowanie po statusie nie parsuje dat, termin jest parsowany przy odczycie
+    def test_lazy_load(self):
+        save_tasks_to_file([self.task, itemCard("Task B", due_date="2020-01-01")], self.filename)
+        loaded = load_tasks_from_file(self.filename, lazy=True)
+        self.assertEqual([t.title for t in loaded if t.completed], ["Testowe zadanie"])
+        self.assertIsInstance(loaded[1]._due_date, str)
+        self.assertEqual(loaded[1].due_date, datetime(2020, 1, 1))
+        self.assertTrue(loaded[1].is_overdue())
+        self.assertEqual(loaded[0].created_at, self.task.created_at)
+
+    # Błędna data w trybie leniwym zgłasza błąd dopiero przy odczycie terminu
+    def test_lazy_load_invalid_date(self):
+        with open(self.jsonl_filename, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"title": "Task A", "due_date": "jutro", "completed": False}) + "\n")
+        task = next(iter_tasks_from_file(self.jsonl_filename, lazy=True))
+        self.assertFalse(task.completed)
+        with self.assertRaises(ValueError):
+            task.due_date
+
+    # Identyfikator i data utworzenia przetrwają zapis i odczyt, więc zadanie da się odnaleźć w trackerze
+    def test_id_and_created_at_survive_reload(self):
+        save_tasks_to_file([self.task], self.filename)
+        for lazy in (False, True):
+            loaded = load_tasks_from_file(self.filename, lazy=lazy)[0]
+            self.assertEqual(loaded.id, self.task.id)
+            self.assertEqual(loaded.created_at, self.task.created_at)
+
+    # Zadanie zapisane dwa razy (ten sam obiekt w trackerze) wczytuje się jako jedna karta
+    def test_duplicated_task_reloads_into_tracker(self):
+        other = itemCard("Task B")
+        for filename in (self.filename, "test_tasks.dps"):
+            save_tasks_to_file([self.task, other, self.task], filename)
+            loaded = load_tasks_from_file(filename)
+            self.assertIs(loaded[0], loaded[2])
+            tracker = Tracker()
+            tracker.add_tasks(loaded)
+            self.assertEqual(len(tracker.get_completed_tasks()), 2)
+        os.remove("test_tasks.dps")
+
+    # Łączenie dwóch plików po identyfikatorze – późniejsza wersja wygrywa, bez powtórzeń
+    def test_merge_task_files(self):
+        other = itemCard("Task B")
+        save_tasks_to_file([self.task, other], self.filename)
+        self.task.title = "Zmieniony tytuł"
+        save_tasks_to_file([self.task], self.jsonl_filename)
+        merged = merge_tasks(load_tasks_from_file(self.filename), load_tasks_from_file(self.jsonl_filename))
+        self.assertEqual([t.title for t in merged], ["Zmieniony tytuł", "Task B"])
+        self.assertEqual([t.id for t in merged], [self.task.id, other.id])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from datetime import date, datetime
+from src import clock
+from src.itemCard import itemCard
+from src.tracker import Tracker
+
+
+class TestTrackerStats(unittest.TestCase):
+
+    # Tracker z zadaniami utworzonymi w dwóch różnych dniach
+    def setUp(self):
+        self.manager = Tracker()
+        with clock.frozen_now(datetime(2030, 1, 1, 9)):
+            self.first = [itemCard("Zadanie A", due_date="2030-01-05"), itemCard("Zadanie B")]
+        with clock.frozen_now(datetime(2030, 1, 2, 9)):
+            self.second = [itemCard("Zadanie C", due_date="2030-01-10")]
+        self.manager.add_tasks(self.first + self.second)
+
+    # Liczniki zgadzają się z długością list zwracanych przez get_*
+    def test_counts_match_lists(self):
+        self.first[1].mark_completed()
+        with clock.frozen_now(datetime(2030, 1, 7)):
+            self.assertEqual(self.manager.stats(), {
+                "total": 3, "completed": 1, "uncompleted": 2, "overdue": 1,
+                "completion_rate": 1 / 3,
+            })
+            self.assertEqual(self.manager.count_overdue(), len(self.manager.get_overdue_tasks()))
+        self.assertEqual(Tracker().completion_rate(), 0.0)
+
+    # Liczniki dni nadążają za dodawaniem, usuwaniem i czyszczeniem
+    def test_created_per_day(self):
+        self.assertEqual(self.manager.created_per_day(), {date(2030, 1, 1): 2, date(2030, 1, 2): 1})
+        self.manager.remove_task(self.second[0])
+        self.manager.add_task(self.first[0])
+        self.assertEqual(self.manager.created_per_day(), {date(2030, 1, 1): 3})
+        self.manager.clear_all()
+        self.assertEqual(self.manager.created_per_day(), {})
+
+    # Zmiana daty utworzenia przenosi zadanie do innego dnia
+    def test_created_at_change(self):
+        self.manager.created_per_day()
+        self.first[1].created_at = datetime(2030, 1, 2, 18)
+        self.assertEqual(self.manager.created_per_day(), {date(2030, 1, 1): 1, date(2030, 1, 2): 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
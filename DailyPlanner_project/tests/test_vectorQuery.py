@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timedelta
+from src.itemCard import itemCard
+from src.tracker import Tracker
+from src.vectorQuery import VectorIndex, np
+
+
+class TestVectorIndex(unittest.TestCase):
+    use_numpy = False
+
+    # Tracker z trzema zadaniami: przeterminowanym, wykonanym i zwykłym
+    def setUp(self):
+        self.manager = Tracker()
+        self.overdue = itemCard("Zaległe", due_date=datetime.now() - timedelta(days=1))
+        self.done = itemCard("Zrobione")
+        self.done.mark_completed()
+        self.plain = itemCard("Zwykłe", due_date=datetime.now() + timedelta(days=1))
+        for task in (self.overdue, self.done, self.plain):
+            self.manager.add_task(task)
+        self.index = VectorIndex(self.manager, use_numpy=self.use_numpy)
+
+    # Indeks podłączony do trackera widzi zadania dodane wcześniej
+    def test_filters_match_tracker(self):
+        self.assertEqual(self.index.get_completed_tasks(), [self.done])
+        self.assertCountEqual(self.index.get_uncompleted_tasks(), [self.overdue, self.plain])
+        self.assertEqual(self.index.get_overdue_tasks(), [self.overdue])
+
+    # Liczniki i odsetek wykonanych zadań
+    def test_counts_and_ratio(self):
+        self.assertEqual(self.index.count_overdue(), 1)
+        self.assertEqual(self.index.count_completed(), 1)
+        self.assertAlmostEqual(self.index.completion_ratio(), 1 / 3)
+        self.assertEqual(self.index.count_overdue(datetime.now() + timedelta(days=2)), 2)
+
+    # Zmiany statusu, terminu i usunięcia są przenoszone do kolumn
+    def test_updates_follow_tracker(self):
+        self.plain.mark_completed()
+        self.plain.due_date = datetime.now() - timedelta(hours=1)
+        self.manager.remove_task(self.overdue)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.get_overdue_tasks(), [self.plain])
+        self.assertEqual(self.index.completion_ratio(), 1.0)
+        self.manager.clear_all()
+        self.assertEqual(self.index.count_completed(), 0)
+        self.assertEqual(self.index.completion_ratio(), 0.0)
+
+    # Histogram zadań utworzonych w poszczególnych dniach
+    def test_created_per_day(self):
+        self.done.created_at = datetime(2025, 5, 17, 12)
+        fresh = Tracker()
+        fresh.add_task(self.done)
+        fresh.add_task(itemCard("Dzisiejsze"))
+        histogram = VectorIndex(fresh, use_numpy=self.use_numpy).created_per_day()
+        self.assertEqual(histogram[datetime(2025, 5, 17).date()], 1)
+        self.assertEqual(histogram[datetime.now().date()], 1)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorIndexNumpy(TestVectorIndex):
+    use_numpy = True
+
+
+if __name__ == "__main__":
+    unittest.main()